@@ -33,9 +33,20 @@ The program requires a python version superior or equal to 3.11 .
 """
 
 import os
+import sys
+import time
 import argparse
 
 from src import IOManager
+from src.io_manager import DEFAULT_EXCLUDED_DIRS
+from src.manifest import BuildManifest
+from src.parse_cache import CACHE_DIR_VARIABLE, DEFAULT_CACHE_SIZE, ParseCache
+from src.pipeline import DEFAULT_MAX_IN_FLIGHT, DocumentationPipeline
+from src.memory_profiler import MemoryProfiler
+from src.metrics import RunMetrics
+from src.profiler import DEFAULT_SLOWEST, Profiler, set_profiler
+from src.server import DocServer
+from src.watcher import HeaderWatcher
 
 # ---------------------------------------------------------------------------
 
@@ -54,6 +65,212 @@ def set_program_options(args_parser: argparse.ArgumentParser) -> None:
                              help="The root directory path that contains the c++ codes")
     args_parser.add_argument("-o", "--output", type=str, default=os.path.dirname(__file__),
                              help="The output directory path that will contain all generated documentation")
+    args_parser.add_argument("-e", "--exclude", type=str, action="append", default=None,
+                             help="A directory name (shell pattern) to skip while searching the headers, "
+                                  f"can be repeated (default: {', '.join(DEFAULT_EXCLUDED_DIRS)})")
+    args_parser.add_argument("-j", "--jobs", type=int, default=1,
+                             help="The number of processes that parse the headers in parallel (0 to use all cores)")
+    args_parser.add_argument("-w", "--writers", type=int, default=4,
+                             help="The number of threads that write the documentation files (0 to write them inline)")
+    args_parser.add_argument("-m", "--max-in-flight", type=int, default=DEFAULT_MAX_IN_FLIGHT,
+                             help="The maximum number of headers parsed ahead of the writers and of pages waiting "
+                                  "to be written, caps the memory used by the in-flight work "
+                                  f"(default: {DEFAULT_MAX_IN_FLIGHT})")
+    args_parser.add_argument("-f", "--force", action="store_true",
+                             help="Rebuild the documentation of all headers, even the unchanged ones since the last run")
+    args_parser.add_argument("--cache", type=str, default=os.environ.get(CACHE_DIR_VARIABLE),
+                             help="The directory of the parse cache shared by all checkouts and runs "
+                                  f"(default: ${CACHE_DIR_VARIABLE}, no cache if unset)")
+    args_parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE // (1024 * 1024),
+                             help="The maximum size of the parse cache in MiB, the least recently used headers "
+                                  f"are evicted (default: {DEFAULT_CACHE_SIZE // (1024 * 1024)})")
+    modes = args_parser.add_mutually_exclusive_group()
+    modes.add_argument("--watch", action="store_true",
+                       help="Keep running and update the documentation when a header is changed, added or removed")
+    modes.add_argument("--serve", type=str, default=None, metavar="SOCKET",
+                       help="Keep running and answer the requests of editor integrations on the given Unix socket "
+                            "(see client.py)")
+    args_parser.add_argument("--interval", type=float, default=0.2,
+                             help="The delay in seconds between two checks of the headers in watch mode (default: 0.2)")
+    args_parser.add_argument("--profile", type=str, default=None, metavar="FILE",
+                             help="Write a JSON report of the time spent in each stage of the run (discover, cache, "
+                                  "read, lex, render, write), of the slowest headers and of the bytes read and written")
+    args_parser.add_argument("--profile-memory", type=str, default=None, metavar="FILE",
+                             help="Trace the memory allocations and write a JSON report of snapshots taken after "
+                                  "the discovery, the parsing and the rendering: the largest allocation sites "
+                                  "and the live instances of the model classes (slows the run down)")
+    args_parser.add_argument("--metrics", type=str, default=None, metavar="FILE",
+                             help="Write the statistics of the run in the OpenMetrics text format, for the textfile "
+                                  "collector of the Prometheus node exporter (the file name must end with '.prom')")
+    args_parser.add_argument("--profile-top", type=int, default=DEFAULT_SLOWEST, metavar="N",
+                             help="The number of slowest headers and of largest allocation sites in the profile "
+                                  f"reports (default: {DEFAULT_SLOWEST})")
+
+# ---------------------------------------------------------------------------
+
+
+def report_unresolved(unresolved: dict[str, list[str]]) -> None:
+    """
+    SUMMARY
+    -------
+        This function prints all unresolved references at once, grouped by header.
+
+    PARAMETERS
+    ----------
+        - unresolved (dict[str, list[str]]): The unresolved names referenced by each header (relative path)
+    """
+    if not unresolved:
+        return
+
+    print(f"{sum(len(names) for names in unresolved.values())} unresolved references:", file=sys.stderr)
+    for path in sorted(unresolved):
+        print(f"  {path}: {', '.join(unresolved[path])}", file=sys.stderr)
+
+# ---------------------------------------------------------------------------
+
+
+def report_parameter_mismatches(mismatches: dict[str, list[str]]) -> None:
+    """
+    SUMMARY
+    -------
+        This function prints the functions whose @param tags don't match their signature, grouped by header.
+
+    PARAMETERS
+    ----------
+        - mismatches (dict[str, list[str]]): The mismatched functions of each header (relative path)
+    """
+    if not mismatches:
+        return
+
+    print(f"{sum(len(functions) for functions in mismatches.values())} functions with mismatched @param tags:",
+          file=sys.stderr)
+    for path in sorted(mismatches):
+        print(f"  {path}: {', '.join(mismatches[path])}", file=sys.stderr)
+
+# ---------------------------------------------------------------------------
+
+
+def report_duplicates(duplicates: dict[str, list[str]]) -> None:
+    """
+    SUMMARY
+    -------
+        This function prints the pages documented by several headers, with the header that writes them.
+
+    PARAMETERS
+    ----------
+        - duplicates (dict[str, list[str]]): The sorted headers (relative paths) that generate each page
+    """
+    if not duplicates:
+        return
+
+    print(f"{len(duplicates)} pages documented by several headers, written by the first one:", file=sys.stderr)
+    for page in duplicates:
+        print(f"  {page}: {', '.join(duplicates[page])}", file=sys.stderr)
+
+# ---------------------------------------------------------------------------
+
+
+def report_cache(cache: ParseCache | None) -> None:
+    """
+    SUMMARY
+    -------
+        This function prints the hit and miss statistics of the parse cache.
+
+    PARAMETERS
+    ----------
+        - cache (ParseCache | None): The parse cache, None if the headers were all parsed
+    """
+    if cache is None:
+        return
+
+    statistics: dict[str, int] = cache.get_statistics()
+    lookups: int = statistics["hits"] + statistics["misses"]
+
+    print(f"Parse cache: {statistics['hits']} hits, {statistics['misses']} misses "
+          f"({statistics['hits'] / lookups if lookups else 0:.1%} hit rate), "
+          f"{statistics['stored']} stored, {statistics['evicted']} evicted, "
+          f"{statistics['size'] / (1024 * 1024):.1f} MiB")
+
+# ---------------------------------------------------------------------------
+
+
+def export_metrics(path: str, run_metrics: RunMetrics, pipeline: DocumentationPipeline, io_manager: IOManager,
+                   cache: ParseCache | None, success: bool) -> None:
+    """
+    SUMMARY
+    -------
+        This function writes the statistics of the run in an OpenMetrics textfile.
+
+    PARAMETERS
+    ----------
+        - path (str): The path of the textfile
+        - run_metrics (RunMetrics): The metrics of the run
+        - pipeline (DocumentationPipeline): The pipeline that ran
+        - io_manager (IOManager): The I/O manager that wrote the pages
+        - cache (ParseCache | None): The parse cache, None if the headers were all parsed
+        - success (bool): False if the run stopped on an error
+    """
+    headers: dict[str, int] = pipeline.get_run_statistics()
+    cache_statistics: dict[str, int] | None = None if cache is None else cache.get_statistics()
+
+    # the pool of worker processes only starts when a header isn't in the cache
+    parsed: int = headers["parsed"] - (0 if cache_statistics is None else cache_statistics["hits"])
+    workers: bool = pipeline.get_jobs() > 1 and parsed > 0
+
+    run_metrics.set_durations(pipeline.get_stage_durations())
+    try:
+        run_metrics.write(path, headers, io_manager.get_write_statistics(), cache_statistics, success, workers)
+    except OSError as error:
+        print(f"Can't write the metrics: {error}", file=sys.stderr)
+
+# ---------------------------------------------------------------------------
+
+
+def watch(pipeline: DocumentationPipeline, watcher: HeaderWatcher, interval: float) -> None:
+    """
+    SUMMARY
+    -------
+        This function updates the documentation each time the watcher detects changed headers, until interrupted.
+        The manifest is saved at the first poll without changes, so it doesn't delay the updated pages.
+        An update that fails (a header that can't be read or parsed, a page that can't be written) is reported,
+        and the watcher keeps polling: the failed headers are updated again at their next change.
+
+    PARAMETERS
+    ----------
+        - pipeline (DocumentationPipeline): The pipeline that generated the documentation
+        - watcher (HeaderWatcher): The watcher of the input directory
+        - interval (float): The delay in seconds between two polls
+    """
+    print(f"Watching {len(watcher.get_headers())} headers, press Ctrl+C to stop")
+    unsaved: bool = False
+
+    try:
+        while True:
+            time.sleep(interval)
+
+            changed, removed = watcher.poll()
+            if not changed and not removed:
+                if unsaved:
+                    pipeline.save()
+                    unsaved = False
+                continue
+
+            start: float = time.perf_counter()
+            # a failed update may have recorded some headers already
+            unsaved = True
+            try:
+                parsed: int = pipeline.update(changed, removed)
+            except (OSError, ValueError) as error:
+                print(f"Can't update the documentation: {error}", file=sys.stderr)
+                continue
+
+            print(f"{parsed} headers updated, {len(removed)} removed "
+                  f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if unsaved:
+            pipeline.save()
 
 # ---------------------------------------------------------------------------
 
@@ -64,6 +281,57 @@ if __name__ == "__main__":
 
     args: argparse.Namespace = parser.parse_args()
 
-    io_manager: IOManager = IOManager(args.input, args.output)
-    for file in io_manager.get_files():
-        pass
+    io_manager: IOManager = IOManager(args.input, args.output, excluded_dirs=args.exclude,
+                                      writers=args.writers, write_queue_size=args.max_in_flight)
+    manifest: BuildManifest = BuildManifest(args.input, args.output, force=args.force)
+    cache: ParseCache | None = None if args.cache is None else ParseCache(args.cache, args.cache_size * 1024 * 1024)
+    pipeline: DocumentationPipeline = DocumentationPipeline(io_manager, manifest, args.input,
+                                                            args.jobs, args.max_in_flight, cache)
+
+    try:
+        # the snapshot is taken before the run, so the headers saved during the run are updated right after
+        watcher: HeaderWatcher | None = HeaderWatcher(io_manager, args.input) if args.watch else None
+
+        profiler: Profiler | None = None if args.profile is None else Profiler()
+        set_profiler(profiler)
+        memory_profiler: MemoryProfiler | None = (None if args.profile_memory is None
+                                                  else MemoryProfiler(args.profile_top))
+
+        run_metrics: RunMetrics | None = None if args.metrics is None else RunMetrics()
+
+        try:
+            pipeline.run(None if memory_profiler is None else memory_profiler.snapshot)
+        except BaseException:
+            if run_metrics is not None:
+                export_metrics(args.metrics, run_metrics, pipeline, io_manager, cache, False)
+            raise
+
+        if run_metrics is not None:
+            export_metrics(args.metrics, run_metrics, pipeline, io_manager, cache, True)
+
+        # only the first run is profiled, the updates of the watch and serve modes aren't
+        if profiler is not None:
+            set_profiler(None)
+            profiler.write_report(args.profile, args.profile_top)
+        if memory_profiler is not None:
+            memory_profiler.stop()
+            memory_profiler.write_report(args.profile_memory)
+
+        statistics: dict[str, dict[str, int]] = io_manager.get_write_statistics()
+        print(f"{sum(statistics['written'].values())} files written, "
+              f"{sum(statistics['skipped'].values())} unchanged, "
+              f"{sum(statistics['deleted'].values())} deleted")
+        report_cache(cache)
+        report_duplicates(pipeline.get_duplicates())
+        report_unresolved(pipeline.get_unresolved())
+        report_parameter_mismatches(pipeline.get_parameter_mismatches())
+
+        if watcher is not None:
+            watch(pipeline, watcher, args.interval)
+        elif args.serve is not None:
+            server: DocServer = DocServer(io_manager, pipeline, args.input, args.jobs)
+            print(f"Serving on {args.serve}, press Ctrl+C to stop")
+            server.serve(args.serve)
+            pipeline.save()
+    finally:
+        io_manager.close()
@@ -0,0 +1,45 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.benchmarks.__init__.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  The benchmark suite of the program, on deterministic synthetic corpora of c++ headers.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+from .corpus import CorpusGenerator
+from .stages import BENCHMARKS, BenchmarkContext
+from .runner import RESULTS_VERSION, run_benchmarks, create_report
+
+
+__all__ = {
+    "CorpusGenerator",
+    "BENCHMARKS",
+    "BenchmarkContext",
+    "RESULTS_VERSION",
+    "run_benchmarks",
+    "create_report"
+}
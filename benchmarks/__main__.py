@@ -0,0 +1,125 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.benchmarks.__main__.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Generates a synthetic corpus, runs the benchmarks on it and writes their results in JSON.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+Run from the root directory of the program: python -m benchmarks [options] [benchmark ...]
+
+"""
+
+import os
+import sys
+import json
+import argparse
+import tempfile
+
+from .corpus import CorpusGenerator
+from .runner import run_benchmarks, create_report
+from .stages import BENCHMARKS, BenchmarkContext
+
+# ---------------------------------------------------------------------------
+
+
+def set_benchmark_options(args_parser: argparse.ArgumentParser) -> None:
+    """
+    SUMMARY
+    -------
+        This function set all arguments and options of the benchmark command in the argument parser.
+
+    PARAMETERS
+    ----------
+        - args_parser (argparse.ArgumentParser): The argument parser of the script
+    """
+    args_parser.add_argument("benchmarks", nargs="*", metavar="BENCHMARK",
+                             help=f"The benchmarks to run, all by default ({', '.join(BENCHMARKS)})")
+    args_parser.add_argument("-o", "--output", type=str, default=None,
+                             help="The path of the JSON results file (default: standard output)")
+    args_parser.add_argument("-r", "--repeat", type=int, default=5,
+                             help="The number of measured runs of each benchmark (default: 5)")
+    args_parser.add_argument("--warmup", type=int, default=1,
+                             help="The number of runs of each benchmark before the measured ones (default: 1)")
+    args_parser.add_argument("--no-memory", action="store_true",
+                             help="Don't measure the peak memory of the in-process benchmarks (a traced run each)")
+
+    corpus = args_parser.add_argument_group("corpus", "The synthetic tree of headers, the same for the same options")
+    corpus.add_argument("--files", type=int, default=500, help="The number of headers (default: 500)")
+    corpus.add_argument("--depth", type=int, default=2,
+                        help="The number of directory levels above the headers (default: 2)")
+    corpus.add_argument("--functions", type=int, default=20,
+                        help="The number of functions and methods per header (default: 20)")
+    corpus.add_argument("--enums", type=int, default=2, help="The number of enumerations per header (default: 2)")
+    corpus.add_argument("--tags", type=int, default=4, help="The number of tags per function docblock (default: 4)")
+    corpus.add_argument("--lines", type=int, default=2, help="The number of summary lines per docblock (default: 2)")
+    corpus.add_argument("--seed", type=int, default=0, help="The seed of the generated corpus (default: 0)")
+
+
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Benchmark CppDocGen on a synthetic corpus of c++ headers")
+    set_benchmark_options(parser)
+
+    args: argparse.Namespace = parser.parse_args()
+
+    unknown: list[str] = [name for name in args.benchmarks if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)} (choose from {', '.join(BENCHMARKS)})")
+
+    try:
+        generator: CorpusGenerator = CorpusGenerator(args.files, args.depth, args.functions, args.enums,
+                                                     args.tags, args.lines, args.seed)
+    except ValueError as error:
+        parser.error(str(error))
+
+    with tempfile.TemporaryDirectory(prefix="cppdocgen-benchmarks-") as directory:
+        input_root: str = os.path.join(directory, "corpus")
+        counts: dict[str, int] = generator.generate(input_root)
+        print(f"Corpus: {counts['files']} headers, {counts['functions']} functions, {counts['enums']} enumerations, "
+              f"{counts['bytes'] / (1024 * 1024):.1f} MiB", file=sys.stderr)
+
+        context: BenchmarkContext = BenchmarkContext(input_root, os.path.join(directory, "scratch"))
+        try:
+            results: dict[str, dict] = run_benchmarks(context, dict.fromkeys(args.benchmarks or BENCHMARKS),
+                                                      args.repeat, args.warmup, not args.no_memory)
+        except ValueError as error:
+            parser.error(str(error))
+
+    report: dict = create_report(results, {"parameters": generator.get_parameters(), "counts": counts},
+                                 args.repeat, args.warmup)
+    content: str = json.dumps(report, indent=2) + "\n"
+
+    if args.output is None:
+        sys.stdout.write(content)
+    else:
+        with open(args.output, 'w', encoding="utf-8") as file:
+            file.write(content)
+
+    for name, result in results.items():
+        print(f"{name:>18}: {result['throughput']:12.1f} {result['unit']}/s, "
+              f"median {result['median_seconds'] * 1000:9.2f} ms", file=sys.stderr)
@@ -0,0 +1,317 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.benchmarks.compare.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Compares the results of a benchmark session with a baseline, fails on performance regressions.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+Run from the root directory of the program: python -m benchmarks.compare <baseline> <current> [options]
+The exit code is 0 without regression, 1 with regressions, 2 if the results can't be compared.
+
+"""
+
+import sys
+import json
+import argparse
+import statistics
+
+from .runner import RESULTS_VERSION
+
+# The default maximum slowdown of a benchmark (relative to the baseline median)
+DEFAULT_THRESHOLD: float = 0.10
+
+# The maximum slowdown of the benchmarks dominated by the file system, noisier than the in-memory stages
+STAGE_THRESHOLDS: dict[str, float] = {
+    "discovery": 0.25,
+    "writing": 0.25,
+    "writing_unchanged": 0.25,
+    "parse_cache": 0.25,
+    "program": 0.15,
+    "program_parallel": 0.15,
+    "program_unchanged": 0.20
+}
+
+# The default maximum increase of the peak memory of a benchmark
+DEFAULT_MEMORY_THRESHOLD: float = 0.10
+
+# The minimum number of runs for the interquartile range to be meaningful
+MIN_RUNS: int = 3
+
+# ---------------------------------------------------------------------------
+
+
+def get_quartiles(samples: list[float]) -> tuple[float, float, float]:
+    """
+    SUMMARY
+    -------
+        This public function returns the first quartile, the median and the third quartile of the run durations.
+        With less than MIN_RUNS runs, the spread isn't known: the three values are the median.
+
+    PARAMETERS
+    ----------
+        - samples (list[float]): The duration of each run
+
+    RETURNS
+    -------
+        tuple[float, float, float]: The first quartile, the median and the third quartile
+    """
+    median: float = statistics.median(samples)
+    if len(samples) < MIN_RUNS:
+        return median, median, median
+
+    first, _, third = statistics.quantiles(samples, n=4, method="inclusive")
+    return first, median, third
+
+
+# ---------------------------------------------------------------------------
+
+
+def check_comparable(baseline: dict, current: dict) -> list[str]:
+    """
+    SUMMARY
+    -------
+        This public function checks that two benchmark sessions measured the same thing.
+
+    PARAMETERS
+    ----------
+        - baseline (dict): The results document of the baseline
+        - current (dict): The results document to check
+
+    RETURNS
+    -------
+        list[str]: The warnings: the sessions ran on different environments, their comparison may be meaningless
+
+    RAISES
+    ------
+        - ValueError: If a document has another format version, or if the corpora differ
+    """
+    for name, document in (("baseline", baseline), ("current", current)):
+        if document.get("version") != RESULTS_VERSION:
+            raise ValueError(f"The {name} results have the format version {document.get('version')} "
+                             f"instead of {RESULTS_VERSION} !")
+
+    if baseline["corpus"]["parameters"] != current["corpus"]["parameters"]:
+        raise ValueError(f"The benchmarks ran on different corpora: {baseline['corpus']['parameters']} "
+                         f"and {current['corpus']['parameters']} !")
+
+    return [f"The {key} differs: '{baseline['environment'].get(key)}' and '{current['environment'].get(key)}'"
+            for key in sorted(baseline["environment"].keys() | current["environment"].keys())
+            if baseline["environment"].get(key) != current["environment"].get(key)]
+
+
+# ---------------------------------------------------------------------------
+
+
+def compare_results(baseline: dict, current: dict, thresholds: dict[str, float] = None,
+                    default_threshold: float = DEFAULT_THRESHOLD,
+                    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD) -> list[dict]:
+    """
+    SUMMARY
+    -------
+        This public function compares each benchmark of a session with the baseline.
+        A benchmark is slower if its median duration grew by more than its threshold, and if the slowdown
+        is larger than the noise: its first quartile is above the third quartile of the baseline,
+        so most of its runs were slower than most of the baseline runs.
+        A benchmark uses more memory if its peak memory grew by more than the memory threshold.
+
+    PARAMETERS
+    ----------
+        - baseline (dict): The results document of the baseline
+        - current (dict): The results document of the session
+        - thresholds (dict[str, float]): Optional parameter, the maximum slowdown of some benchmarks (0.1 is 10%),
+                     the STAGE_THRESHOLDS by default
+        - default_threshold (float): Optional parameter, the maximum slowdown of the other benchmarks
+        - memory_threshold (float): Optional parameter, the maximum increase of the peak memory
+
+    RETURNS
+    -------
+        list[dict]: The comparison of each benchmark: its name, its status ("ok", "faster", "regression", "new" or
+            "missing"), the baseline and current quartiles of its duration, its slowdown and its threshold,
+            the baseline and current peak memory and its increase, and the reasons of a regression
+    """
+    if thresholds is None:
+        thresholds = STAGE_THRESHOLDS
+
+    baseline_results: dict[str, dict] = baseline["benchmarks"]
+    current_results: dict[str, dict] = current["benchmarks"]
+    comparisons: list[dict] = list()
+
+    for name in (*baseline_results, *(name for name in current_results if name not in baseline_results)):
+        threshold: float = thresholds.get(name, default_threshold)
+        comparison: dict = {"benchmark": name, "status": "ok", "threshold": threshold, "reasons": list()}
+        comparisons.append(comparison)
+
+        if name not in current_results:
+            comparison["status"] = "missing"
+            continue
+        if name not in baseline_results:
+            comparison["status"] = "new"
+            continue
+
+        before: dict = baseline_results[name]
+        after: dict = current_results[name]
+
+        # the durations are compared per item, the time of a run is proportional to its items
+        before_quartiles: tuple[float, ...] = tuple(value / before["items"]
+                                                    for value in get_quartiles(before["seconds"]))
+        after_quartiles: tuple[float, ...] = tuple(value / after["items"] for value in get_quartiles(after["seconds"]))
+        slowdown: float = after_quartiles[1] / before_quartiles[1] - 1 if before_quartiles[1] > 0 else 0.0
+
+        comparison.update({"baseline_quartiles": before_quartiles, "current_quartiles": after_quartiles,
+                           "slowdown": slowdown,
+                           "baseline_memory": before["peak_memory"], "current_memory": after["peak_memory"],
+                           "memory_increase": None})
+
+        if slowdown > threshold and after_quartiles[0] > before_quartiles[2]:
+            comparison["reasons"].append(f"{slowdown:+.1%} median time (threshold {threshold:.0%})")
+        elif slowdown < -threshold and after_quartiles[2] < before_quartiles[0]:
+            comparison["status"] = "faster"
+
+        # -1 when the memory wasn't measured
+        if before["peak_memory"] > 0 and after["peak_memory"] > 0:
+            increase: float = after["peak_memory"] / before["peak_memory"] - 1
+            comparison["memory_increase"] = increase
+
+            if increase > memory_threshold:
+                comparison["reasons"].append(f"{increase:+.1%} peak memory (threshold {memory_threshold:.0%})")
+
+        if comparison["reasons"]:
+            comparison["status"] = "regression"
+
+    return comparisons
+
+
+# ---------------------------------------------------------------------------
+
+
+def print_comparisons(comparisons: list[dict]) -> None:
+    """
+    SUMMARY
+    -------
+        This public function prints the comparison of each benchmark, one per line.
+
+    PARAMETERS
+    ----------
+        - comparisons (list[dict]): The comparisons (see compare_results)
+    """
+    print(f"{'BENCHMARK':<18} {'BASELINE':>12} {'CURRENT':>12} {'TIME':>8} {'MEMORY':>8}  STATUS")
+
+    for comparison in comparisons:
+        if "slowdown" not in comparison:
+            print(f"{comparison['benchmark']:<18} {'':>12} {'':>12} {'':>8} {'':>8}  {comparison['status']}")
+            continue
+
+        memory: str = "" if comparison["memory_increase"] is None else f"{comparison['memory_increase']:+.1%}"
+        print(f"{comparison['benchmark']:<18} {_format_seconds(comparison['baseline_quartiles'][1]):>12} "
+              f"{_format_seconds(comparison['current_quartiles'][1]):>12} {comparison['slowdown']:>+8.1%} "
+              f"{memory:>8}  {comparison['status']}{': ' if comparison['reasons'] else ''}"
+              f"{', '.join(comparison['reasons'])}")
+
+
+# ---------------------------------------------------------------------------
+
+
+def _format_seconds(seconds: float) -> str:
+    """
+    SUMMARY
+    -------
+        This private function formats a duration per item with a readable unit.
+    """
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+# ---------------------------------------------------------------------------
+
+
+def _parse_threshold(text: str) -> tuple[str, float]:
+    """
+    SUMMARY
+    -------
+        This private function parses a NAME=PERCENT option of the command line.
+    """
+    name, separator, percent = text.partition("=")
+
+    try:
+        value: float = float(percent) / 100
+    except ValueError:
+        value = -1
+
+    if not separator or not name or value < 0:
+        raise argparse.ArgumentTypeError(f"'{text}' isn't a BENCHMARK=PERCENT threshold")
+
+    return name, value
+
+
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m benchmarks.compare",
+        description="Compare benchmark results with a baseline, exit with 1 on performance regressions")
+    parser.add_argument("baseline", type=str, help="The JSON results of the baseline (python -m benchmarks -o ...)")
+    parser.add_argument("current", type=str, help="The JSON results to check")
+    parser.add_argument("-t", "--threshold", type=_parse_threshold, action="append", default=list(),
+                        metavar="BENCHMARK=PERCENT",
+                        help="The maximum slowdown of a benchmark in percent, can be repeated (default: "
+                             f"{', '.join(f'{name}={value * 100:.0f}' for name, value in STAGE_THRESHOLDS.items())})")
+    parser.add_argument("--default-threshold", type=float, default=DEFAULT_THRESHOLD * 100, metavar="PERCENT",
+                        help=f"The maximum slowdown of the other benchmarks in percent "
+                             f"(default: {DEFAULT_THRESHOLD:.0%})")
+    parser.add_argument("--memory-threshold", type=float, default=DEFAULT_MEMORY_THRESHOLD * 100, metavar="PERCENT",
+                        help="The maximum increase of the peak memory in percent "
+                             f"(default: {DEFAULT_MEMORY_THRESHOLD:.0%})")
+    parser.add_argument("--strict", action="store_true",
+                        help="A benchmark of the baseline missing from the current results is a regression")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    try:
+        with open(args.baseline, 'r', encoding="utf-8") as file:
+            baseline_document: dict = json.load(file)
+        with open(args.current, 'r', encoding="utf-8") as file:
+            current_document: dict = json.load(file)
+
+        for warning in check_comparable(baseline_document, current_document):
+            print(f"Warning: {warning}", file=sys.stderr)
+    except (OSError, ValueError, KeyError) as error:
+        print(f"Can't compare the results: {error}", file=sys.stderr)
+        sys.exit(2)
+
+    results: list[dict] = compare_results(baseline_document, current_document,
+                                          {**STAGE_THRESHOLDS, **dict(args.threshold)},
+                                          args.default_threshold / 100, args.memory_threshold / 100)
+    print_comparisons(results)
+
+    regressions: list[str] = [comparison["benchmark"] for comparison in results
+                              if comparison["status"] == "regression"
+                              or (args.strict and comparison["status"] == "missing")]
+    if regressions:
+        print(f"{len(regressions)} regressions: {', '.join(regressions)}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,253 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.benchmarks.corpus.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Generates deterministic synthetic trees of documented c++ headers for the benchmarks.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import os
+import random
+from typing import Iterator
+
+# The number of sub directories of each directory of the generated tree
+BRANCHING: int = 8
+
+# The vocabularies of the generated documentation, small enough for the names and the types to repeat
+TYPES: tuple[str, ...] = ("int", "bool", "double", "float", "std::size_t", "std::string", "const std::string&",
+                          "std::vector<int>", "const std::vector<T>&", "T", "const T&", "char*", "void*",
+                          "std::map<std::string, int>", "unsigned int")
+EXCEPTIONS: tuple[str, ...] = ("std::invalid_argument", "std::out_of_range", "std::runtime_error",
+                               "std::bad_alloc", "std::logic_error")
+HINTS: tuple[str, ...] = ("in", "out", "in/out", "optional")
+VERBS: tuple[str, ...] = ("get", "set", "find", "compute", "update", "create", "remove", "load", "save", "parse",
+                          "render", "check", "build", "merge", "split", "sort")
+NOUNS: tuple[str, ...] = ("Value", "Index", "Node", "Buffer", "Path", "Name", "Size", "Color", "Vector", "Matrix",
+                          "Token", "Stream", "Entry", "Range", "Key", "Shape")
+WORDS: tuple[str, ...] = ("the", "value", "of", "a", "given", "node", "returns", "current", "index", "buffer",
+                          "this", "method", "computes", "new", "matrix", "from", "input", "stream", "is", "empty",
+                          "when", "size", "token", "range", "checks", "valid", "result", "default", "parsed", "key",
+                          "shape", "entry", "updates", "internal", "state", "cached", "list", "all", "items", "path")
+
+# ---------------------------------------------------------------------------
+
+
+class CorpusGenerator:
+    """
+    SUMMARY
+    -------
+        This class writes a synthetic tree of documented c++ headers. The tree only depends on the parameters
+        and on the seed, so two runs of a benchmark (or two releases) document exactly the same headers.
+
+        Each header has a @file docblock, its own namespace, a class, and the given number of functions
+        (the second half are methods of the class) and enumerations. Each function docblock has the given
+        number of tags (parameters, then a return value and an exception) and summary lines.
+    """
+
+    def __init__(self, files: int = 500, depth: int = 2, functions: int = 20, enums: int = 2,
+                 tags: int = 4, lines: int = 2, seed: int = 0) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the constructor of the CorpusGenerator class.
+
+        PARAMETERS
+        ----------
+            - files (int): Optional parameter, the number of headers
+            - depth (int): Optional parameter, the number of directory levels above the headers
+            - functions (int): Optional parameter, the number of documented functions and methods per header
+            - enums (int): Optional parameter, the number of documented enumerations per header
+            - tags (int): Optional parameter, the number of tags of each function docblock
+            - lines (int): Optional parameter, the number of summary lines of each docblock
+            - seed (int): Optional parameter, the seed of the generated names, types and texts
+
+        RAISES
+        ------
+            - ValueError: If a number is negative
+        """
+        self.__parameters: dict[str, int] = {"files": files, "depth": depth, "functions": functions, "enums": enums,
+                                             "tags": tags, "lines": lines, "seed": seed}
+
+        for name, value in self.__parameters.items():
+            if value < 0 and name != "seed":
+                raise ValueError(f"The '{name}' parameter of the corpus can't be negative ({value}) !")
+
+    # ---------------------------------------------------------------------------
+    # GETTERS
+    # ---------------------------------------------------------------------------
+
+    def get_parameters(self) -> dict[str, int]:
+        """
+        SUMMARY
+        -------
+            This public method returns the parameters of the generated trees, to be reported with the results.
+
+        RETURNS
+        -------
+            dict[str, int]: The parameters given to the constructor, by name
+        """
+        return dict(self.__parameters)
+
+    # ---------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ---------------------------------------------------------------------------
+
+    def generate(self, root: str) -> dict[str, int]:
+        """
+        SUMMARY
+        -------
+            This public method writes the headers of the tree in a directory.
+
+        PARAMETERS
+        ----------
+            - root (str): The path of the directory, created if needed
+
+        RETURNS
+        -------
+            dict[str, int]: The number of files, docblocks, functions and enumerations generated, and their bytes
+        """
+        generator: random.Random = random.Random(self.__parameters["seed"])
+        counts: dict[str, int] = {"files": 0, "docblocks": 0, "functions": 0, "enums": 0, "bytes": 0}
+
+        for index in range(self.__parameters["files"]):
+            directory: str = os.path.join(root, *self.__get_directories(index))
+            os.makedirs(directory, exist_ok=True)
+
+            content: str = "".join(self.__generate_header(index, generator, counts))
+            with open(os.path.join(directory, f"header{index:05d}.hpp"), 'w', encoding="utf-8") as file:
+                file.write(content)
+
+            counts["files"] += 1
+            counts["bytes"] += len(content.encode("utf-8"))
+
+        return counts
+
+    # ---------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ---------------------------------------------------------------------------
+
+    def __get_directories(self, index: int) -> list[str]:
+        """
+        SUMMARY
+        -------
+            This private method returns the directories of a header, the headers are spread evenly over the tree.
+        """
+        return [f"module{(index // BRANCHING ** level) % BRANCHING}"
+                for level in reversed(range(self.__parameters["depth"]))]
+
+    # ---------------------------------------------------------------------------
+
+    def __generate_header(self, index: int, generator: random.Random, counts: dict[str, int]) -> Iterator[str]:
+        """
+        SUMMARY
+        -------
+            This private method yields the content of a header, and counts its docblocks.
+        """
+        # a namespace per header, the functions and enumerations of two headers never share a page
+        namespace: str = f"project::part{index % 16}::unit{index}"
+        class_name: str = f"{generator.choice(NOUNS)}{index}"
+        functions: int = self.__parameters["functions"]
+
+        yield from self.__docblock(generator, [f"@file header{index:05d}.hpp", "@author Benchmark Generator",
+                                               "@version 1.0"])
+        yield "#pragma once\n\n#include <map>\n#include <string>\n#include <vector>\n\n"
+
+        yield from self.__docblock(generator, [f"@namespace {namespace}"])
+        yield f"namespace {namespace} {{\n\n"
+
+        for item in range(self.__parameters["enums"]):
+            yield from self.__docblock(generator, list())
+            items: str = ", ".join(f"{noun.upper()}{'' if position % 3 else f' = {position * 4}'}"
+                                   for position, noun in enumerate(generator.sample(NOUNS, 4)))
+            yield f"enum class {generator.choice(NOUNS)}Kind{item} {{ {items} }};\n\n"
+            counts["enums"] += 1
+
+        for function in range(functions // 2):
+            yield from self.__function(generator, "", None)
+            counts["functions"] += 1
+
+        yield from self.__docblock(generator, list())
+        yield f"class {class_name} {{\npublic:\n"
+
+        for function in range(functions - functions // 2):
+            yield from self.__function(generator, "    ", class_name)
+            counts["functions"] += 1
+
+        yield "};\n\n}\n"
+        counts["docblocks"] += 3 + self.__parameters["enums"] + functions
+
+    # ---------------------------------------------------------------------------
+
+    def __function(self, generator: random.Random, indent: str, class_name: str | None) -> Iterator[str]:
+        """
+        SUMMARY
+        -------
+            This private method yields the docblock and the declaration of a function or of a method.
+        """
+        name: str = f"{generator.choice(VERBS)}{generator.choice(NOUNS)}"
+        parameters: list[tuple[str, str]] = list()
+        tags: list[str] = ["@method" if class_name is not None else "@func"]
+
+        for position in range(self.__parameters["tags"]):
+            if position == 1:
+                tags.append(f"@return {{{generator.choice(TYPES)}}} {self.__sentence(generator)}")
+            elif position == 2:
+                tags.append(f"@throw {{{generator.choice(EXCEPTIONS)}}} {self.__sentence(generator)}")
+            else:
+                parameter: tuple[str, str] = (f"{generator.choice(NOUNS).lower()}{position}", generator.choice(TYPES))
+                parameters.append(parameter)
+                tags.append(f"@param {{{parameter[0]}}} {{{parameter[1]}}} {{{generator.choice(HINTS)}}} "
+                            f"{self.__sentence(generator)}")
+
+        yield from self.__docblock(generator, tags, indent)
+        yield f"{indent}int {name}({', '.join(f'{type} {parameter}' for parameter, type in parameters)});\n\n"
+
+    # ---------------------------------------------------------------------------
+
+    def __docblock(self, generator: random.Random, tags: list[str], indent: str = "") -> Iterator[str]:
+        """
+        SUMMARY
+        -------
+            This private method yields a docblock: the summary lines, then the tags.
+        """
+        yield f"{indent}/**\n"
+        for _ in range(self.__parameters["lines"]):
+            yield f"{indent} * {self.__sentence(generator).capitalize()}.\n"
+        for tag in tags:
+            yield f"{indent} * {tag}\n"
+        yield f"{indent} */\n"
+
+    # ---------------------------------------------------------------------------
+
+    @staticmethod
+    def __sentence(generator: random.Random) -> str:
+        """
+        SUMMARY
+        -------
+            This private static method returns a few random words.
+        """
+        return " ".join(generator.choices(WORDS, k=generator.randint(4, 10)))
@@ -0,0 +1,179 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.benchmarks.runner.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Runs the benchmarks and gathers their results in a JSON document.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import os
+import sys
+import gc
+import time
+import platform
+import statistics
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Iterable
+
+from .stages import BENCHMARKS, BenchmarkContext, Run
+
+# The version of the results document, changes when a field is renamed or changes meaning
+RESULTS_VERSION: int = 1
+
+# ---------------------------------------------------------------------------
+
+
+def get_environment() -> dict[str, str | int]:
+    """
+    SUMMARY
+    -------
+        This public function describes the machine and the interpreter, the results of two machines don't compare.
+
+    RETURNS
+    -------
+        dict[str, str | int]: The python version and implementation, the platform and the number of processors
+    """
+    return {"python": platform.python_version(), "implementation": platform.python_implementation(),
+            "platform": platform.platform(), "processors": os.cpu_count() or 1}
+
+
+# ---------------------------------------------------------------------------
+
+
+def run_benchmarks(context: BenchmarkContext, names: Iterable[str], repeat: int = 5, warmup: int = 1,
+                   trace_memory: bool = True) -> dict[str, dict]:
+    """
+    SUMMARY
+    -------
+        This public function runs the given benchmarks one after the other.
+        Each benchmark is run 'warmup' times (not measured), then 'repeat' times, the duration of each run is kept
+        so the comparisons can use robust statistics. The peak memory is measured by an additional traced run,
+        tracemalloc slows the code down too much to trace the measured runs.
+
+    PARAMETERS
+    ----------
+        - context (BenchmarkContext): The corpus and the inputs shared by the benchmarks
+        - names (Iterable[str]): The names of the benchmarks to run (see BENCHMARKS)
+        - repeat (int): Optional parameter, the number of measured runs of each benchmark
+        - warmup (int): Optional parameter, the number of runs before the measured ones
+        - trace_memory (bool): Optional parameter, measure the peak memory of the in-process benchmarks
+
+    RETURNS
+    -------
+        dict[str, dict]: The results of each benchmark: the unit and number of processed items, the duration
+            of each run and their median in seconds, the throughput in items per second, the peak and the retained
+            memory in bytes (-1 if not measured), and the other metrics of the last run
+
+    RAISES
+    ------
+        - ValueError: If a benchmark is unknown or if the number of measured runs isn't positive
+    """
+    if repeat < 1:
+        raise ValueError(f"The number of measured runs must be positive, not {repeat} !")
+
+    results: dict[str, dict] = dict()
+
+    for name in names:
+        if name not in BENCHMARKS:
+            raise ValueError(f"Unknown benchmark '{name}', expected one of: {', '.join(BENCHMARKS)} !")
+
+        unit, benchmark, traced = BENCHMARKS[name]
+        print(f"Running the '{name}' benchmark...", file=sys.stderr)
+
+        run: Run = benchmark(context)
+        for _ in range(warmup):
+            run()
+
+        seconds: list[float] = list()
+        peaks: list[float] = list()
+        metrics: dict[str, float] = dict()
+
+        for _ in range(repeat):
+            gc.collect()
+            start: float = time.perf_counter()
+            metrics = run()
+            seconds.append(metrics.pop("seconds", time.perf_counter() - start))
+            peaks.append(metrics.pop("peak_memory", -1))
+
+        peak_memory, retained_memory = _trace(run) if traced and trace_memory else (max(peaks), -1)
+        items: float = metrics.pop("items")
+        median: float = statistics.median(seconds)
+
+        results[name] = {"unit": unit, "items": items, "seconds": seconds, "median_seconds": median,
+                         "throughput": items / median if median > 0 else 0.0,
+                         "peak_memory": peak_memory, "retained_memory": retained_memory, "metrics": metrics}
+
+    return results
+
+
+# ---------------------------------------------------------------------------
+
+
+def create_report(results: dict[str, dict], corpus: dict[str, dict[str, int]], repeat: int, warmup: int) -> dict:
+    """
+    SUMMARY
+    -------
+        This public function builds the JSON document of a benchmark session.
+
+    PARAMETERS
+    ----------
+        - results (dict[str, dict]): The results of the benchmarks (see run_benchmarks)
+        - corpus (dict[str, dict[str, int]]): The parameters of the generated corpus and its counts
+        - repeat (int): The number of measured runs of each benchmark
+        - warmup (int): The number of runs before the measured ones
+
+    RETURNS
+    -------
+        dict: The document, with its version, date, environment, corpus and the results by benchmark name
+    """
+    return {"version": RESULTS_VERSION, "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "environment": get_environment(), "corpus": corpus, "repeat": repeat, "warmup": warmup,
+            "benchmarks": results}
+
+
+# ---------------------------------------------------------------------------
+
+
+def _trace(run: Run) -> tuple[int, int]:
+    """
+    SUMMARY
+    -------
+        This private function runs a benchmark under tracemalloc, it returns the peak memory allocated by the run
+        and the memory it still holds afterwards (what the stage keeps, like the parsed model), in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        run()
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak, retained
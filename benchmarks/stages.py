@@ -0,0 +1,673 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.benchmarks.stages.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  The benchmark of each stage of the documentation generation, and of the whole program.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+A benchmark is a function that prepares the inputs of a stage (not measured) and returns the measured run:
+a function without parameters that processes the whole corpus once and returns its metrics.
+The "items" metric is the number of processed items, the throughput of the stage is computed from it.
+A run that measures itself (in another process) also returns its "seconds" and its "peak_memory" in bytes.
+
+"""
+
+import os
+import sys
+import json
+import pickle
+import shutil
+import statistics
+import subprocess
+import time
+import tracemalloc
+from copy import copy
+from typing import Callable, Iterator
+
+from src import IOManager, DocFileCategory
+from src.lexer import lex_docblock
+from src.modelization import FileDesc, FunctionDesc, ParameterTag, TypedTag, TagKeys, StringPool, PageLinks, PAGE_LINKS, to_page_name, serialize, deserialize
+from src.parse_cache import ParseCache
+from src.parser import parse_header
+from src.rendering import NamespaceIndex, Page
+from src.scanner import scan_docblocks
+from src.search_index import Document, SearchIndex, search
+
+# The root directory of the program, run by the end-to-end benchmarks
+PROGRAM_ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The queries of the search index benchmark: exact names, name parts, prefixes, several words and no match
+SEARCH_QUERIES: tuple[str, ...] = ("getValue", "buffer", "comp", "p", "matrix index", "part3", "stream token",
+                                   "kind", "unknownword")
+
+# The parameter counts of the functions measured by the getters benchmark, and the getter calls for each count
+GETTER_PARAMETERS: tuple[int, ...] = (1, 8, 64)
+GETTER_CALLS: int = 64_000
+
+# The worker processes of the parallel program benchmark, at least 2 so the process pool is always measured
+PARALLEL_JOBS: int = max(2, min(4, os.cpu_count() or 1))
+
+# The measured run of a benchmark, it returns the metrics of one run
+Run = Callable[[], dict[str, float]]
+
+# ---------------------------------------------------------------------------
+
+
+class BenchmarkContext:
+    """
+    SUMMARY
+    -------
+        This class holds the inputs shared by the benchmarks: the corpus, a scratch directory,
+        and the results of the previous stages (header paths, parsed model, rendered pages),
+        computed once when a benchmark first needs them.
+    """
+
+    def __init__(self, input_root: str, scratch_root: str) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the constructor of the BenchmarkContext class.
+
+        PARAMETERS
+        ----------
+            - input_root (str): The path of the corpus directory
+            - scratch_root (str): The path of a directory for the generated files, created if needed
+        """
+        self.__input_root: str = input_root
+        self.__scratch_root: str = scratch_root
+        self.__scratch_count: int = 0
+
+        self.__files: list[str] | None = None
+        self.__model: list[FileDesc] | None = None
+        self.__pages: list[tuple[DocFileCategory, str, str]] | None = None
+
+        os.makedirs(scratch_root, exist_ok=True)
+
+    # ---------------------------------------------------------------------------
+    # GETTERS
+    # ---------------------------------------------------------------------------
+
+    def get_input_root(self) -> str:
+        """
+        SUMMARY
+        -------
+            This public method is the getter of the '__input_root' attribute.
+
+        RETURNS
+        -------
+            str: The path of the corpus directory
+        """
+        return self.__input_root
+
+    # ---------------------------------------------------------------------------
+
+    def get_files(self) -> list[str]:
+        """
+        SUMMARY
+        -------
+            This public method returns the path of the headers of the corpus, sorted.
+
+        RETURNS
+        -------
+            list[str]: The path of each header
+        """
+        if self.__files is None:
+            io_manager: IOManager = IOManager(self.__input_root, self.get_scratch_directory(), writers=0)
+            self.__files = sorted(io_manager.get_files())
+
+        return self.__files
+
+    # ---------------------------------------------------------------------------
+
+    def get_model(self) -> list[FileDesc]:
+        """
+        SUMMARY
+        -------
+            This public method returns the parsed description of each header of the corpus.
+
+        RETURNS
+        -------
+            list[FileDesc]: The descriptions, in the order of the headers
+        """
+        if self.__model is None:
+            pool: StringPool = StringPool()
+            self.__model = [parse_header(path, self.__input_root, pool) for path in self.get_files()]
+
+        return self.__model
+
+    # ---------------------------------------------------------------------------
+
+    def get_pages(self) -> list[tuple[DocFileCategory, str, str]]:
+        """
+        SUMMARY
+        -------
+            This public method returns the rendered function and enumeration pages of the corpus.
+
+        RETURNS
+        -------
+            list[tuple[DocFileCategory, str, str]]: The category, the name and the markdown of each page
+        """
+        if self.__pages is None:
+            self.__pages = [(category, name, "".join(content)) for category, name, content in _render(self.get_model())]
+
+        return self.__pages
+
+    # ---------------------------------------------------------------------------
+
+    def get_scratch_directory(self) -> str:
+        """
+        SUMMARY
+        -------
+            This public method returns a new empty directory in the scratch directory.
+
+        RETURNS
+        -------
+            str: The path of the directory
+        """
+        self.__scratch_count += 1
+        directory: str = os.path.join(self.__scratch_root, f"run{self.__scratch_count}")
+
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory)
+        return directory
+
+
+# ---------------------------------------------------------------------------
+
+
+def _render(model: list[FileDesc]) -> Iterator[Page]:
+    """
+    SUMMARY
+    -------
+        This private function yields the function and enumeration pages of the model, rendered lazily.
+    """
+    function_links: PageLinks = PAGE_LINKS[DocFileCategory.FUNCTION]
+    enum_links: PageLinks = PAGE_LINKS[DocFileCategory.ENUM]
+
+    for file_desc in model:
+        for function, class_container, page in file_desc.get_functions():
+            yield (DocFileCategory.FUNCTION, page,
+                   function.generate_markdown(function_links, file_desc.get_page_name(), class_container))
+
+        for enum in file_desc.get_enums():
+            yield DocFileCategory.ENUM, to_page_name(enum.get_name()), enum.to_markdown(enum_links, file_desc.get_page_name())
+
+
+# ---------------------------------------------------------------------------
+
+
+def benchmark_discovery(context: BenchmarkContext) -> Run:
+    """
+    SUMMARY
+    -------
+        This function benchmarks the discovery of the headers by the IOManager (walk of the input directory).
+    """
+    output: str = context.get_scratch_directory()
+
+    def run() -> dict[str, float]:
+        io_manager: IOManager = IOManager(context.get_input_root(), output, writers=0)
+        return {"items": sum(1 for _ in io_manager.get_files())}
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+
+
+def benchmark_lexing(context: BenchmarkContext) -> Run:
+    """
+    SUMMARY
+    -------
+        This function benchmarks the lexing of the docblocks in tags, the docblocks are extracted beforehand.
+    """
+    blocks: list[str] = [block for path in context.get_files() for block, _, _ in scan_docblocks(path)]
+
+    def run() -> dict[str, float]:
+        pool: StringPool = StringPool()
+        return {"items": len(blocks), "tags": sum(len(lex_docblock(block, pool)) for block in blocks)}
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+
+
+def benchmark_parsing(context: BenchmarkContext) -> Run:
+    """
+    SUMMARY
+    -------
+        This function benchmarks the parsing of the headers (scan, lexing and model), the parsing stage of a run.
+        The model of the last run is kept, so the retained memory is the memory of the model.
+    """
+    files: list[str] = context.get_files()
+    model: list[list[FileDesc]] = [list()]
+
+    def run() -> dict[str, float]:
+        pool: StringPool = StringPool()
+        model[0] = [parse_header(path, context.get_input_root(), pool) for path in files]
+        return {"items": len(files), "functions": sum(len(file_desc.get_functions()) for file_desc in model[0])}
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+
+
+def benchmark_getters(context: BenchmarkContext) -> Run:
+    """
+    SUMMARY
+    -------
+        This function benchmarks the getters of the functions used by the rendering (tags and lookups by name),
+        on the functions of the corpus, then on functions with each number of parameters of GETTER_PARAMETERS:
+        the 'ns_per_call_<count>' metrics are the mean duration of a getter call for each count.
+    """
+    functions: list[FunctionDesc] = [function for file_desc in context.get_model() for function, _, _ in file_desc.get_functions()]
+    sized: dict[int, FunctionDesc] = {count: _get_function(count) for count in GETTER_PARAMETERS}
+
+    def call_getters(function: FunctionDesc) -> int:
+        calls: int = 0
+        for parameter in function.get_parameters():
+            function.get_parameter(parameter.get_name())
+            calls += 2
+        function.get_throws()
+        function.get_return_tag()
+        return calls + 3
+
+    def run() -> dict[str, float]:
+        start: float = time.perf_counter()
+        calls: int = sum(call_getters(function) for function in functions)
+        metrics: dict[str, float] = {"items": calls, "seconds": time.perf_counter() - start}
+
+        for count, function in sized.items():
+            # about the same number of calls for each count, so the durations are comparable
+            repeat: int = GETTER_CALLS // (2 * count + 3) + 1
+            start = time.perf_counter()
+            sized_calls: int = sum(call_getters(function) for _ in range(repeat))
+            metrics[f"ns_per_call_{count}"] = (time.perf_counter() - start) * 1e9 / sized_calls
+
+        return metrics
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+
+
+def _get_function(count: int) -> FunctionDesc:
+    """
+    SUMMARY
+    -------
+        This private function returns a function with the given number of parameters, an exception and a return tag.
+    """
+    parameters: list[ParameterTag] = [ParameterTag(TagKeys.PARAMETER, ["the value"], "int", f"value{index}")
+                                      for index in range(count)]
+    return FunctionDesc(f"function{count}", f"int function{count}(...);", ["A function."],
+                        TypedTag(TagKeys.RETURN, ["the result"], "int"), parameters,
+                        [TypedTag(TagKeys.EXCEPTION, ["on error"], "std::runtime_error")])
+
+
+# ---------------------------------------------------------------------------
+
+
+def benchmark_string_pool(context: BenchmarkContext) -> Run:
+    """
+    SUMMARY
+    -------
+        This function benchmarks the lookups of the types and parameter names of the model in a dictionary
+        (type cells, parameters by name): the pooled strings of the model against equal copies outside the pool,
+        then the comparisons of pooled strings with == against an explicit 'is' test before ==.
+        The metrics are the mean duration of a lookup or of a comparison, in nanoseconds.
+    """
+    pooled: list[str] = [text for file_desc in context.get_model() for function, _, _ in file_desc.get_functions()
+                         for parameter in function.get_parameters()
+                         for text in (parameter.get_type(), parameter.get_name()) if text is not None]
+    # equal strings that aren't the canonical instances, with their hash already computed like the pooled ones
+    copies: list[str] = [text.encode("utf-8").decode("utf-8") for text in pooled]
+    index: dict[str, int] = {text: position for position, text in enumerate(pooled)}
+    pairs: list[tuple[str, str]] = list(zip(pooled, pooled[1:]))
+    for text in copies:
+        hash(text)
+
+    def measure(loop: Callable[[], object], count: int) -> float:
+        start: float = time.perf_counter()
+        loop()
+        return (time.perf_counter() - start) * 1e9 / count if count else 0.0
+
+    def run() -> dict[str, float]:
+        return {"items": 2 * len(pooled) + 2 * len(pairs),
+                "pooled_lookup_ns": measure(lambda: [index[text] for text in pooled], len(pooled)),
+                "copied_lookup_ns": measure(lambda: [index[text] for text in copies], len(copies)),
+                "equal_ns": measure(lambda: [left == right for left, right in pairs], len(pairs)),
+                "identity_equal_ns": measure(lambda: [left is right or left == right for left, right in pairs],
+                                             len(pairs))}
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+
+
+def benchmark_model_memory(context: BenchmarkContext) -> Run:
+    """
+    SUMMARY
+    -------
+        This function measures the memory of the model with tracemalloc: the bytes of each frozen tag,
+        and of each function with its tags. The strings are shared with the parsed model, so they aren't counted.
+        The run is traced, its duration isn't comparable with the other benchmarks.
+    """
+    functions: list[FunctionDesc] = [function for file_desc in context.get_model() for function, _, _ in file_desc.get_functions()]
+
+    def run() -> dict[str, float]:
+        tracemalloc.start()
+        try:
+            # the lists holding the copies aren't part of the model
+            tags: list = [copy(tag).freeze() for function in functions
+                          for tag in (*function.get_parameters(), *function.get_throws(), function.get_return_tag())
+                          if tag is not None]
+            tag_bytes: int = tracemalloc.get_traced_memory()[0] - sys.getsizeof(tags)
+
+            start: int = tracemalloc.get_traced_memory()[0]
+            copies: list[FunctionDesc] = [
+                FunctionDesc(function.get_name(), function.get_code_line(), list(function.get_summary()),
+                             copy(function.get_return_tag()) if function.get_return_tag() is not None else None,
+                             [copy(tag) for tag in function.get_parameters()], [copy(tag) for tag in function.get_throws()])
+                for function in functions]
+            function_bytes: int = tracemalloc.get_traced_memory()[0] - start - sys.getsizeof(copies)
+        finally:
+            tracemalloc.stop()
+
+        return {"items": len(functions), "tags": len(tags),
+                "bytes_per_tag": tag_bytes / len(tags) if tags else 0.0,
+                "bytes_per_function": function_bytes / len(functions) if functions else 0.0}
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+
+
+def benchmark_rendering(context: BenchmarkContext) -> Run:
+    """
+    SUMMARY
+    -------
+        This function benchmarks the markdown generation of the function and enumeration pages.
+    """
+    model: list[FileDesc] = context.get_model()
+
+    def run() -> dict[str, float]:
+        pages: int = 0
+        size: int = 0
+        for _, _, content in _render(model):
+            size += len("".join(content))
+            pages += 1
+
+        return {"items": pages, "characters": size}
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+
+
+def benchmark_writing(context: BenchmarkContext) -> Run:
+    """
+    SUMMARY
+    -------
+        This function benchmarks the creation of the rendered pages in a new output directory.
+    """
+    pages: list[tuple[DocFileCategory, str, str]] = context.get_pages()
+
+    def run() -> dict[str, float]:
+        io_manager: IOManager = IOManager(context.get_input_root(), context.get_scratch_directory(), writers=0)
+        size: int = sum(io_manager.create_file(name, (content,), category) for category, name, content in pages)
+        return {"items": len(pages), "bytes": size}
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+
+
+def benchmark_writing_unchanged(context: BenchmarkContext) -> Run:
+    """
+    SUMMARY
+    -------
+        This function benchmarks the creation of pages already written with the same content (incremental builds).
+    """
+    pages: list[tuple[DocFileCategory, str, str]] = context.get_pages()
+    io_manager: IOManager = IOManager(context.get_input_root(), context.get_scratch_directory(), writers=0)
+
+    for category, name, content in pages:
+        io_manager.create_file(name, (content,), category)
+
+    def run() -> dict[str, float]:
+        size: int = sum(io_manager.create_file(name, (content,), category) for category, name, content in pages)
+        return {"items": len(pages), "bytes": size}
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+
+
+def benchmark_serialization(context: BenchmarkContext) -> Run:
+    """
+    SUMMARY
+    -------
+        This function benchmarks the serialization of the model and back (parse cache),
+        against pickle as a baseline: the pickle_* metrics measure the same model with the highest pickle protocol.
+    """
+    model: list[FileDesc] = context.get_model()
+
+    def run() -> dict[str, float]:
+        start: float = time.perf_counter()
+        data: list[bytes] = [serialize(file_desc) for file_desc in model]
+        middle: float = time.perf_counter()
+
+        pool: StringPool = StringPool()
+        for item in data:
+            deserialize(item, pool)
+        end: float = time.perf_counter()
+
+        pickled: list[bytes] = [pickle.dumps(file_desc, pickle.HIGHEST_PROTOCOL) for file_desc in model]
+        pickle_middle: float = time.perf_counter()
+
+        for item in pickled:
+            pickle.loads(item)
+
+        # the duration of the run is the one of the format of the cache, pickle is only a reference
+        return {"items": len(model), "seconds": end - start, "bytes": sum(len(item) for item in data),
+                "serialize_seconds": middle - start, "deserialize_seconds": end - middle,
+                "pickle_bytes": sum(len(item) for item in pickled),
+                "pickle_serialize_seconds": pickle_middle - end,
+                "pickle_deserialize_seconds": time.perf_counter() - pickle_middle}
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+
+
+def benchmark_parse_cache(context: BenchmarkContext) -> Run:
+    """
+    SUMMARY
+    -------
+        This function benchmarks a cold parse cache (every header is stored), then a warm one (every header is loaded).
+    """
+    model: list[FileDesc] = context.get_model()
+    keys: list[str] = [ParseCache.get_key(file_desc.get_path(), str(index)) for index, file_desc in enumerate(model)]
+    data: list[bytes] = [serialize(file_desc) for file_desc in model]
+
+    def run() -> dict[str, float]:
+        cache: ParseCache = ParseCache(context.get_scratch_directory())
+
+        start: float = time.perf_counter()
+        for key, item in zip(keys, data):
+            cache.store(key, item)
+        middle: float = time.perf_counter()
+
+        pool: StringPool = StringPool()
+        hits: int = sum(cache.load(key, pool) is not None for key in keys)
+
+        return {"items": len(keys), "hits": hits,
+                "store_seconds": middle - start, "load_seconds": time.perf_counter() - middle}
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+
+
+def benchmark_search_index(context: BenchmarkContext) -> Run:
+    """
+    SUMMARY
+    -------
+        This function benchmarks the build of the search index, its size, and the latency of a few queries.
+    """
+    documents: list[Document] = list()
+    for file_desc in context.get_model():
+        _, symbols = NamespaceIndex.get_entries(file_desc)
+        documents.extend((*symbol, summary) for symbol, summary in zip(symbols, SearchIndex.get_summaries(file_desc)))
+
+    def run() -> dict[str, float]:
+        content: str = "".join(SearchIndex(documents).render())
+        index: dict = json.loads(content)
+
+        latencies: list[float] = list()
+        for query in SEARCH_QUERIES:
+            start: float = time.perf_counter()
+            search(index, query)
+            latencies.append(time.perf_counter() - start)
+
+        return {"items": len(index["documents"]), "bytes": len(content.encode("utf-8")),
+                "query_median_seconds": statistics.median(latencies), "query_max_seconds": max(latencies)}
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+
+
+def benchmark_program(context: BenchmarkContext) -> Run:
+    """
+    SUMMARY
+    -------
+        This function benchmarks a full run of the program in a new output directory, in a separate process,
+        the headers are parsed in the main process (-j 1).
+    """
+    return _get_program_run(context, False)
+
+
+# ---------------------------------------------------------------------------
+
+
+def benchmark_program_parallel(context: BenchmarkContext) -> Run:
+    """
+    SUMMARY
+    -------
+        This function benchmarks a full run of the program in a new output directory like 'benchmark_program',
+        the headers are parsed by a pool of PARALLEL_JOBS worker processes (-j N).
+    """
+    return _get_program_run(context, False, PARALLEL_JOBS)
+
+
+# ---------------------------------------------------------------------------
+
+
+def benchmark_program_unchanged(context: BenchmarkContext) -> Run:
+    """
+    SUMMARY
+    -------
+        This function benchmarks a run of the program on an up to date output directory (nothing to rebuild).
+    """
+    return _get_program_run(context, True)
+
+
+# ---------------------------------------------------------------------------
+
+
+def _get_program_run(context: BenchmarkContext, unchanged: bool, jobs: int = 1) -> Run:
+    """
+    SUMMARY
+    -------
+        This private function returns the run of the program with the given number of parsing processes,
+        in another process (see MEASURE_SCRIPT).
+    """
+    files: int = len(context.get_files())
+    output: str = context.get_scratch_directory()
+
+    def execute(output_root: str) -> dict[str, float]:
+        command: list[str] = [sys.executable, "-c", MEASURE_SCRIPT, sys.executable, PROGRAM_ROOT,
+                              context.get_input_root(), "-o", output_root, "-j", str(jobs)]
+        seconds, peak_memory = subprocess.run(command, capture_output=True, text=True, check=True).stdout.split()
+        return {"items": files, "seconds": float(seconds), "peak_memory": int(peak_memory)}
+
+    if unchanged:
+        execute(output)
+        return lambda: execute(output)
+
+    return lambda: execute(context.get_scratch_directory())
+
+
+# ---------------------------------------------------------------------------
+
+# The script that runs the program and prints its duration in seconds and its peak memory in bytes (-1 if unknown).
+# The program is started by this small process: a child started by the benchmarks would inherit their
+# maximum resident set size, the kernel keeps it across the exec
+MEASURE_SCRIPT: str = """
+import sys, time, subprocess
+start = time.perf_counter()
+subprocess.run(sys.argv[1:], check=True, stdout=subprocess.DEVNULL)
+seconds = time.perf_counter() - start
+try:
+    import resource
+    size = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    print(seconds, size if sys.platform == "darwin" else size * 1024)
+except ImportError:
+    print(seconds, -1)
+"""
+
+# ---------------------------------------------------------------------------
+
+# The benchmarks by name in the order of the stages: (unit of the items, benchmark, traced).
+# The peak memory of the traced benchmarks is measured with tracemalloc, the program runs in another process
+BENCHMARKS: dict[str, tuple[str, Callable[[BenchmarkContext], Run], bool]] = {
+    "discovery": ("files", benchmark_discovery, True),
+    "lexing": ("docblocks", benchmark_lexing, True),
+    "parsing": ("files", benchmark_parsing, True),
+    "getters": ("calls", benchmark_getters, True),
+    "string_pool": ("lookups", benchmark_string_pool, True),
+    "model_memory": ("functions", benchmark_model_memory, False),
+    "rendering": ("pages", benchmark_rendering, True),
+    "writing": ("pages", benchmark_writing, True),
+    "writing_unchanged": ("pages", benchmark_writing_unchanged, True),
+    "serialization": ("files", benchmark_serialization, True),
+    "parse_cache": ("files", benchmark_parse_cache, True),
+    "search_index": ("documents", benchmark_search_index, True),
+    "program": ("files", benchmark_program, False),
+    "program_parallel": ("files", benchmark_program_parallel, False),
+    "program_unchanged": ("files", benchmark_program_unchanged, False)
+}
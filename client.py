@@ -0,0 +1,94 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.client.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Thin client of the CppDocGen server, for editor integrations.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+The client only imports the standard library, so it starts fast:
+the headers are parsed once by the server ('--serve' option of the program).
+
+"""
+
+import sys
+import json
+import socket
+import argparse
+
+# The field of the request that holds the argument of each command
+COMMAND_FIELDS: dict[str, str] = {"symbol": "name", "file": "path", "refresh": "path"}
+
+# ---------------------------------------------------------------------------
+
+
+def send_request(socket_path: str, request: dict) -> dict:
+    """
+    SUMMARY
+    -------
+        This function sends a request to the server and waits for its response.
+
+    PARAMETERS
+    ----------
+        - socket_path (str): The path of the Unix socket of the server
+        - request (dict): The request (see the DocServer class)
+
+    RETURNS
+    -------
+        dict: The response of the server
+
+    RAISES
+    ------
+        - OSError: If the server can't be reached
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        connection.sendall(json.dumps(request).encode("utf-8") + b"\n")
+
+        with connection.makefile('rb') as stream:
+            return json.loads(stream.readline())
+
+
+# ---------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Query a running CppDocGen server")
+    parser.add_argument("socket", type=str, help="The path of the Unix socket of the server")
+    parser.add_argument("command", choices=COMMAND_FIELDS,
+                        help="symbol: render a symbol, file: render a header, refresh: parse a header again")
+    parser.add_argument("argument", type=str, help="The qualified name of the symbol or the path of the header")
+    parser.add_argument("--json", action="store_true", help="Print the raw JSON response")
+
+    args: argparse.Namespace = parser.parse_args()
+    response: dict = send_request(args.socket, {"command": args.command, COMMAND_FIELDS[args.command]: args.argument})
+
+    if args.json:
+        print(json.dumps(response, indent=2))
+    elif not response["ok"]:
+        sys.exit(response["error"])
+    elif args.command == "refresh":
+        print(f"{args.argument} {'removed' if response['removed'] else 'refreshed'}")
+    else:
+        print("\n".join(page["markdown"] for page in response["pages"]), end="")
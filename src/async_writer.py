@@ -0,0 +1,165 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.async_writer.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Runs the writing of the documentation files in a pool of background threads.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import queue
+import threading
+from typing import Callable
+
+# ---------------------------------------------------------------------------
+
+
+class AsyncWriter:
+    """
+    SUMMARY
+    -------
+        This class runs write tasks in a pool of background threads fed by a bounded queue.
+        The main thread only submits the tasks, so rendering overlaps with the (slow) filesystem operations,
+        and it is blocked when the queue is full (the writers are late).
+        The tasks that write the same file run one after the other, in the order they were submitted.
+    """
+
+    def __init__(self, writers: int = 4, queue_size: int = 256) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the constructor of the AsyncWriter class, it starts the writer threads.
+
+        PARAMETERS
+        ----------
+            - writers (int): Optional parameter, the number of writer threads
+            - queue_size (int): Optional parameter, the maximum number of tasks waiting in the queue
+        """
+        self.__tasks: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.__errors: list[tuple[str, Exception]] = list()
+        self.__errors_lock: threading.Lock = threading.Lock()
+        # the event set when the last submitted task of each file is done, while it runs
+        self.__last_tasks: dict[str, threading.Event] = dict()
+        self.__last_tasks_lock: threading.Lock = threading.Lock()
+
+        self.__threads: list[threading.Thread] = [threading.Thread(target=self.__run, name=f"writer-{index}", daemon=True)
+                                                  for index in range(max(1, writers))]
+        for thread in self.__threads:
+            thread.start()
+
+    # ---------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ---------------------------------------------------------------------------
+
+    def submit(self, path: str, task: Callable[[], object]) -> None:
+        """
+        SUMMARY
+        -------
+            This public method queues a write task, it blocks while the queue is full.
+
+        PARAMETERS
+        ----------
+            - path (str): The path of the file written by the task, used to report its errors
+            - task (Callable[[], object]): The function that writes the file
+        """
+        done: threading.Event = threading.Event()
+        with self.__last_tasks_lock:
+            previous: threading.Event | None = self.__last_tasks.get(path)
+            self.__last_tasks[path] = done
+
+        self.__tasks.put((path, task, previous, done))
+
+    # ---------------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """
+        SUMMARY
+        -------
+            This public method waits for all submitted tasks to be done.
+
+        RAISES
+        ------
+            - OSError: If a task failed, with the path of the file (the first error is chained)
+        """
+        self.__tasks.join()
+
+        with self.__errors_lock:
+            errors, self.__errors = self.__errors, list()
+
+        if errors:
+            path, error = errors[0]
+            others: str = f" (and {len(errors) - 1} other files)" if len(errors) > 1 else ""
+            raise OSError(f"Failed to write the file '{path}'{others}: {error}") from error
+
+    # ---------------------------------------------------------------------------
+
+    def close(self) -> None:
+        """
+        SUMMARY
+        -------
+            This public method flushes the submitted tasks, then stops and joins the writer threads.
+
+        RAISES
+        ------
+            - OSError: If a task failed (see the 'flush' method)
+        """
+        try:
+            self.flush()
+        finally:
+            for _ in self.__threads:
+                self.__tasks.put(None)
+            for thread in self.__threads:
+                thread.join()
+
+    # ---------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ---------------------------------------------------------------------------
+
+    def __run(self) -> None:
+        """
+        SUMMARY
+        -------
+            This private method is the loop of a writer thread, it runs the tasks until the stop sentinel (None).
+        """
+        while (item := self.__tasks.get()) is not None:
+            path, task, previous, done = item
+
+            try:
+                # the previous task of the file was queued first, it is already run by another thread
+                if previous is not None:
+                    previous.wait()
+                task()
+            except Exception as error:
+                with self.__errors_lock:
+                    self.__errors.append((path, error))
+            finally:
+                done.set()
+                with self.__last_tasks_lock:
+                    if self.__last_tasks.get(path) is done:
+                        del self.__last_tasks[path]
+                self.__tasks.task_done()
+
+        self.__tasks.task_done()
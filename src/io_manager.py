@@ -31,7 +31,17 @@ This banner notice must not be removed.
 """
 
 import os
+import queue
+import hashlib
+import threading
+from collections import Counter
 from enum import Enum
+from fnmatch import fnmatch
+from time import perf_counter
+from typing import Iterable, Iterator
+
+from src.async_writer import AsyncWriter
+from src.profiler import Profiler, TimedIterator, get_profiler
 
 # ---------------------------------------------------------------------------
 
@@ -52,6 +62,21 @@ class DocFileCategory(Enum):
 
 # ---------------------------------------------------------------------------
 
+# The extensions of the c++ header files to document
+HEADER_EXTENSIONS: tuple[str, ...] = (".h", ".hpp")
+
+# The directories (shell patterns) that are never walked by default (VCS metadata, build and vendored trees)
+DEFAULT_EXCLUDED_DIRS: tuple[str, ...] = (".git", ".svn", ".hg", "build", "cmake-build-*", "out",
+                                          "third_party", "vendor", "external", "node_modules", "__pycache__")
+
+# The maximum number of scanned directories whose headers wait to be consumed, the walkers block beyond
+DISCOVERY_QUEUE_SIZE: int = 64
+
+# The size of the buffer of the documentation files writer, the rendered chunks are only flushed when it is full
+WRITE_BUFFER_SIZE: int = 1 << 20
+
+# ---------------------------------------------------------------------------
+
 
 class IOManager:
     """
@@ -60,17 +85,25 @@ class IOManager:
         This class manages all I/O interactions with the program.
     """
 
-    def __init__(self, input_dir_root: str, output_dir_root: str) -> None:
+    def __init__(self, input_dir_root: str, output_dir_root: str,
+                 excluded_dirs: list[str] = None, walkers: int = 8, writers: int = 4, write_queue_size: int = 256) -> None:
         """
         SUMMARY
         -------
             This public method is the constructor of the IOManager class.
-            It searchs all files in the given input directory and initializes the given output directory.
+            It checks the given input directory and initializes the given output directory.
+            The header files are searched lazily, when the 'get_files' method is iterated.
 
         PARAMETERS
         ----------
             - input_dir_root (str): The path of the input directory
             - output_dir_root (str): The path of the output firectory
+            - excluded_dirs (list[str]): Optional parameter, the directory names (shell patterns) to skip
+                            By default, the DEFAULT_EXCLUDED_DIRS patterns are used
+            - walkers (int): Optional parameter, the number of threads that walk the sibling sub directories
+            - writers (int): Optional parameter, the number of threads that write the files submitted with 'submit_file'
+                     With 0, the submitted files are written synchronously
+            - write_queue_size (int): Optional parameter, the maximum number of submitted files waiting to be written
 
         Raises:
             - FileNotFoundError: If the input directory doesn't exist
@@ -78,28 +111,41 @@ class IOManager:
         if not os.path.isdir(input_dir_root):
             raise FileNotFoundError(f"The directory {input_dir_root} doesn't exist !")
 
-        self.__header_files: list[str] = list()
-        self.__search_all_files(input_dir_root)
+        if excluded_dirs is None:
+            excluded_dirs = list(DEFAULT_EXCLUDED_DIRS)
+
+        self.__input_dir: str = input_dir_root
+        self.__excluded_dirs: list[str] = excluded_dirs
+        self.__walkers: int = max(1, walkers)
 
         self.__output_dir: str = output_dir_root
+        self.__output_dir_absolute: str = os.path.abspath(output_dir_root)
         self.__initialize_doc_directory()
 
+        # the number of documentation files written, skipped (same content on disk) and deleted by category
+        self.__written: Counter = Counter()
+        self.__skipped: Counter = Counter()
+        self.__deleted: Counter = Counter()
+        self.__statistics_lock: threading.Lock = threading.Lock()
+
+        self.__writer: AsyncWriter | None = AsyncWriter(writers, write_queue_size) if writers > 0 else None
+
     # ---------------------------------------------------------------------------
     # GETTERS
     # ---------------------------------------------------------------------------
 
-    def get_files(self) -> list[str]:
+    def get_files(self) -> Iterator[str]:
         """
         SUMMARY
         -------
-            This public method is the getter of the '__header_files' attribute.
-            It returns the list of all c++ header files in the input root directory to process.
+            This public method returns an iterator over all c++ header files in the input root directory to process.
+            The files are yielded as soon as they are found, each call walks the input directory again.
 
         RETURNS
         -------
-            list[str]: All c++ files path
+            Iterator[str]: All c++ files path
         """
-        return self.__header_files
+        return self.__search_all_files(self.__input_dir)
     
     # ---------------------------------------------------------------------------
 
@@ -116,58 +162,326 @@ class IOManager:
         """
         return self.__output_dir
 
+    # ---------------------------------------------------------------------------
+
+    def get_write_statistics(self) -> dict[str, dict[str, int]]:
+        """
+        SUMMARY
+        -------
+            This public method returns the number of documentation files written, skipped and deleted since the creation.
+            The counts are given by category, the files of the output root are counted in the 'root' category.
+
+        RETURNS
+        -------
+            dict[str, dict[str, int]]: key=('written' | 'skipped' | 'deleted'), value=(key=CATEGORY, value=COUNT)
+        """
+        def by_category(counter: Counter) -> dict[str, int]:
+            return {("root" if category is None else category.value): count for category, count in counter.items()}
+
+        return {"written": by_category(self.__written),
+                "skipped": by_category(self.__skipped),
+                "deleted": by_category(self.__deleted)}
+
     # ---------------------------------------------------------------------------
     # PUBLIC METHODS
     # ---------------------------------------------------------------------------
 
-    def create_file(self, name: str, content: list[str], category: DocFileCategory = None) -> None:
+    def create_file(self, name: str, content: Iterable[str], category: DocFileCategory = None,
+                    extension: str = ".md") -> int:
         """
         SUMMARY
         -------
             This public method creates a file in the documentation output directory.
+            The content is streamed through a large write buffer in a temporary file, it is never fully materialized.
+            If the file already exists with the same content, it is left untouched (not rewritten),
+            otherwise the temporary file atomically replaces it.
+
+        PARAMETERS
+        ----------
+            - name (str): The name of the file to create
+            - content (Iterable[str]): The newline-terminated chunks of the markdown content of the file
+            - category (DocFileCategory): Optional parameter, the documentation category of the file
+                       By default, The file is create in the root
+            - extension (str): Optional parameter, the extension of the file, by default a markdown file
+
+        RETURNS
+        -------
+            int: The number of bytes written, 0 if the file was already up to date
+        """
+        profiler: Profiler | None = get_profiler()
+        if profiler is not None:
+            # the time of a lazy rendering is measured apart (see Profiler.time_content)
+            start: float = perf_counter()
+            content = TimedIterator(content)
+
+        complete_file_path: str = self.__get_file_path(name, category, extension)
+        # unique per writer: two headers can submit the same page (see BuildManifest.is_owner)
+        temporary_path: str = f"{complete_file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        content_hash = hashlib.sha256()
+        written: int = 0
+
+        try:
+            with open(temporary_path, 'wb', buffering=WRITE_BUFFER_SIZE) as file:
+                for chunk in content:
+                    data: bytes = chunk.encode("utf-8")
+                    content_hash.update(data)
+                    written += file.write(data)
+
+            unchanged: bool = self.__has_content(complete_file_path, written, content_hash.digest())
+            if unchanged:
+                os.remove(temporary_path)
+                written = 0
+            else:
+                os.replace(temporary_path, complete_file_path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+        with self.__statistics_lock:
+            (self.__skipped if unchanged else self.__written)[category] += 1
+
+        if profiler is not None:
+            profiler.add_time("write", perf_counter() - start - content.get_seconds())
+            profiler.add_count("bytes_written", written)
+
+        return written
+
+    # ---------------------------------------------------------------------------
+
+    def submit_file(self, name: str, content: Iterable[str], category: DocFileCategory = None,
+                    extension: str = ".md") -> None:
+        """
+        SUMMARY
+        -------
+            This public method queues the creation of a file (see 'create_file') for the background writer threads.
+            The content is consumed by the writer thread, so a lazy rendering overlaps with the I/O of the other files.
+            The errors are raised by the 'flush' or 'close' methods.
 
         PARAMETERS
         ----------
             - name (str): The name of the file to create
-            - content (str): The markdown content of the file
+            - content (Iterable[str]): The newline-terminated chunks of the markdown content of the file
             - category (DocFileCategory): Optional parameter, the documentation category of the file
                        By default, The file is create in the root
+            - extension (str): Optional parameter, the extension of the file, by default a markdown file
+        """
+        if self.__writer is None:
+            self.create_file(name, content, category, extension)
+        else:
+            self.__writer.submit(self.__get_file_path(name, category, extension),
+                                 lambda: self.create_file(name, content, category, extension))
+
+    # ---------------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """
+        SUMMARY
+        -------
+            This public method waits for all files submitted with 'submit_file' to be written.
 
         RAISES
         ------
-            - FileExistsError: Raise if the file to create already exists
+            - OSError: If a submitted file couldn't be written, with its path
         """
-        if category is None:
-            complete_file_path = os.path.join(self.__output_dir, name + ".md")
-        else:
-            complete_file_path = os.path.join(self.__output_dir, category.value, name + ".md")
+        if self.__writer is not None:
+            self.__writer.flush()
+
+    # ---------------------------------------------------------------------------
+
+    def close(self) -> None:
+        """
+        SUMMARY
+        -------
+            This public method writes the remaining submitted files and stops the writer threads.
+
+        RAISES
+        ------
+            - OSError: If a submitted file couldn't be written, with its path
+        """
+        if self.__writer is not None:
+            writer, self.__writer = self.__writer, None
+            writer.close()
+
+    # ---------------------------------------------------------------------------
+
+    def delete_file(self, name: str, category: DocFileCategory = None) -> None:
+        """
+        SUMMARY
+        -------
+            This public method deletes a file of the documentation output directory, if it exists.
+
+        PARAMETERS
+        ----------
+            - name (str): The name of the file to delete
+            - category (DocFileCategory): Optional parameter, the documentation category of the file
+                       By default, The file is searched in the root
+        """
+        try:
+            os.remove(self.__get_file_path(name, category))
+            with self.__statistics_lock:
+                self.__deleted[category] += 1
+        except FileNotFoundError:
+            pass
+
+    # ---------------------------------------------------------------------------
+
+    def scan_directory(self, directory: str) -> tuple[list[str], list[str]]:
+        """
+        SUMMARY
+        -------
+            This public method scans one directory of the input tree, without entering its sub directories.
+            The excluded directories and the output directory are left out.
+
+        PARAMETERS
+        ----------
+            - directory (str): The path of the directory to scan
+
+        RETURNS
+        -------
+            tuple[list[str], list[str]]: The path of the header files and of the sub directories to walk
+        """
+        profiler: Profiler | None = get_profiler()
+        start: float = perf_counter() if profiler is not None else 0.0
+
+        headers: list[str] = list()
+        sub_directories: list[str] = list()
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if any(fnmatch(entry.name, pattern) for pattern in self.__excluded_dirs):
+                            continue
+                        if os.path.abspath(entry.path) == self.__output_dir_absolute:
+                            continue
 
-        if os.path.exists(complete_file_path):
-            raise FileExistsError(f"The file '{complete_file_path}' already exists !")
-        
-        with open(complete_file_path, 'w') as file:
-            file.writelines(content)
+                        sub_directories.append(entry.path)
+
+                    elif os.path.splitext(entry.name)[1].lower() in HEADER_EXTENSIONS and entry.is_file():
+                        headers.append(entry.path)
+        except OSError:
+            # unreadable or removed directories are skipped, as os.walk does
+            pass
+
+        if profiler is not None:
+            profiler.add_time("discover", perf_counter() - start)
+            profiler.add_count("headers_discovered", len(headers))
+
+        return headers, sub_directories
 
     # ---------------------------------------------------------------------------
     # PRIVATE METHODS
     # ---------------------------------------------------------------------------
 
-    def __search_all_files(self, dir_root: str) -> None:
+    def __get_file_path(self, name: str, category: DocFileCategory | None, extension: str = ".md") -> str:
+        """
+        SUMMARY
+        -------
+            This private method returns the path of a documentation file in the output directory.
+
+        PARAMETERS
+        ----------
+            - name (str): The name of the file (without extension)
+            - category (DocFileCategory | None): The documentation category of the file, None for the root
+            - extension (str): Optional parameter, the extension of the file, by default a markdown file
+
+        RETURNS
+        -------
+            str: The complete path of the file
+        """
+        if category is None:
+            return os.path.join(self.__output_dir, name + extension)
+
+        return os.path.join(self.__output_dir, category.value, name + extension)
+
+    # ---------------------------------------------------------------------------
+
+    @staticmethod
+    def __has_content(path: str, size: int, digest: bytes) -> bool:
+        """
+        SUMMARY
+        -------
+            This private static method checks if a file exists with the given content.
+            The sizes are compared first, the file is only read and hashed if they are equal.
+
+        PARAMETERS
+        ----------
+            - path (str): The path of the file
+            - size (int): The size of the content in bytes
+            - digest (bytes): The sha256 digest of the content
+
+        RETURNS
+        -------
+            bool: True if the file has exactly this content
+        """
+        try:
+            if os.stat(path).st_size != size:
+                return False
+
+            with open(path, 'rb') as file:
+                return hashlib.file_digest(file, "sha256").digest() == digest
+        except FileNotFoundError:
+            return False
+
+    # ---------------------------------------------------------------------------
+
+    def __search_all_files(self, dir_root: str) -> Iterator[str]:
         """
         SUMMARY
         -------
             This private methods finds all c++ header files in the given directory.
+            The sibling sub directories are scanned in parallel by a pool of walker threads,
+            the excluded directories and the output directory are pruned without being entered.
+            The walkers are blocked when too many headers wait to be consumed (backpressure).
 
         PARAMETERS
         ----------
             - dir_root (str): The path of the directory where to look
-        """
-        for root, _, files in os.walk(dir_root):
-            for file in files:
-                _, file_extension: str = os.path.splitext(file)
 
-                if file_extension.lower() in (".h", ".hpp"):
-                    self.__header_files.append(os.path.join(root, files))
+        RETURNS
+        -------
+            Iterator[str]: The path of each header file, in discovery order
+        """
+        directories: queue.Queue = queue.Queue()
+        results: queue.Queue = queue.Queue(maxsize=DISCOVERY_QUEUE_SIZE)
+        stop: threading.Event = threading.Event()
+
+        def walk() -> None:
+            while (directory := directories.get()) is not None:
+                try:
+                    if not stop.is_set():
+                        headers, sub_directories = self.scan_directory(directory)
+                        for sub_directory in sub_directories:
+                            directories.put(sub_directory)
+                        if headers:
+                            results.put(headers)
+                finally:
+                    directories.task_done()
+
+        def monitor() -> None:
+            directories.join()
+
+            for _ in range(self.__walkers):
+                directories.put(None)
+            results.put(None)
+
+        directories.put(dir_root)
+        for _ in range(self.__walkers):
+            threading.Thread(target=walk, daemon=True).start()
+        threading.Thread(target=monitor, daemon=True).start()
+
+        headers: list[str] | None = []
+
+        try:
+            while (headers := results.get()) is not None:
+                yield from headers
+        finally:
+            # stopped early: the walkers blocked on the full queue are released, then they skip the remaining directories
+            stop.set()
+            while headers is not None:
+                headers = results.get()
 
     # ---------------------------------------------------------------------------
 
@@ -176,8 +490,7 @@ class IOManager:
         SUMMARY
         -------
             This private method creates the output directory and all sub directories for each file category.
+            The directories that already exist (previous run) are kept.
         """
-        os.mkdir(self.__output_dir)
-
         for category in DocFileCategory:
-            os.mkdir(category.value)
+            os.makedirs(os.path.join(self.__output_dir, category.value), exist_ok=True)
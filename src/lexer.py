@@ -0,0 +1,219 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.lexer.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Lexes the content of a docblock into tags in a single pass.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import re
+from typing import Callable
+
+from src.modelization import TagKeys, Tag, TypedTag, ParameterTag, StringPool
+
+# The version of the lexer, changes when the same docblock gives other tags (used to invalidate the parse caches)
+LEXER_VERSION: int = 1
+
+# a docblock line: the leading spaces and '*' are skipped, then an optional '@key' and the text
+LINE_PATTERN: re.Pattern = re.compile(r"[ \t]*\**[ \t]*(?:@(\w+)[ \t]*)?(.*?)[ \t\r]*$", re.MULTILINE)
+
+# @param {name} {type} {hints} description (the name can be a bare word, doxygen style)
+PARAMETER_PATTERN: re.Pattern = re.compile(
+    r"(?:\{(?P<name>[^}]*)\}|(?P<bare>[^\s{]+))?\s*(?:\{(?P<type>[^}]*)\}\s*)?(?:\{(?P<hints>[^}]*)\}\s*)?(?P<value>.*)")
+
+# @throw {type} description (the type can be a bare word, doxygen style)
+EXCEPTION_PATTERN: re.Pattern = re.compile(r"(?:\{(?P<type>[^}]*)\}|(?P<bare>[^\s{]+))?\s*(?P<value>.*)")
+
+# @return {type} description
+RETURN_PATTERN: re.Pattern = re.compile(r"(?:\{(?P<type>[^}]*)\}\s*)?(?P<value>.*)")
+
+# @file, @class... {name} or name
+NAME_PATTERN: re.Pattern = re.compile(r"(?:\{([^}]*)\}|([^\s{]+))?")
+
+HINTS_SEPARATOR: re.Pattern = re.compile(r"[,\s]+")
+
+# ---------------------------------------------------------------------------
+
+
+def _build_parameter(key: TagKeys, text: str, pool: StringPool) -> ParameterTag:
+    """
+    SUMMARY
+    -------
+        This private function builds a parameter tag: @param {name} {type} {hints} description.
+        The type, the name and the hints repeat across the functions, they are interned.
+    """
+    match: re.Match = PARAMETER_PATTERN.match(text)
+    name, bare, type, hints, value = match.group("name", "bare", "type", "hints", "value")
+
+    return ParameterTag(key, value, pool.intern(type.strip() if type is not None else None),
+                        pool.intern(name.strip() if name is not None else bare),
+                        pool.intern_all(hint for hint in HINTS_SEPARATOR.split(hints) if hint) if hints else None)
+
+
+# ---------------------------------------------------------------------------
+
+
+def _build_exception(key: TagKeys, text: str, pool: StringPool) -> TypedTag:
+    """
+    SUMMARY
+    -------
+        This private function builds an exception tag: @throw {type} description, the type is interned.
+    """
+    match: re.Match = EXCEPTION_PATTERN.match(text)
+    type: str | None = match.group("type")
+
+    return TypedTag(key, match.group("value"), pool.intern(type.strip() if type is not None else match.group("bare")))
+
+
+# ---------------------------------------------------------------------------
+
+
+def _build_return(key: TagKeys, text: str, pool: StringPool) -> TypedTag:
+    """
+    SUMMARY
+    -------
+        This private function builds a return tag: @return {type} description, the type is interned.
+    """
+    match: re.Match = RETURN_PATTERN.match(text)
+    type: str | None = match.group("type")
+
+    return TypedTag(key, match.group("value"), pool.intern(type.strip() if type is not None else None))
+
+
+# ---------------------------------------------------------------------------
+
+
+def _build_name(key: TagKeys, text: str, pool: StringPool) -> Tag:
+    """
+    SUMMARY
+    -------
+        This private function builds a tag that declares the kind and the name of the documented symbol: @class {name}.
+    """
+    braced, bare = NAME_PATTERN.match(text).groups()
+    return Tag(key, braced.strip() if braced is not None else bare or "")
+
+
+# ---------------------------------------------------------------------------
+
+
+def _build_brief(key: TagKeys, text: str, pool: StringPool) -> Tag:
+    """
+    SUMMARY
+    -------
+        This private function builds a description tag, its value is the list of its lines.
+    """
+    return Tag(key, [text] if text else None)
+
+
+# ---------------------------------------------------------------------------
+
+
+def _build_text(key: TagKeys, text: str, pool: StringPool) -> Tag:
+    """
+    SUMMARY
+    -------
+        This private function builds a simple tag with a one line value: @author text.
+    """
+    return Tag(key, text)
+
+
+# ---------------------------------------------------------------------------
+
+# The tag builder of each key, the tag keys are dispatched with one dictionary lookup
+BUILDERS: dict[TagKeys, Callable[[TagKeys, str, StringPool], Tag]] = {
+    TagKeys.FILE: _build_name,
+    TagKeys.NAMESPACE: _build_name,
+    TagKeys.CLASS: _build_name,
+    TagKeys.ENUMERATION: _build_name,
+    TagKeys.METHOD: _build_name,
+    TagKeys.FUNCTION: _build_name,
+    TagKeys.AUTHOR: _build_text,
+    TagKeys.VERSION: _build_text,
+    TagKeys.BRIEF: _build_brief,
+    TagKeys.PARAMETER: _build_parameter,
+    TagKeys.EXCEPTION: _build_exception,
+    TagKeys.RETURN: _build_return
+}
+
+# The tags that name the documented symbol, their value ends at their line: the lines that follow them are a summary
+NAME_KEYS: frozenset[TagKeys] = frozenset(key for key, builder in BUILDERS.items() if builder is _build_name)
+
+# ---------------------------------------------------------------------------
+
+
+def lex_docblock(block: str, pool: StringPool = None) -> list[Tag]:
+    """
+    SUMMARY
+    -------
+        This public function lexes the content of a docblock (without the /** and */ delimiters) in a single pass.
+        The text before the first tag is a @brief tag, the lines without tag continue the value of the previous tag,
+        except after a tag that names the symbol (see NAME_KEYS): they start a @brief tag.
+        The lines of unknown tags are ignored.
+
+    PARAMETERS
+    ----------
+        - block (str): The content of the docblock
+        - pool (StringPool): Optional parameter, the pool of the types, hints and parameter names,
+                             by default they are only interned within the docblock
+
+    RETURNS
+    -------
+        list[Tag]: The tags of the docblock in declaration order, @brief values are lists of lines
+    """
+    if pool is None:
+        pool = StringPool()
+
+    tags: list[Tag] = list()
+    current: Tag | None = None
+    ignored: bool = False
+
+    for key_name, text in LINE_PATTERN.findall(block):
+        if key_name:
+            key: TagKeys | None = TagKeys.from_string(key_name)
+            ignored = key is None
+            if ignored:
+                continue
+
+            current = BUILDERS[key](key, text, pool)
+            tags.append(current)
+            if key in NAME_KEYS:
+                current = None
+
+        elif not text or ignored:
+            continue
+
+        elif current is None:
+            current = Tag(TagKeys.BRIEF, [text])
+            tags.append(current)
+
+        elif isinstance(current.get_value(), list):
+            current.set_value([text])
+
+        else:
+            current.set_value(f"{current.get_value()} {text}" if current.get_value() else text)
+
+    return tags
@@ -0,0 +1,528 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.manifest.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Records the state of the last run to only rebuild the changed headers.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import os
+import json
+import hashlib
+from typing import Iterable, Iterator
+
+from src.io_manager import DocFileCategory
+from src.search_index import Document
+
+# The name of the manifest file stored in the output directory
+MANIFEST_NAME: str = ".cppdocgen-manifest.json"
+
+# The version of the manifest format and of the generated pages, a mismatch forces a full rebuild
+MANIFEST_VERSION: int = 5
+
+# The key of the namespace pages record, they are rendered from all headers
+NAMESPACES_RECORD: str = "<namespaces>"
+
+# A documentation page: (category, page name)
+PageId = tuple[DocFileCategory, str]
+
+# ---------------------------------------------------------------------------
+
+
+def hash_file(path: str) -> str:
+    """
+    SUMMARY
+    -------
+        This public function computes the content hash of a file.
+
+    PARAMETERS
+    ----------
+        - path (str): The path of the file
+
+    RETURNS
+    -------
+        str: The hexadecimal sha256 digest of the file content
+    """
+    with open(path, 'rb') as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+# ---------------------------------------------------------------------------
+
+
+class BuildManifest:
+    """
+    SUMMARY
+    -------
+        This class is the manifest of the documentation output directory.
+        For each header, it records its size, modification time and content hash, the pages generated from it
+        and the names its pages reference or mention, so a new run only parses and renders the changed headers,
+        deletes the pages of the removed ones and finds the pages whose links changed.
+    """
+
+    def __init__(self, input_dir_root: str, output_dir_root: str, force: bool = False) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the constructor of the BuildManifest class.
+            It loads the manifest of the previous run, ignored if it has another version or another output path.
+
+        PARAMETERS
+        ----------
+            - input_dir_root (str): The path of the input directory
+            - output_dir_root (str): The path of the output directory
+            - force (bool): Optional parameter, ignores the previous manifest to rebuild all headers
+        """
+        self.__input_dir: str = input_dir_root
+        self.__output_dir: str = os.path.abspath(output_dir_root)
+        self.__path: str = os.path.join(output_dir_root, MANIFEST_NAME)
+
+        self.__records: dict[str, dict] = dict()
+        self.__pending: dict[str, tuple[int, int, str]] = dict()
+        self.__seen: set[str] = set()
+        # the recorded headers that generate each page (category value, page name), a page is only deleted
+        # once no header generates it. The keys are the strings of the records, converted only when returned
+        self.__owners: dict[tuple[str, str], set[str]] = dict()
+        # the headers that became the owner of a page after its previous owner stopped generating it
+        self.__reassigned: set[str] = set()
+        # the records changed since the manifest was loaded or saved, an unchanged manifest isn't written again
+        self.__changed: bool = True
+
+        if not force:
+            self.__load()
+
+    # ---------------------------------------------------------------------------
+    # GETTERS
+    # ---------------------------------------------------------------------------
+
+    def is_changed(self) -> bool:
+        """
+        SUMMARY
+        -------
+            This public method returns whether the records changed since the manifest was loaded or saved.
+
+        RETURNS
+        -------
+            bool: True if the manifest file must be written again
+        """
+        return self.__changed
+
+    # ---------------------------------------------------------------------------
+
+    def get_relative_path(self, path: str) -> str:
+        """
+        SUMMARY
+        -------
+            This public method returns the key of a header file in the manifest.
+
+        PARAMETERS
+        ----------
+            - path (str): The path of the header file
+
+        RETURNS
+        -------
+            str: The path of the header, relative to the input directory ('/' separated)
+        """
+        return os.path.relpath(path, self.__input_dir).replace(os.sep, "/")
+
+    # ---------------------------------------------------------------------------
+
+    def is_owner(self, relative_path: str, page: PageId) -> bool:
+        """
+        SUMMARY
+        -------
+            This public method checks if a header writes a page it generates. A class or an enumeration
+            documented in several headers has a single page: it is written by the header with the smallest path,
+            so its content doesn't depend on the order of the headers.
+
+        PARAMETERS
+        ----------
+            - relative_path (str): The path of the header, relative to the input directory ('/' separated)
+            - page (PageId): The page generated by the header
+
+        RETURNS
+        -------
+            bool: True if no other recorded header with a smaller path generates the page
+        """
+        return all(owner >= relative_path for owner in self.__owners.get((page[0].value, page[1]), ()))
+
+    # ---------------------------------------------------------------------------
+
+    def get_duplicates(self) -> dict[PageId, list[str]]:
+        """
+        SUMMARY
+        -------
+            This public method returns the pages generated by several headers, only the first one writes them.
+
+        RETURNS
+        -------
+            dict[PageId, list[str]]: The sorted paths of the headers that generate each duplicated page
+        """
+        return {(DocFileCategory(category), name): sorted(owners)
+                for (category, name), owners in self.__owners.items() if len(owners) > 1}
+
+    # ---------------------------------------------------------------------------
+
+    def take_reassigned(self) -> list[str]:
+        """
+        SUMMARY
+        -------
+            This public method returns and clears the headers that became the owner of a page (see 'is_owner')
+            since they were rendered, they must be rendered again to write it.
+
+        RETURNS
+        -------
+            list[str]: The sorted paths of the headers, relative to the input directory ('/' separated)
+        """
+        reassigned: list[str] = sorted(path for path in self.__reassigned if path in self.__records)
+        self.__reassigned.clear()
+
+        return reassigned
+
+    # ---------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ---------------------------------------------------------------------------
+
+    def select_changed(self, files: Iterable[str]) -> Iterator[str]:
+        """
+        SUMMARY
+        -------
+            This public method filters the given header files to only keep the new and changed ones.
+            A header is unchanged if its size and modification time are the same as in the manifest,
+            or if its content hash is the same (the file was only touched).
+            A header removed since it was listed is skipped and handled as removed (see 'get_removed').
+
+        PARAMETERS
+        ----------
+            - files (Iterable[str]): The path of all header files of the input directory
+
+        RETURNS
+        -------
+            Iterator[str]: The path of the header files to parse again
+        """
+        for path in files:
+            relative_path: str = self.get_relative_path(path)
+            record: dict | None = self.__records.get(relative_path)
+
+            try:
+                stat: os.stat_result = os.stat(path)
+                if record is not None and record["size"] == stat.st_size and record["mtime"] == stat.st_mtime_ns:
+                    self.__seen.add(relative_path)
+                    continue
+
+                content_hash: str = hash_file(path)
+            except FileNotFoundError:
+                continue
+
+            self.__seen.add(relative_path)
+            if record is not None and record["hash"] == content_hash:
+                record["mtime"] = stat.st_mtime_ns
+                self.__changed = True
+                continue
+
+            self.__pending[relative_path] = (stat.st_size, stat.st_mtime_ns, content_hash)
+            yield path
+
+    # ---------------------------------------------------------------------------
+
+    def record(self, relative_path: str, pages: list[PageId], namespaces: dict[str, list[str]],
+               symbols: list[tuple[str, str, str]], references: list[str], mentions: list[str],
+               summaries: list[str]) -> list[PageId]:
+        """
+        SUMMARY
+        -------
+            This public method records a parsed and rendered header file.
+
+        PARAMETERS
+        ----------
+            - relative_path (str): The path of the header, relative to the input directory ('/' separated)
+            - pages (list[PageId]): The pages generated from the header
+            - namespaces (dict[str, list[str]]): The namespaces documented in the header (see NamespaceIndex.get_entries)
+            - symbols (list[tuple[str, str, str]]): The symbols of the header (see NamespaceIndex.get_entries)
+            - references (list[str]): The names referenced by the pages of the header (see get_references)
+            - mentions (list[str]): The names that could mention a type in the pages of the header (see get_type_mentions)
+            - summaries (list[str]): The summary of each symbol of the header (see SearchIndex.get_summaries)
+
+        RETURNS
+        -------
+            list[PageId]: The pages generated by the previous run that no header generates anymore, to delete
+        """
+        size, mtime, content_hash = self.__pending.pop(relative_path)
+        stale_pages: list[PageId] = self.__replace_pages(relative_path, pages)
+        # just rendered with the current owners
+        self.__reassigned.discard(relative_path)
+
+        self.__changed = True
+        self.__records[relative_path] = {
+            "size": size, "mtime": mtime, "hash": content_hash,
+            "pages": [[category.value, name] for category, name in pages],
+            "namespaces": namespaces, "symbols": symbols,
+            "references": references, "mentions": mentions, "summaries": summaries
+        }
+
+        return stale_pages
+
+    # ---------------------------------------------------------------------------
+
+    def get_removed(self) -> list[str]:
+        """
+        SUMMARY
+        -------
+            This public method returns the recorded headers that weren't found by this run
+            ('select_changed' is fully iterated), they must be forgotten.
+
+        RETURNS
+        -------
+            list[str]: The path of the removed headers, relative to the input directory ('/' separated)
+        """
+        return [path for path in self.__records if path not in self.__seen and path != NAMESPACES_RECORD]
+
+    # ---------------------------------------------------------------------------
+
+    def forget(self, relative_path: str) -> list[PageId]:
+        """
+        SUMMARY
+        -------
+            This public method forgets a removed header file.
+
+        PARAMETERS
+        ----------
+            - relative_path (str): The path of the header, relative to the input directory ('/' separated)
+
+        RETURNS
+        -------
+            list[PageId]: The pages generated from the header and by no other header, to delete
+        """
+        stale_pages: list[PageId] = self.__replace_pages(relative_path, list())
+        self.__records.pop(relative_path, None)
+        self.__changed = True
+        self.__seen.discard(relative_path)
+
+        return stale_pages
+
+    # ---------------------------------------------------------------------------
+
+    def get_entries(self, relative_path: str) -> tuple[dict[str, list[str]], list[tuple[str, str, str]]] | None:
+        """
+        SUMMARY
+        -------
+            This public method returns the namespace entries recorded for a header file.
+
+        PARAMETERS
+        ----------
+            - relative_path (str): The path of the header, relative to the input directory ('/' separated)
+
+        RETURNS
+        -------
+            tuple[dict[str, list[str]], list[tuple[str, str, str]]] | None: The (namespaces, symbols) of the header,
+                None if the header isn't recorded
+        """
+        record: dict | None = self.__records.get(relative_path)
+        if record is None or relative_path == NAMESPACES_RECORD:
+            return None
+
+        return record["namespaces"], [tuple(symbol) for symbol in record["symbols"]]
+
+    # ---------------------------------------------------------------------------
+
+    def get_namespace_entries(self) -> Iterator[tuple[dict[str, list[str]], list[tuple[str, str, str]]]]:
+        """
+        SUMMARY
+        -------
+            This public method returns the namespace entries of all recorded headers, changed or not.
+
+        RETURNS
+        -------
+            Iterator[tuple[dict[str, list[str]], list[tuple[str, str, str]]]]: The (namespaces, symbols) of each header
+        """
+        for relative_path, record in self.__records.items():
+            if relative_path != NAMESPACES_RECORD:
+                yield record["namespaces"], [tuple(symbol) for symbol in record["symbols"]]
+
+    # ---------------------------------------------------------------------------
+
+    def get_symbol_names(self) -> set[str]:
+        """
+        SUMMARY
+        -------
+            This public method returns the qualified name of the symbols of all recorded headers, and their paths,
+            the names a reference can resolve to (see SymbolTable.resolve) without building the symbol table.
+
+        RETURNS
+        -------
+            set[str]: The names of the documented symbols
+        """
+        return {symbol[1] for relative_path, record in self.__records.items() if relative_path != NAMESPACES_RECORD
+                for symbol in record["symbols"]}
+
+    # ---------------------------------------------------------------------------
+
+    def get_documents(self, relative_path: str = None) -> Iterator[Document]:
+        """
+        SUMMARY
+        -------
+            This public method returns the search index documents of a recorded header, or of all recorded headers.
+
+        PARAMETERS
+        ----------
+            - relative_path (str): Optional parameter, the path of the header, relative to the input directory
+                          By default, the documents of all headers are returned
+
+        RETURNS
+        -------
+            Iterator[Document]: The (category value, qualified name, page name, summary) of each symbol
+        """
+        if relative_path is None:
+            records: Iterable[dict] = (record for path, record in self.__records.items() if path != NAMESPACES_RECORD)
+        else:
+            records = (self.__records[relative_path],) if relative_path in self.__records else ()
+
+        for record in records:
+            for (category, name, page), summary in zip(record["symbols"], record["summaries"]):
+                yield category, name, page, summary
+
+    # ---------------------------------------------------------------------------
+
+    def get_references(self) -> Iterator[tuple[str, list[str], list[str]]]:
+        """
+        SUMMARY
+        -------
+            This public method returns the names referenced and mentioned by the pages of all recorded headers,
+            changed or not.
+
+        RETURNS
+        -------
+            Iterator[tuple[str, list[str], list[str]]]: The (relative path, referenced names, mentioned names)
+                of each header
+        """
+        for relative_path, record in self.__records.items():
+            if relative_path != NAMESPACES_RECORD:
+                yield relative_path, record["references"], record["mentions"]
+
+    # ---------------------------------------------------------------------------
+
+    def record_namespace_pages(self, pages: list[PageId]) -> list[PageId]:
+        """
+        SUMMARY
+        -------
+            This public method records the namespace pages, generated from all headers.
+
+        PARAMETERS
+        ----------
+            - pages (list[PageId]): The namespace pages generated by this run
+
+        RETURNS
+        -------
+            list[PageId]: The namespace pages generated by the previous run that no longer exist, to delete
+        """
+        stale_pages: list[PageId] = self.__replace_pages(NAMESPACES_RECORD, pages)
+        self.__records[NAMESPACES_RECORD] = {"pages": [[category.value, name] for category, name in pages]}
+        self.__changed = True
+        self.__seen.add(NAMESPACES_RECORD)
+
+        return stale_pages
+
+    # ---------------------------------------------------------------------------
+
+    def save(self) -> None:
+        """
+        SUMMARY
+        -------
+            This public method writes the manifest in the output directory.
+            The file is replaced atomically, an interrupted run keeps the previous manifest.
+        """
+        temporary_path: str = self.__path + ".tmp"
+
+        # 'dumps' uses the C encoder, 'dump' encodes with the pure python one to stream the chunks
+        content: str = json.dumps({"version": MANIFEST_VERSION, "output": self.__output_dir, "headers": self.__records},
+                                  separators=(",", ":"))
+
+        with open(temporary_path, 'w', encoding="utf-8") as file:
+            file.write(content)
+
+        os.replace(temporary_path, self.__path)
+        self.__changed = False
+
+    # ---------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ---------------------------------------------------------------------------
+
+    def __load(self) -> None:
+        """
+        SUMMARY
+        -------
+            This private method loads the manifest of the previous run, if it exists and is compatible.
+        """
+        try:
+            with open(self.__path, 'r', encoding="utf-8") as file:
+                content: dict = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+
+        if content.get("version") == MANIFEST_VERSION and content.get("output") == self.__output_dir:
+            self.__records = content["headers"]
+            self.__changed = False
+
+        for relative_path, record in self.__records.items():
+            for category, name in record["pages"]:
+                self.__owners.setdefault((category, name), set()).add(relative_path)
+
+    # ---------------------------------------------------------------------------
+
+    def __replace_pages(self, relative_path: str, pages: list[PageId]) -> list[PageId]:
+        """
+        SUMMARY
+        -------
+            This private method replaces the pages recorded for a header with the given new pages.
+            It returns the old pages that no other header generates: a page generated by another header too
+            (a renamed header, or a class documented in two headers) is kept, and its new owner is reassigned
+            if the header wrote it.
+        """
+        record: dict | None = self.__records.get(relative_path)
+        old_pages: list[tuple[str, str]] = list() if record is None else [(category, name)
+                                                                          for category, name in record["pages"]]
+
+        new_pages: set[tuple[str, str]] = {(category.value, name) for category, name in pages}
+        for page in new_pages:
+            self.__owners.setdefault(page, set()).add(relative_path)
+
+        stale_pages: list[PageId] = list()
+        for page in old_pages:
+            if page in new_pages:
+                continue
+
+            owners: set[str] = self.__owners.get(page, set())
+            owned: bool = bool(owners) and min(owners) == relative_path
+            owners.discard(relative_path)
+
+            if not owners:
+                self.__owners.pop(page, None)
+                stale_pages.append((DocFileCategory(page[0]), page[1]))
+            elif owned:
+                self.__reassigned.add(min(owners))
+
+        return stale_pages
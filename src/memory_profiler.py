@@ -0,0 +1,189 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.memory_profiler.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Measures the memory held at each stage boundary of a run, for the --profile-memory report.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import gc
+import json
+import tracemalloc
+from collections import Counter
+
+from src.modelization import Tag, TypedTag, ParameterTag, FunctionDesc, EnumDesc, FileDesc
+from src.profiler import DEFAULT_SLOWEST, PROFILE_VERSION
+
+# The classes of the model whose live instances are counted at each memory snapshot
+MODEL_CLASSES: tuple[type, ...] = (Tag, TypedTag, ParameterTag, FunctionDesc, EnumDesc, FileDesc)
+
+# The allocations of the profiling itself and of the imports, left out of the memory snapshots
+SNAPSHOT_FILTERS: tuple[tracemalloc.Filter, ...] = (tracemalloc.Filter(False, tracemalloc.__file__),
+                                                    tracemalloc.Filter(False, __file__),
+                                                    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                                                    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+                                                    tracemalloc.Filter(False, "<unknown>"))
+
+# What each snapshot covers, the pages of a header are rendered as soon as it is parsed so the stages interleave
+STAGE_NOTES: dict[str, str] = {
+    "discovery": "the walk of the input directory and the selection of the changed headers, drained before parsing",
+    "parsing": "the parsed headers and their pages, rendered and written by the writer threads meanwhile",
+    "rendering": "the pages of the dependents and of the namespaces, and the saved manifest"
+}
+
+# ---------------------------------------------------------------------------
+
+
+class MemoryProfiler:
+    """
+    SUMMARY
+    -------
+        This class traces the memory allocations of the process (see tracemalloc) and takes a snapshot
+        at each stage boundary of a run: the memory traced and its peak during the stage, the largest allocation sites,
+        the sites that grew the most since the previous snapshot and the live instances of each class of the model.
+        Tracing slows the run down, and the allocations of the parsing processes (see --jobs) aren't traced.
+    """
+
+    def __init__(self, top: int = DEFAULT_SLOWEST, frames: int = 1) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the constructor of the MemoryProfiler class, it starts tracing the allocations.
+
+        PARAMETERS
+        ----------
+            - top (int): Optional parameter, the number of allocation sites reported at each snapshot
+            - frames (int): Optional parameter, the number of frames stored for each allocation
+        """
+        self.__top: int = top
+        self.__frames: int = frames
+        self.__snapshots: list[dict] = list()
+        # key=allocation site, value=(size, count) at the previous snapshot
+        self.__previous: dict[str, tuple[int, int]] = dict()
+
+        tracemalloc.start(frames)
+
+    # ---------------------------------------------------------------------------
+    # GETTERS
+    # ---------------------------------------------------------------------------
+
+    def get_report(self) -> dict:
+        """
+        SUMMARY
+        -------
+            This public method builds the JSON document of the memory profile.
+
+        RETURNS
+        -------
+            dict: The document, with the snapshot of each stage in the order they were taken
+        """
+        return {"version": PROFILE_VERSION, "frames": self.__frames, "stages": list(self.__snapshots)}
+
+    # ---------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ---------------------------------------------------------------------------
+
+    def snapshot(self, stage: str) -> None:
+        """
+        SUMMARY
+        -------
+            This public method takes the snapshot of a stage boundary, the garbage is collected first
+            so only the live objects are counted. The peak is then reset for the next stage.
+
+        PARAMETERS
+        ----------
+            - stage (str): The name of the stage that just ended
+        """
+        gc.collect()
+        traced, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        # only the statistics are kept, a snapshot of a large run holds millions of traces
+        statistics: list[tracemalloc.Statistic] = (tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+                                                   .statistics("lineno" if self.__frames == 1 else "traceback"))
+        sites: dict[str, tuple[int, int]] = {_format_site(statistic.traceback): (statistic.size, statistic.count)
+                                             for statistic in statistics}
+
+        growth: list[tuple[int, int, str]] = sorted(((size - self.__previous.get(site, (0, 0))[0],
+                                                      count - self.__previous.get(site, (0, 0))[1], site)
+                                                     for site, (size, count) in sites.items()), reverse=True)
+        instances: Counter = Counter(map(type, gc.get_objects()))
+
+        self.__snapshots.append({
+            "stage": stage,
+            "covers": STAGE_NOTES.get(stage, ""),
+            "traced_bytes": traced,
+            "peak_bytes": peak,
+            "top_sites": [{"site": site, "size": size, "count": count}
+                          for site, (size, count) in list(sites.items())[:self.__top]],
+            "growth": [{"site": site, "size_diff": size, "count_diff": count}
+                       for size, count, site in growth[:self.__top] if size > 0],
+            "objects": {cls.__name__: instances[cls] for cls in MODEL_CLASSES}
+        })
+        self.__previous = sites
+
+    # ---------------------------------------------------------------------------
+
+    def stop(self) -> None:
+        """
+        SUMMARY
+        -------
+            This public method stops tracing the allocations, the snapshots already taken are kept.
+        """
+        tracemalloc.stop()
+
+    # ---------------------------------------------------------------------------
+
+    def write_report(self, path: str) -> None:
+        """
+        SUMMARY
+        -------
+            This public method writes the JSON document of the memory profile (see 'get_report').
+
+        PARAMETERS
+        ----------
+            - path (str): The path of the report file
+
+        RAISES
+        ------
+            - OSError: If the report couldn't be written
+        """
+        with open(path, 'w', encoding="utf-8") as file:
+            json.dump(self.get_report(), file, indent=2)
+            file.write("\n")
+
+
+# ---------------------------------------------------------------------------
+
+
+def _format_site(traceback: tracemalloc.Traceback) -> str:
+    """
+    SUMMARY
+    -------
+        This private function formats an allocation site, the innermost frame first, then its callers.
+    """
+    return " < ".join(f"{frame.filename}:{frame.lineno}" for frame in reversed(traceback))
@@ -0,0 +1,252 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.metrics.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Exports the statistics of a run in the OpenMetrics text format, for a Prometheus textfile collector.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import os
+import sys
+import time
+from time import perf_counter
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows, the peak memory isn't exported
+    resource = None
+
+from src.io_manager import DocFileCategory
+
+# The prefix of the name of all exported metrics
+METRICS_PREFIX: str = "cppdocgen"
+
+# The stages of a run whose duration is exported, in their order (see DocumentationPipeline.run)
+RUN_STAGES: tuple[str, ...] = ("discovery", "parsing", "rendering")
+
+# ---------------------------------------------------------------------------
+
+
+class RunMetrics:
+    """
+    SUMMARY
+    -------
+        This class gathers the statistics of a run and writes them in a textfile for the node exporter:
+        the headers discovered, parsed, skipped and failed, the pages written and unchanged by category,
+        the duration of each stage, the hit ratio of the parse cache and the peak memory of the processes.
+        All metrics are gauges that describe the last run, the file is replaced atomically at the end of each run.
+    """
+
+    def __init__(self) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the constructor of the RunMetrics class, the duration of the run starts with it.
+        """
+        self.__start: float = perf_counter()
+        self.__durations: dict[str, float] = dict()
+
+    # ---------------------------------------------------------------------------
+    # GETTERS
+    # ---------------------------------------------------------------------------
+
+    def get_durations(self) -> dict[str, float]:
+        """
+        SUMMARY
+        -------
+            This public method returns the time spent in each stage of the run.
+
+        RETURNS
+        -------
+            dict[str, float]: The seconds spent in each stage
+        """
+        return dict(self.__durations)
+
+    # ---------------------------------------------------------------------------
+    # SETTERS
+    # ---------------------------------------------------------------------------
+
+    def set_durations(self, durations: dict[str, float]) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the setter of the '__durations' attribute.
+
+        PARAMETERS
+        ----------
+            - durations (dict[str, float]): The seconds spent in each stage
+                                            (see DocumentationPipeline.get_stage_durations)
+        """
+        self.__durations = dict(durations)
+
+    # ---------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ---------------------------------------------------------------------------
+
+    def render(self, headers: dict[str, int], pages: dict[str, dict[str, int]],
+               cache: dict[str, int] | None, success: bool, workers: bool = False) -> str:
+        """
+        SUMMARY
+        -------
+            This public method generates the content of the textfile.
+
+        PARAMETERS
+        ----------
+            - headers (dict[str, int]): The number of headers by state (see DocumentationPipeline.get_run_statistics)
+            - pages (dict[str, dict[str, int]]): The number of pages by state and category
+                    (see IOManager.get_write_statistics)
+            - cache (dict[str, int] | None): The statistics of the parse cache (see ParseCache.get_statistics),
+                    None without cache
+            - success (bool): False if the run stopped on an error
+            - workers (bool): Optional parameter, True if a pool of worker processes parsed headers in the run,
+                              the peak memory of the workers is only exported then
+
+        RETURNS
+        -------
+            str: The metrics in the OpenMetrics text format, terminated by the '# EOF' line
+        """
+        lines: list[str] = list()
+
+        _add_metric(lines, "last_run_success", "1 if the last run completed, 0 if it stopped on an error",
+                    [("", int(success))])
+        _add_metric(lines, "last_run_timestamp_seconds", "The end of the last run, in seconds since the epoch",
+                    [("", round(time.time(), 3))], "seconds")
+        _add_metric(lines, "run_duration_seconds", "The duration of the last run",
+                    [("", perf_counter() - self.__start)], "seconds")
+        _add_metric(lines, "stage_duration_seconds",
+                    "The time spent in each stage of the last run, the stages are interleaved and their times "
+                    "add up to the duration of the run",
+                    [(f'stage="{stage}"', self.__durations[stage]) for stage in RUN_STAGES
+                     if stage in self.__durations], "seconds")
+
+        _add_metric(lines, "headers", "The headers of the last run: discovered, parsed (new or changed), "
+                                      "skipped (unchanged) and failed (not documented after an error)",
+                    [(f'state="{state}"', count) for state, count in headers.items()])
+
+        categories: list[str] = ["root", *(category.value for category in DocFileCategory)]
+        _add_metric(lines, "pages", "The documentation pages of the last run: written, unchanged (same content "
+                                    "on disk) and deleted, by category",
+                    [(f'category="{category}",state="{label}"', pages[state].get(category, 0))
+                     for state, label in (("written", "written"), ("skipped", "unchanged"), ("deleted", "deleted"))
+                     for category in categories])
+
+        if cache is not None:
+            lookups: int = cache["hits"] + cache["misses"]
+            _add_metric(lines, "cache_lookups", "The lookups of the parse cache in the last run, by result",
+                        [('result="hit"', cache["hits"]), ('result="miss"', cache["misses"])])
+            _add_metric(lines, "cache_hit_ratio", "The ratio of the parse cache lookups of the last run that hit",
+                        [("", cache["hits"] / lookups if lookups else 0.0)], "ratio")
+
+        peaks: list[tuple[str, int]] = _get_peak_rss(workers)
+        if peaks:
+            _add_metric(lines, "peak_rss_bytes", "The maximum resident set size of the main process "
+                                                 "and of the largest parsing process (with --jobs)", peaks, "bytes")
+
+        lines.append("# EOF\n")
+        return "".join(lines)
+
+    # ---------------------------------------------------------------------------
+
+    def write(self, path: str, headers: dict[str, int], pages: dict[str, dict[str, int]],
+              cache: dict[str, int] | None, success: bool, workers: bool = False) -> None:
+        """
+        SUMMARY
+        -------
+            This public method writes the textfile (see 'render'). It is written in a temporary file
+            renamed over the previous one, so the collector never reads a partial file.
+
+        PARAMETERS
+        ----------
+            - path (str): The path of the textfile, its name must end with '.prom' for the node exporter
+            - headers (dict[str, int]): The number of headers by state
+            - pages (dict[str, dict[str, int]]): The number of pages by state and category
+            - cache (dict[str, int] | None): The statistics of the parse cache, None without cache
+            - success (bool): False if the run stopped on an error
+            - workers (bool): Optional parameter, True if a pool of worker processes parsed headers in the run
+
+        RAISES
+        ------
+            - OSError: If the textfile couldn't be written
+        """
+        temporary_path: str = f"{path}.{os.getpid()}.tmp"
+
+        try:
+            with open(temporary_path, 'w', encoding="utf-8") as file:
+                file.write(self.render(headers, pages, cache, success, workers))
+            os.replace(temporary_path, path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+
+# ---------------------------------------------------------------------------
+
+
+def _add_metric(lines: list[str], name: str, description: str, samples: list[tuple[str, int | float]],
+                unit: str = None) -> None:
+    """
+    SUMMARY
+    -------
+        This private function adds the metadata and the samples of a gauge, the labels of a sample are
+        already formatted ('' without label).
+    """
+    name = f"{METRICS_PREFIX}_{name}"
+
+    lines.append(f"# TYPE {name} gauge\n")
+    if unit is not None:
+        lines.append(f"# UNIT {name} {unit}\n")
+    lines.append(f"# HELP {name} {description}.\n")
+
+    for labels, value in samples:
+        lines.append(f"{name}{{{labels}}} {value}\n" if labels else f"{name} {value}\n")
+
+
+# ---------------------------------------------------------------------------
+
+
+def _get_peak_rss(workers: bool) -> list[tuple[str, int]]:
+    """
+    SUMMARY
+    -------
+        This private function returns the maximum resident set size of the main process and, if the run used
+        worker processes, of the largest child process, in bytes. It is empty if the platform doesn't measure it.
+        The children are only reported for a pool: otherwise the largest child isn't a parsing process.
+    """
+    if resource is None:
+        return list()
+
+    # in kibibytes on Linux, in bytes on macOS
+    scale: int = 1 if sys.platform == "darwin" else 1024
+    peaks: list[tuple[str, int]] = [('process="main"', resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale)]
+
+    children: int = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss if workers else 0
+    if children > 0:
+        peaks.append(('process="workers"', children * scale))
+
+    return peaks
@@ -39,8 +39,12 @@ if sys.version_info < (3, 11):
 # ---------------------------------------------------------------------------
 
 from .tags import TagKeys, Tag, TypedTag, ParameterTag
+from .page_links import PageLinks, PAGE_LINKS
 from .enum_desc import EnumDesc
 from .function_desc import FunctionDesc
+from .file_desc import FileDesc, to_page_name
+from .string_pool import StringPool
+from .serialization import serialize, deserialize
 
 
 __all__ = {
@@ -48,6 +52,13 @@ __all__ = {
     "Tag",
     "TypedTag",
     "ParameterTag",
+    "PageLinks",
+    "PAGE_LINKS",
     "EnumDesc",
-    "FunctionDesc"
+    "FunctionDesc",
+    "FileDesc",
+    "to_page_name",
+    "StringPool",
+    "serialize",
+    "deserialize"
 }
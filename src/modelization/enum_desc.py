@@ -30,9 +30,10 @@ This banner notice must not be removed.
 
 """
 
-import os
+from typing import Iterator
 
 from src import DocFileCategory
+from .page_links import PageLinks
 
 # ---------------------------------------------------------------------------
 
@@ -43,6 +44,8 @@ class EnumDesc:
     -------
         This class is described an enumeration of the code.
     """
+
+    __slots__ = ("__name", "__summary", "__items")
     
     def __init__(self, name: str, summary: list[str], items: dict[str, object] = None) -> None:
         """
@@ -57,7 +60,7 @@ class EnumDesc:
             - items (dict[str, object]): Optional parameter, the items of the enum
         """
         if items is None:
-            items = list()
+            items = dict()
 
         self.__name: str = name
         self.__summary: list[str] = summary
@@ -149,7 +152,7 @@ class EnumDesc:
     # PUBLIC METHODS
     # ---------------------------------------------------------------------------
 
-    def to_markdown(self, output: str, file_container: str) -> list[str]:
+    def to_markdown(self, links: PageLinks, file_container: str) -> Iterator[str]:
         """
         SUMMARY
         -------
@@ -157,34 +160,30 @@ class EnumDesc:
 
         PARAMETERS
         ----------
-            - output (str): The path of the output documentation directory
+            - links (PageLinks): The links from the directory of the enum pages
             - file_container (str) The name of the file that contains this enum 
 
         RETURNS
         -------
-            list[str]: The lines of the markdown generated
+            Iterator[str]: The newline-terminated chunks of the markdown generated
         """
-        lines: list[str] = list()
-        lines.append(f"# {self.__name} - (enum)")
-        lines.append("")
+        yield f"# {self.__name} - (enum)\n"
+        yield "\n"
 
         for line in self.__summary:
-            lines.append(f"> {line}")
-        lines.append("")
-
-        lines.append(f"## Items")
-        lines.append("")
-        lines.append("| ITEM | VALUE |")
-        lines.append("|------|-------|")
+            yield f"> {line}\n"
+        yield "\n"
 
-        for key, value in self.__items:
-            lines.append(f"| {key} | {value} |")
+        yield f"## Items\n"
+        yield "\n"
+        yield "| ITEM | VALUE |\n"
+        yield "|------|-------|\n"
 
-        lines.append("")
-        lines.append("## Location")
+        for key, value in self.__items.items():
+            yield f"| {key} | {value} |\n"
 
-        doc_file_path = os.path.join(output, DocFileCategory.FILE.value, file_container + ".md")
-        lines.append(f"[{file_container}]({doc_file_path})")
-        lines.append("")
+        yield "\n"
+        yield "## Location\n"
 
-        return lines
+        yield f"[{file_container}]({links.get(DocFileCategory.FILE, file_container)})\n"
+        yield "\n"
@@ -0,0 +1,465 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.modelization.file_desc.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Describes a header file of the code and all its documented content.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import os
+import re
+from typing import Iterator
+
+from src import DocFileCategory
+from .enum_desc import EnumDesc
+from .function_desc import FunctionDesc
+from .page_links import PageLinks
+
+# The operator of the last part of a qualified name, and the tokens of its symbol: operator[], operator<=, operator new
+OPERATOR_PATTERN: re.Pattern = re.compile(r"\boperator\b\s*([^.]*)$")
+OPERATOR_TOKEN_PATTERN: re.Pattern = re.compile(r"\(\s*\)|\[\s*\]|\w+|\S")
+
+# The words of the operator symbols in the page names, the symbols aren't valid or safe in a file name or a link
+OPERATOR_WORDS: dict[str, str] = {"()": "call", "[]": "index", "+": "plus", "-": "minus", "*": "mul", "/": "div",
+                                  "%": "mod", "^": "xor", "&": "and", "|": "or", "~": "compl", "!": "not", "=": "eq",
+                                  "<": "lt", ">": "gt", ",": "comma"}
+
+# ---------------------------------------------------------------------------
+
+
+def _encode_operator(match: re.Match) -> str:
+    """
+    SUMMARY
+    -------
+        This private function returns the page name of an operator: operator<= is operator_lt_eq.
+    """
+    words: list[str] = ["operator"]
+
+    for token in OPERATOR_TOKEN_PATTERN.findall(match.group(1)):
+        word: str | None = OPERATOR_WORDS.get("".join(token.split()))
+        if word is None:
+            # the words (new, delete, bool...) are kept, the other characters are written with their code
+            word = token if token[0].isalnum() or token[0] == "_" else f"x{ord(token):02x}"
+        words.append(word)
+
+    return "_".join(words)
+
+
+# ---------------------------------------------------------------------------
+
+
+def to_page_name(qualified_name: str) -> str:
+    """
+    SUMMARY
+    -------
+        This public function converts a qualified c++ name (namespace::class::name) in a documentation page name.
+        The symbol of an operator is written with words (see OPERATOR_WORDS), so the page name is a valid file name.
+
+    PARAMETERS
+    ----------
+        - qualified_name (str): The qualified name of the symbol
+
+    RETURNS
+    -------
+        str: The name of the documentation page (without extension)
+    """
+    page_name: str = qualified_name.replace("::", ".")
+    if "operator" in page_name:
+        page_name = OPERATOR_PATTERN.sub(_encode_operator, page_name)
+
+    return page_name
+
+
+# ---------------------------------------------------------------------------
+
+
+class FileDesc:
+    """
+    SUMMARY
+    -------
+        This class is described a header file of the code.
+        It is the result of the parsing of one header and contains all its documented symbols.
+    """
+
+    __slots__ = ("__path", "__summary", "__author", "__version",
+                 "__namespaces", "__classes", "__functions", "__overloads", "__enums")
+
+    def __init__(self, path: str, summary: list[str] = None) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the constructor of the FileDesc class.
+
+        PARAMETERS
+        ----------
+            - path (str): The path of the header file, relative to the input directory
+            - summary (list[str]): Optional parameter, the description (@brief) of the file
+        """
+        if summary is None:
+            summary = list()
+
+        self.__path: str = path.replace(os.sep, "/")
+        self.__summary: list[str] = summary
+        self.__author: str | None = None
+        self.__version: str | None = None
+
+        self.__namespaces: dict[str, list[str]] = dict()
+        self.__classes: dict[str, list[str]] = dict()
+        self.__functions: list[tuple[FunctionDesc, str | None, str]] = list()
+        # the number of functions of each name, to number the overloads
+        self.__overloads: dict[str, int] = dict()
+        self.__enums: list[EnumDesc] = list()
+
+    # ---------------------------------------------------------------------------
+    # GETTERS
+    # ---------------------------------------------------------------------------
+
+    def get_path(self) -> str:
+        """
+        SUMMARY
+        -------
+            This public method is the getter of the '__path' attribute.
+            It returns the path of the header file, relative to the input directory.
+
+        RETURNS
+        -------
+            str: The relative path of the file ('/' separated)
+        """
+        return self.__path
+
+    # ---------------------------------------------------------------------------
+
+    def get_page_name(self) -> str:
+        """
+        SUMMARY
+        -------
+            This public method returns the name of the documentation page of the file.
+
+        RETURNS
+        -------
+            str: The name of the file documentation page (without extension)
+        """
+        return self.__path.replace("/", ".")
+
+    # ---------------------------------------------------------------------------
+
+    def get_summary(self) -> list[str]:
+        """
+        SUMMARY
+        -------
+            This public method is the getter of the '__summary' attribute.
+            It returns the description of the file.
+
+        RETURNS
+        -------
+            list[str]: File description
+        """
+        return self.__summary.copy()
+
+    # ---------------------------------------------------------------------------
+
+    def get_author(self) -> str | None:
+        """
+        SUMMARY
+        -------
+            This public method is the getter of the '__author' attribute.
+
+        RETURNS
+        -------
+            str | None: The author of the file if documented
+        """
+        return self.__author
+
+    # ---------------------------------------------------------------------------
+
+    def get_version(self) -> str | None:
+        """
+        SUMMARY
+        -------
+            This public method is the getter of the '__version' attribute.
+
+        RETURNS
+        -------
+            str | None: The version of the file if documented
+        """
+        return self.__version
+
+    # ---------------------------------------------------------------------------
+
+    def get_namespaces(self) -> dict[str, list[str]]:
+        """
+        SUMMARY
+        -------
+            This public method is the getter of the '__namespaces' attribute.
+
+        RETURNS
+        -------
+            dict[str, list[str]]: key=QUALIFIED_NAME, value=SUMMARY
+        """
+        return self.__namespaces.copy()
+
+    # ---------------------------------------------------------------------------
+
+    def get_classes(self) -> dict[str, list[str]]:
+        """
+        SUMMARY
+        -------
+            This public method is the getter of the '__classes' attribute.
+
+        RETURNS
+        -------
+            dict[str, list[str]]: key=QUALIFIED_NAME, value=SUMMARY
+        """
+        return self.__classes.copy()
+
+    # ---------------------------------------------------------------------------
+
+    def get_functions(self) -> list[tuple[FunctionDesc, str | None, str]]:
+        """
+        SUMMARY
+        -------
+            This public method is the getter of the '__functions' attribute.
+            It returns all functions and methods of the file in declaration order.
+
+        RETURNS
+        -------
+            list[tuple[FunctionDesc, str | None, str]]: (function, qualified name of the class or None, page name)
+        """
+        return self.__functions.copy()
+
+    # ---------------------------------------------------------------------------
+
+    def get_enums(self) -> list[EnumDesc]:
+        """
+        SUMMARY
+        -------
+            This public method is the getter of the '__enums' attribute.
+
+        RETURNS
+        -------
+            list[EnumDesc]: All enumerations of the file in declaration order
+        """
+        return self.__enums.copy()
+
+    # ---------------------------------------------------------------------------
+    # SETTERS
+    # ---------------------------------------------------------------------------
+
+    def set_summary(self, summary: list[str]) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the setter of the '__summary' attribute.
+
+        PARAMETERS
+        ----------
+            - summary (list[str]): The description of the file
+        """
+        self.__summary = summary
+
+    # ---------------------------------------------------------------------------
+
+    def set_author(self, author: str) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the setter of the '__author' attribute.
+
+        PARAMETERS
+        ----------
+            - author (str): The author of the file
+        """
+        self.__author = author
+
+    # ---------------------------------------------------------------------------
+
+    def set_version(self, version: str) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the setter of the '__version' attribute.
+
+        PARAMETERS
+        ----------
+            - version (str): The version of the file
+        """
+        self.__version = version
+
+    # ---------------------------------------------------------------------------
+
+    def add_namespace(self, name: str, summary: list[str]) -> None:
+        """
+        SUMMARY
+        -------
+            This public method appends a namespace documented in the file.
+
+        PARAMETERS
+        ----------
+            - name (str): The qualified name of the namespace
+            - summary (list[str]): The description of the namespace
+        """
+        self.__namespaces[name] = summary
+
+    # ---------------------------------------------------------------------------
+
+    def add_class(self, name: str, summary: list[str]) -> None:
+        """
+        SUMMARY
+        -------
+            This public method appends a class documented in the file.
+
+        PARAMETERS
+        ----------
+            - name (str): The qualified name of the class
+            - summary (list[str]): The description of the class
+        """
+        self.__classes[name] = summary
+
+    # ---------------------------------------------------------------------------
+
+    def add_function(self, function: FunctionDesc, class_container: str = None) -> str:
+        """
+        SUMMARY
+        -------
+            This public method appends a function (or a method if the class is given) documented in the file.
+            The overloads of the same function are numbered in their documentation page name.
+
+        PARAMETERS
+        ----------
+            - function (FunctionDesc): The function to add
+            - class_container (str): Optional parameter, the qualified name of the class that contains the method
+
+        RETURNS
+        -------
+            str: The name of the documentation page of the function
+        """
+        page_name: str = f"{self.get_page_name()}.{to_page_name(function.get_name())}"
+
+        overloads: int = self.__overloads.get(function.get_name(), 0)
+        if overloads > 0:
+            page_name += f"-{overloads + 1}"
+        self.__overloads[function.get_name()] = overloads + 1
+
+        self.__functions.append((function, class_container, page_name))
+        return page_name
+
+    # ---------------------------------------------------------------------------
+
+    def add_enum(self, enum: EnumDesc) -> None:
+        """
+        SUMMARY
+        -------
+            This public method appends an enumeration documented in the file.
+
+        PARAMETERS
+        ----------
+            - enum (EnumDesc): The enumeration to add
+        """
+        self.__enums.append(enum)
+
+    # ---------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ---------------------------------------------------------------------------
+
+    def to_markdown(self, links: PageLinks) -> Iterator[str]:
+        """
+        SUMMARY
+        -------
+            This public method generates markdown to describe this file and links all its symbols.
+
+        PARAMETERS
+        ----------
+            - links (PageLinks): The links from the directory of the file pages
+
+        RETURNS
+        -------
+            Iterator[str]: The newline-terminated chunks of the markdown generated
+        """
+        yield f"# {self.__path} - (file)\n"
+        yield "\n"
+
+        for line in self.__summary:
+            yield f"> {line}\n"
+        yield "\n"
+
+        if self.__author is not None:
+            yield f"Author: {self.__author}\n"
+        if self.__version is not None:
+            yield f"Version: {self.__version}\n"
+        yield "\n"
+
+        sections: list[tuple[str, DocFileCategory, list[tuple[str, str]]]] = [
+            ("Namespaces", DocFileCategory.NAMESPACE, [(name, to_page_name(name)) for name in self.__namespaces]),
+            ("Classes", DocFileCategory.CLASS, [(name, to_page_name(name)) for name in self.__classes]),
+            ("Functions", DocFileCategory.FUNCTION, [(function.get_name(), page) for function, _, page in self.__functions]),
+            ("Enumerations", DocFileCategory.ENUM, [(enum.get_name(), to_page_name(enum.get_name())) for enum in self.__enums])
+        ]
+
+        for title, category, symbols in sections:
+            if not symbols:
+                continue
+
+            yield f"## {title}\n"
+            yield "\n"
+            for name, page in symbols:
+                yield f"- [{name}]({links.get(category, page)})\n"
+            yield "\n"
+
+    # ---------------------------------------------------------------------------
+
+    def class_to_markdown(self, name: str, links: PageLinks) -> Iterator[str]:
+        """
+        SUMMARY
+        -------
+            This public method generates markdown to describe a class of this file and links all its methods.
+
+        PARAMETERS
+        ----------
+            - name (str): The qualified name of the class
+            - links (PageLinks): The links from the directory of the class pages
+
+        RETURNS
+        -------
+            Iterator[str]: The newline-terminated chunks of the markdown generated
+        """
+        yield f"# {name} - (class)\n"
+        yield "\n"
+
+        for line in self.__classes.get(name, list()):
+            yield f"> {line}\n"
+        yield "\n"
+
+        yield "## Methods\n"
+        yield "\n"
+        for function, class_container, page in self.__functions:
+            if class_container == name:
+                yield f"- [{function.get_name()}]({links.get(DocFileCategory.FUNCTION, page)})\n"
+        yield "\n"
+
+        yield "## Location\n"
+        yield f"[{self.__path}]({links.get(DocFileCategory.FILE, self.get_page_name())})\n"
+        yield "\n"
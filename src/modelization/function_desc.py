@@ -30,15 +30,38 @@ This banner notice must not be removed.
 
 """
 
-import os
-import copy
+from typing import Callable, Iterable, Iterator
 
 from src import DocFileCategory
+from .page_links import PageLinks
 from .tags import TypedTag, ParameterTag
 
 # ---------------------------------------------------------------------------
 
 
+def _inline(value: str | list[str] | tuple[str, ...]) -> str:
+    """
+    SUMMARY
+    -------
+        This private function joins a tag value (one or multiple lines) into a single markdown table cell.
+
+    PARAMETERS
+    ----------
+        - value (str | list[str] | tuple[str, ...]): The tag value
+
+    RETURNS
+    -------
+        str: The value on one line
+    """
+    if isinstance(value, str):
+        return value
+
+    return " ".join(value)
+
+
+# ---------------------------------------------------------------------------
+
+
 class FunctionDesc:
     """
     SUMMARY
@@ -46,6 +69,9 @@ class FunctionDesc:
         This class is described a function of the code.
     """
 
+    __slots__ = ("__name", "__code_line", "__summary", "__parameters", "__exceptions", "__return",
+                 "__parameters_by_name", "__exceptions_by_type")
+
     def __init__(self, name: str, declare_code_line: str,
                  summary: list[str] = None, return_tag: TypedTag = None,
                  parameters: list[ParameterTag] = None, exceptions: list[TypedTag] = None) -> None:
@@ -53,19 +79,25 @@ class FunctionDesc:
         if summary is None:
             summary = list()
 
-        if parameters is None:
-            parameters = list()
-
-        if exceptions is None:
-            exceptions = list()
-
         self.__name: str = name
         self.__code_line: str = declare_code_line
-
         self.__summary: list[str] = summary
-        self.__parameters: list[ParameterTag] = parameters
-        self.__exceptions: list[TypedTag] = exceptions
-        self.__return: TypedTag | None = return_tag
+
+        # the tags are frozen and stored in tuples, so the getters share them without copying
+        self.__parameters: tuple[ParameterTag, ...] = ()
+        self.__exceptions: tuple[TypedTag, ...] = ()
+        self.__return: TypedTag | None = None
+
+        # indexes of the tags by parameter name and by exception type, kept up to date by the setters
+        self.__parameters_by_name: dict[str, ParameterTag] = dict()
+        self.__exceptions_by_type: dict[str, TypedTag] = dict()
+
+        if parameters is not None:
+            self.add_parameters(parameters)
+        if exceptions is not None:
+            self.add_exceptions(exceptions)
+        if return_tag is not None:
+            self.set_return_tag(return_tag)
 
     # ---------------------------------------------------------------------------
     # GETTERS
@@ -76,41 +108,58 @@ class FunctionDesc:
     
     # ---------------------------------------------------------------------------
 
+    def get_code_line(self) -> str:
+        return self.__code_line
+
+    # ---------------------------------------------------------------------------
+
     def get_summary(self) -> list[str]:
         return self.__summary
 
     # ---------------------------------------------------------------------------
 
-    def get_parameters(self) -> list[ParameterTag]:
-        return copy.deepcopy(self.__parameters)
+    def get_parameters(self) -> tuple[ParameterTag, ...]:
+        """
+        SUMMARY
+        -------
+            This public method returns the parameter tags in declaration order.
+            The tuple and its tags are read-only, so they are returned without copy.
+
+        RETURNS
+        -------
+            tuple[ParameterTag, ...]: The frozen parameter tags
+        """
+        return self.__parameters
 
     # ---------------------------------------------------------------------------
 
     def get_parameter(self, name: str) -> ParameterTag | None:
-        for param in self.__parameters:
-            if param.get_name() == name:
-                return copy.copy(param)
-        
-        return None
+        return self.__parameters_by_name.get(name)
     
     # ---------------------------------------------------------------------------
 
-    def get_throws(self) -> list[TypedTag]:
-        return copy.deepcopy(self.__exceptions)
+    def get_throws(self) -> tuple[TypedTag, ...]:
+        """
+        SUMMARY
+        -------
+            This public method returns the exception tags in declaration order.
+            The tuple and its tags are read-only, so they are returned without copy.
+
+        RETURNS
+        -------
+            tuple[TypedTag, ...]: The frozen exception tags
+        """
+        return self.__exceptions
 
     # ---------------------------------------------------------------------------
 
     def get_throw(self, exception: str) -> TypedTag | None:
-        for exception in self.__exceptions:
-            if exception.get_type() == exception:
-                return copy.copy(exception)
-
-        return None
+        return self.__exceptions_by_type.get(exception)
 
     # ---------------------------------------------------------------------------
 
     def get_return_tag(self) -> TypedTag | None:
-        return copy.copy(self.__return)
+        return self.__return
 
     # ---------------------------------------------------------------------------
     # SETTERS
@@ -127,94 +176,178 @@ class FunctionDesc:
     # ---------------------------------------------------------------------------
 
     def add_parameters(self, parameters: list[ParameterTag]) -> None:
+        """
+        SUMMARY
+        -------
+            This public method adds parameter tags to the function. The description takes ownership of the tags:
+            they are frozen in place (see Tag.freeze), the caller must modify a copy of them.
+        """
         if any(not isinstance(current, ParameterTag) for current in parameters):
             raise ValueError(f"The 'parameters' parameter must be contain only 'ParameterTag' instances !\Variable : {parameters}")
 
-        self.__parameters.extend(parameters)
+        self.__parameters += tuple(param.freeze() for param in parameters)
+
+        for param in parameters:
+            if param.get_name() is not None:
+                self.__parameters_by_name.setdefault(param.get_name(), param)
 
     # ---------------------------------------------------------------------------
 
     def add_exceptions(self, exceptions: list[TypedTag]) -> None:
+        """
+        SUMMARY
+        -------
+            This public method adds exception tags to the function. The description takes ownership of the tags:
+            they are frozen in place (see Tag.freeze), the caller must modify a copy of them.
+        """
         if any(not isinstance(current, TypedTag) for current in exceptions):
             raise ValueError(f"The 'exceptions' parameter must be contain only 'TypedTag' instances !\Variable : {exceptions}")
 
-        self.__exceptions.extend(exceptions)
+        self.__exceptions += tuple(exception.freeze() for exception in exceptions)
+
+        for exception in exceptions:
+            if exception.get_type() is not None:
+                self.__exceptions_by_type.setdefault(exception.get_type(), exception)
 
     # ---------------------------------------------------------------------------
 
     def set_return_tag(self, return_tag: TypedTag) -> None:
+        """
+        SUMMARY
+        -------
+            This public method sets the return tag of the function. The description takes ownership of the tag:
+            it is frozen in place (see Tag.freeze), the caller must modify a copy of it.
+        """
         if isinstance(return_tag, TypedTag):
-            self.__return = return_tag
+            self.__return = return_tag.freeze()
         else:
             raise ValueError(f"The 'return_tag' parameter must be a 'TypedTag' instance and not '{type(return_tag)}' !")
 
     # ---------------------------------------------------------------------------
     # PUBLIC METHODS
     # ---------------------------------------------------------------------------
+
+    def validate_against_signature(self, parameter_names: Iterable[str]) -> tuple[list[str], list[str]]:
+        """
+        SUMMARY
+        -------
+            This public method checks the documented parameters against the parameters of the c++ signature.
+            The check is linear in the number of parameters, whatever the number of overloads checked.
+
+        PARAMETERS
+        ----------
+            - parameter_names (Iterable[str]): The names of the parameters declared in the c++ signature
+
+        RETURNS
+        -------
+            tuple[list[str], list[str]]: The declared parameters without @param tag,
+                then the @param tags that aren't declared in the signature (in declaration order)
+        """
+        declared: dict[str, None] = dict.fromkeys(parameter_names)
+
+        missing: list[str] = [name for name in declared if name not in self.__parameters_by_name]
+        unknown: list[str] = [name for name in self.__parameters_by_name if name not in declared]
+
+        return missing, unknown
+
+    # ---------------------------------------------------------------------------
+
+    def get_type_cells(self) -> Iterator[str]:
+        """
+        SUMMARY
+        -------
+            This public method returns the text of the table cells whose type mentions are linked:
+            the type and the description of the parameters, exceptions and return value.
+
+        RETURNS
+        -------
+            Iterator[str]: The text of each cell
+        """
+        for param in self.__parameters:
+            yield param.get_type() or ''
+            yield _inline(param.get_value())
+
+        for exception in self.__exceptions:
+            yield exception.get_type() or ''
+            yield _inline(exception.get_value())
+
+        if self.__return is not None:
+            yield self.__return.get_type() or ''
+            yield _inline(self.__return.get_value())
+
+    # ---------------------------------------------------------------------------
     
-    def generate_markdown(self, output: str, file_container: str, class_container: str = None) -> list[str]:
+    def generate_markdown(self, links: PageLinks, file_container: str, class_container: str = None,
+                          class_page: str = None, link_types: Callable[[str], str] = None) -> Iterator[str]:
         """
         SUMMARY
         -------
-            This public method generates markdown to describe this enum.
+            This public method generates markdown to describe this function.
 
         PARAMETERS
         ----------
-            - output (str): The path of the output documentation directory
-            - file_container (str) The name of the file that contains this enum 
+            - links (PageLinks): The links from the directory of the function pages
+            - file_container (str) The name of the file that contains this function
+            - class_container (str): Optional parameter, the qualified name of the class that contains this method
+            - class_page (str): Optional parameter, the page of this class, None if the class isn't documented
+            - link_types (Callable[[str], str]): Optional parameter, links the type mentions of a table cell
+                         By default, the cells aren't linked
 
         RETURNS
         -------
-            list[str]: The lines of the markdown generated
+            Iterator[str]: The newline-terminated chunks of the markdown generated
         """
-        lines: list[str] = list()
-        lines.append(f"# {self.__name} - (function)")
-        lines.append("")
+        yield f"# {self.__name} - (function)\n"
+        yield "\n"
 
-        lines.append("```cpp")
-        lines.append(self.__code_line)
-        lines.append("```")
-        lines.append("")
+        if link_types is None:
+            link_types = str
+
+        yield "```cpp\n"
+        yield self.__code_line + "\n"
+        yield "```\n"
+        yield "\n"
 
         for line in self.__summary:
-            lines.append(f"> {line}")
-        lines.append("")
+            yield f"> {line}\n"
+        yield "\n"
 
-        lines.append(f"## Parameters")
-        lines.append("")
-        lines.append("| NAME | TYPE | HINTS | DESCRIPTION |")
-        lines.append("|------|------|-------|-------------|")
+        yield f"## Parameters\n"
+        yield "\n"
+        yield "| NAME | TYPE | HINTS | DESCRIPTION |\n"
+        yield "|------|------|-------|-------------|\n"
 
         for param in self.__parameters:
-            lines.append(f"| {param.get_name()} | {param.get_type()} | {param.get_hints()} | {param.get_value()} |")
+            yield (f"| {param.get_name()} | {link_types(param.get_type() or '')} | {', '.join(param.get_hints())} "
+                   f"| {link_types(_inline(param.get_value()))} |\n")
 
-        lines.append("")
-        lines.append("## Raises")
-        lines.append("")
-        lines.append("| EXCEPTION | DESCRIPTION |")
-        lines.append("|-----------|-------------|")
+        yield "\n"
+        yield "## Raises\n"
+        yield "\n"
+        yield "| EXCEPTION | DESCRIPTION |\n"
+        yield "|-----------|-------------|\n"
 
-        for exception in self.__raises:
-            lines.append(f"| {exception.get_type()} | {exception.get_value()} |")
+        for exception in self.__exceptions:
+            yield f"| {link_types(exception.get_type() or '')} | {link_types(_inline(exception.get_value()))} |\n"
 
-        lines.append("")
-        lines.append("## Returns")
-        lines.append("")
+        yield "\n"
+        yield "## Returns\n"
+        yield "\n"
 
-        lines.append("| TYPE | DESCRIPTION |")
-        lines.append("|------|-------------|")
-        lines.append(f"| {self.__return.get_type()} | {self.__return.get_value()} |")
-        lines.append("")
+        yield "| TYPE | DESCRIPTION |\n"
+        yield "|------|-------------|\n"
+        if self.__return is not None:
+            yield f"| {link_types(self.__return.get_type() or '')} | {link_types(_inline(self.__return.get_value()))} |\n"
+        yield "\n"
 
-        lines.append("## Location")
-        doc_file_path = os.path.join(output, DocFileCategory.FILE.value, file_container + ".md")
-        lines.append(f"File: [{file_container}]({doc_file_path})")
+        yield "## Location\n"
+        yield f"File: [{file_container}]({links.get(DocFileCategory.FILE, file_container)})\n"
 
         if class_container is None:
-            lines.append("Class: No class associated")
+            yield "Class: No class associated\n"
+        elif class_page is None:
+            yield f"Class: {class_container}\n"
         else:
-            doc_class_path = os.path.join(output, DocFileCategory.CLASS.value, class_container + ".md")
-            lines.append(f"Class: [{class_container}]({doc_class_path})")
+            yield f"Class: [{class_container}]({links.get(DocFileCategory.CLASS, class_page)})\n"
 
-        lines.append("")
-        return lines
+        yield "\n"
@@ -0,0 +1,96 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.modelization.page_links.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Builds the relative links between the documentation pages.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+from src import DocFileCategory
+
+# ---------------------------------------------------------------------------
+
+
+class PageLinks:
+    """
+    SUMMARY
+    -------
+        This class builds the relative links from the pages of one documentation directory.
+        The pages of a category are all in the same directory, so the relative path to each category is computed once
+        and a link is only the concatenation of this prefix and the page name.
+    """
+
+    __slots__ = ("__prefixes",)
+
+    def __init__(self, category: DocFileCategory | None) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the constructor of the PageLinks class.
+
+        PARAMETERS
+        ----------
+            - category (DocFileCategory | None): The category of the pages that contain the links,
+                       None for the pages in the root of the output directory
+        """
+        self.__prefixes: dict[DocFileCategory, str] = dict()
+
+        for target in DocFileCategory:
+            if category is None:
+                self.__prefixes[target] = f"{target.value}/"
+            elif target is category:
+                self.__prefixes[target] = ""
+            else:
+                self.__prefixes[target] = f"../{target.value}/"
+
+    # ---------------------------------------------------------------------------
+    # GETTERS
+    # ---------------------------------------------------------------------------
+
+    def get(self, category: DocFileCategory, page: str) -> str:
+        """
+        SUMMARY
+        -------
+            This public method returns the relative link to a documentation page.
+
+        PARAMETERS
+        ----------
+            - category (DocFileCategory): The category of the linked page
+            - page (str): The name of the linked page (without extension)
+
+        RETURNS
+        -------
+            str: The path of the linked page, relative to the directory of the pages of this object
+        """
+        return self.__prefixes[category] + page + ".md"
+
+
+# ---------------------------------------------------------------------------
+
+# The links from each documentation directory (None for the root of the output directory), shared by all pages
+PAGE_LINKS: dict[DocFileCategory | None, PageLinks] = {category: PageLinks(category)
+                                                       for category in (*DocFileCategory, None)}
@@ -0,0 +1,477 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.modelization.serialization.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Compact binary serialization of the documentation model of a header file.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+A serialized model is made of:
+    - a header: the magic bytes, the format version, the type code of the integers,
+      the number of strings and the number of integers
+    - the integers, little-endian: the length of each string of the string table, the tag table, then the records
+    - the string table: the distinct strings of the model, utf-8 encoded one after the other
+
+A string is stored once and referenced by its index in the string table (0 is None), and a record
+(file, function, tag, enumeration) is a sequence of integers prefixed by its length, so a reader skips
+the fields added after its version. The class of a record is given by its position, never by its name.
+The functions refer to the tags by their index in the tag table: a tag is frozen once added to a function,
+so the identical tags of a header (same parameter, same return value) are read once and shared.
+
+"""
+
+import sys
+import struct
+from array import array
+from itertools import accumulate
+
+from .tags import TagKeys, Tag, TypedTag, ParameterTag
+from .enum_desc import EnumDesc
+from .function_desc import FunctionDesc
+from .file_desc import FileDesc
+from .string_pool import StringPool
+
+# The first bytes of a serialized model, and the version of the format (a mismatch can't be read)
+MAGIC: bytes = b"CDGM"
+FORMAT_VERSION: int = 1
+
+# The header: magic, version, type code of the integers, number of strings, number of integers
+HEADER: struct.Struct = struct.Struct("<4sBcII")
+
+# The kind of a tag record, of a tag value and of an enumeration item value
+TAG_KINDS: tuple[type, ...] = (Tag, TypedTag, ParameterTag)
+VALUE_TEXT, VALUE_LINES = 0, 1
+ITEM_TEXT, ITEM_INTEGER = 0, 1
+
+_TAG_KEYS: dict[str, TagKeys] = {key.value: key for key in TagKeys}
+
+# ---------------------------------------------------------------------------
+
+
+def serialize(file_desc: FileDesc) -> bytes:
+    """
+    SUMMARY
+    -------
+        This public function serializes the model of a header file (its functions, enumerations and tags).
+
+    PARAMETERS
+    ----------
+        - file_desc (FileDesc): The description of the header file
+
+    RETURNS
+    -------
+        bytes: The serialized model, read back by 'deserialize'
+    """
+    encoder: _Encoder = _Encoder()
+    encoder.file(file_desc)
+
+    strings: list[str] = list(encoder.strings)
+    integers: list[int] = [len(string) for string in strings]
+    integers.append(len(encoder.tags))
+    integers += encoder.tag_integers
+    integers += encoder.integers
+
+    # the smallest integers that hold all values
+    largest: int = max(integers, default=0)
+    type_code: str = "H" if largest <= 0xFFFF else "I" if largest <= 0xFFFFFFFF else "Q"
+
+    values: array = array(type_code, integers)
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    return b"".join((HEADER.pack(MAGIC, FORMAT_VERSION, type_code.encode("ascii"), len(strings), len(integers)),
+                     values.tobytes(), "".join(strings).encode("utf-8")))
+
+
+# ---------------------------------------------------------------------------
+
+
+def deserialize(data: bytes, pool: StringPool = None) -> FileDesc:
+    """
+    SUMMARY
+    -------
+        This public function reads back the model of a header file serialized by 'serialize'.
+
+    PARAMETERS
+    ----------
+        - data (bytes): The serialized model
+        - pool (StringPool): Optional parameter, the pool of the types, hints and parameter names,
+                             by default they are only shared within the header
+
+    RETURNS
+    -------
+        FileDesc: The description of the header file
+
+    RAISES
+    ------
+        - ValueError: If the data isn't a serialized model of this format version, or is truncated
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("The serialized model is truncated !")
+
+    magic, version, type_code, string_count, integer_count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("The data isn't a serialized model !")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"The serialized model has the format version {version} instead of {FORMAT_VERSION} !")
+
+    try:
+        values: array = array(type_code.decode("ascii"))
+        end: int = HEADER.size + integer_count * values.itemsize
+        values.frombytes(data[HEADER.size:end])
+    except ValueError as error:
+        raise ValueError(f"The serialized model is corrupted: {error}") from None
+
+    if len(values) != integer_count:
+        raise ValueError("The serialized model is truncated !")
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    integers: list[int] = values.tolist()
+    text: str = data[end:].decode("utf-8")
+    offsets: list[int] = [0, *accumulate(integers[:string_count])]
+
+    # the index 0 is None, the string i is at the index i + 1
+    strings: list[str | None] = [None]
+    strings.extend(text[start:stop] for start, stop in zip(offsets, offsets[1:]))
+
+    if pool is None:
+        pool = StringPool()
+
+    try:
+        tags, position = _read_tags(integers, strings, string_count, pool)
+        return _read_file(integers, strings, tags, position)
+    except (IndexError, KeyError, TypeError) as error:
+        raise ValueError(f"The serialized model is corrupted: {error!r}") from None
+
+
+# ---------------------------------------------------------------------------
+
+
+class _Encoder:
+    """
+    SUMMARY
+    -------
+        This private class writes the records of a model, and gathers its distinct strings and tags.
+    """
+
+    __slots__ = ("strings", "tags", "tag_integers", "integers")
+
+    def __init__(self) -> None:
+        # the index of each distinct string in the string table, from 1 (0 is None)
+        self.strings: dict[str, int] = dict()
+        # the index of each distinct tag record in the tag table, and the records of the table
+        self.tags: dict[tuple[int, ...], int] = dict()
+        self.tag_integers: list[int] = list()
+        self.integers: list[int] = list()
+
+    # ---------------------------------------------------------------------------
+
+    def string(self, value: str | None) -> int:
+        if value is None:
+            return 0
+
+        index: int | None = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings) + 1
+
+        return index
+
+    # ---------------------------------------------------------------------------
+
+    def lines(self, values: list[str] | tuple[str, ...] | None) -> list[int]:
+        # the number of lines + 1, 0 is None
+        if values is None:
+            return [0]
+
+        return [len(values) + 1, *(self.string(value) for value in values)]
+
+    # ---------------------------------------------------------------------------
+
+    def start(self) -> int:
+        self.integers.append(0)
+        return len(self.integers)
+
+    # ---------------------------------------------------------------------------
+
+    def end(self, start: int) -> None:
+        self.integers[start - 1] = len(self.integers) - start
+
+    # ---------------------------------------------------------------------------
+
+    def file(self, file_desc: FileDesc) -> None:
+        start: int = self.start()
+
+        self.integers += (self.string(file_desc.get_path()), self.string(file_desc.get_author()),
+                          self.string(file_desc.get_version()))
+        self.integers += self.lines(file_desc.get_summary())
+
+        for symbols in (file_desc.get_namespaces(), file_desc.get_classes()):
+            self.integers.append(len(symbols))
+            for name, summary in symbols.items():
+                self.integers.append(self.string(name))
+                self.integers += self.lines(summary)
+
+        self.integers.append(len(file_desc.get_functions()))
+        for function, class_container, _ in file_desc.get_functions():
+            self.integers.append(self.string(class_container))
+            self.function(function)
+
+        self.integers.append(len(file_desc.get_enums()))
+        for enum in file_desc.get_enums():
+            self.enum(enum)
+
+        self.end(start)
+
+    # ---------------------------------------------------------------------------
+
+    def function(self, function: FunctionDesc) -> None:
+        start: int = self.start()
+
+        self.integers += (self.string(function.get_name()), self.string(function.get_code_line()))
+        self.integers += self.lines(function.get_summary())
+
+        for tags in (function.get_parameters(), function.get_throws()):
+            self.integers.append(len(tags))
+            self.integers += (self.tag(tag) for tag in tags)
+
+        # the index of the return tag + 1, 0 is None
+        return_tag: TypedTag | None = function.get_return_tag()
+        self.integers.append(0 if return_tag is None else self.tag(return_tag) + 1)
+
+        self.end(start)
+
+    # ---------------------------------------------------------------------------
+
+    def tag(self, tag: Tag) -> int:
+        kind: int = TAG_KINDS.index(type(tag))
+        record: list[int] = [kind, self.string(tag.get_key().value)]
+
+        value: str | list[str] | tuple[str, ...] = tag.get_value()
+        if isinstance(value, str):
+            record += (VALUE_TEXT, self.string(value))
+        else:
+            record.append(VALUE_LINES)
+            record += self.lines(value)
+
+        if kind > 0:
+            record.append(self.string(tag.get_type()))
+        if kind > 1:
+            record.append(self.string(tag.get_name()))
+            record += self.lines(tag.get_hints())
+
+        identity: tuple[int, ...] = tuple(record)
+        index: int | None = self.tags.get(identity)
+        if index is None:
+            index = self.tags[identity] = len(self.tags)
+            self.tag_integers.append(len(record))
+            self.tag_integers += record
+
+        return index
+
+    # ---------------------------------------------------------------------------
+
+    def enum(self, enum: EnumDesc) -> None:
+        start: int = self.start()
+
+        self.integers.append(self.string(enum.get_name()))
+        self.integers += self.lines(enum.get_summary())
+
+        items: dict[str, object] = enum.get_items()
+        self.integers.append(len(items))
+        for key, value in items.items():
+            # the integers are stored as text, they can be negative or larger than the integers of the format
+            self.integers += (self.string(key), ITEM_INTEGER if isinstance(value, int) else ITEM_TEXT,
+                              self.string(str(value)))
+
+        self.end(start)
+
+
+# ---------------------------------------------------------------------------
+
+
+def _read_lines(integers: list[int], strings: list[str | None], position: int) -> tuple[list[str] | None, int]:
+    """
+    SUMMARY
+    -------
+        This private function reads a list of strings: the number of strings + 1 (0 is None), then their indexes.
+    """
+    count: int = integers[position] - 1
+    if count < 0:
+        return None, position + 1
+
+    position += 1
+    return [strings[index] for index in integers[position:position + count]], position + count
+
+
+# ---------------------------------------------------------------------------
+
+
+def _read_tags(integers: list[int], strings: list[str | None], position: int,
+               pool: StringPool) -> tuple[list[Tag], int]:
+    """
+    SUMMARY
+    -------
+        This private function reads the tag table: the number of tags, then their records.
+    """
+    tags: list[Tag] = list()
+
+    count: int = integers[position]
+    position += 1
+    for _ in range(count):
+        tag, position = _read_tag(integers, strings, position, pool)
+        tags.append(tag)
+
+    return tags, position
+
+
+# ---------------------------------------------------------------------------
+
+
+def _read_file(integers: list[int], strings: list[str | None], tags: list[Tag], position: int) -> FileDesc:
+    """
+    SUMMARY
+    -------
+        This private function reads the record of a header file, the records end where their length says.
+        The records are read with explicit positions, a method call per field would double the time.
+    """
+    file_desc: FileDesc = FileDesc(strings[integers[position + 1]])
+    author: str | None = strings[integers[position + 2]]
+    version: str | None = strings[integers[position + 3]]
+
+    summary, position = _read_lines(integers, strings, position + 4)
+    file_desc.set_summary(summary)
+    if author is not None:
+        file_desc.set_author(author)
+    if version is not None:
+        file_desc.set_version(version)
+
+    for add_symbol in (file_desc.add_namespace, file_desc.add_class):
+        count: int = integers[position]
+        position += 1
+        for _ in range(count):
+            name: str = strings[integers[position]]
+            summary, position = _read_lines(integers, strings, position + 1)
+            add_symbol(name, summary)
+
+    count = integers[position]
+    position += 1
+    for _ in range(count):
+        class_container: str | None = strings[integers[position]]
+        function, position = _read_function(integers, strings, tags, position + 1)
+        file_desc.add_function(function, class_container)
+
+    count = integers[position]
+    position += 1
+    for _ in range(count):
+        enum, position = _read_enum(integers, strings, position)
+        file_desc.add_enum(enum)
+
+    return file_desc
+
+
+# ---------------------------------------------------------------------------
+
+
+def _read_function(integers: list[int], strings: list[str | None], tags: list[Tag],
+                   position: int) -> tuple[FunctionDesc, int]:
+    """
+    SUMMARY
+    -------
+        This private function reads the record of a function, it returns the position after the record.
+    """
+    end: int = position + 1 + integers[position]
+    name: str = strings[integers[position + 1]]
+    code_line: str = strings[integers[position + 2]]
+
+    summary, position = _read_lines(integers, strings, position + 3)
+    function: FunctionDesc = FunctionDesc(name, code_line, summary)
+
+    for add_tags in (function.add_parameters, function.add_exceptions):
+        count: int = integers[position]
+        position += 1
+        if count:
+            add_tags([tags[index] for index in integers[position:position + count]])
+            position += count
+
+    if integers[position]:
+        function.set_return_tag(tags[integers[position] - 1])
+
+    return function, end
+
+
+# ---------------------------------------------------------------------------
+
+
+def _read_tag(integers: list[int], strings: list[str | None], position: int,
+              pool: StringPool) -> tuple[Tag, int]:
+    """
+    SUMMARY
+    -------
+        This private function reads the record of a tag, it returns the position after the record.
+        The type, the name and the hints are interned, like the lexer does.
+    """
+    end: int = position + 1 + integers[position]
+    kind, key, value_kind, value = integers[position + 1:position + 5]
+
+    if value_kind == VALUE_TEXT:
+        value = strings[value]
+        position += 5
+    else:
+        value, position = _read_lines(integers, strings, position + 4)
+
+    if kind == 0:
+        return Tag(_TAG_KEYS[strings[key]], value), end
+    if kind == 1:
+        return TypedTag(_TAG_KEYS[strings[key]], value, pool.intern(strings[integers[position]])), end
+
+    hints, _ = _read_lines(integers, strings, position + 2)
+    return ParameterTag(_TAG_KEYS[strings[key]], value, pool.intern(strings[integers[position]]),
+                        pool.intern(strings[integers[position + 1]]), pool.intern_all(hints)), end
+
+
+# ---------------------------------------------------------------------------
+
+
+def _read_enum(integers: list[int], strings: list[str | None], position: int) -> tuple[EnumDesc, int]:
+    """
+    SUMMARY
+    -------
+        This private function reads the record of an enumeration, it returns the position after the record.
+    """
+    end: int = position + 1 + integers[position]
+    name: str = strings[integers[position + 1]]
+
+    summary, position = _read_lines(integers, strings, position + 2)
+    enum: EnumDesc = EnumDesc(name, summary)
+
+    count: int = integers[position]
+    position += 1
+    for _ in range(count):
+        key, kind, value = integers[position:position + 3]
+        enum.add_item(strings[key], int(strings[value]) if kind == ITEM_INTEGER else strings[value])
+        position += 3
+
+    return enum, end
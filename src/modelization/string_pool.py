@@ -0,0 +1,125 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.modelization.string_pool.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Interns the strings that repeat across the model (types, hints and parameter names).
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+from typing import Iterable
+
+# ---------------------------------------------------------------------------
+
+
+class StringPool:
+    """
+    SUMMARY
+    -------
+        This class maps each distinct string to a canonical instance, so the equal strings of the model
+        (int, const std::string&, in, out...) are a single object instead of one copy per tag.
+        The dictionary lookups of canonical instances (types by name, linked cells) succeed on identity,
+        without comparing the characters.
+
+        The pooled strings are compared with == and looked up in dictionaries, never with an explicit identity test:
+        CPython already tests the identity first in both, 'a is b or a == b' would only add a test to each comparison
+        of two different strings, and would miss the equal strings from outside the pool
+        (see the string_pool benchmark).
+
+        Unlike sys.intern, a pool only lives as long as its owner (a run of the pipeline),
+        so the strings of the removed headers aren't kept forever by a long-running process.
+    """
+
+    __slots__ = ("__strings",)
+
+    def __init__(self) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the constructor of the StringPool class.
+        """
+        self.__strings: dict[str, str] = dict()
+
+    # ---------------------------------------------------------------------------
+    # GETTERS
+    # ---------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """
+        SUMMARY
+        -------
+            Overloads of len method, returns the number of distinct strings of the pool.
+
+        RETURNS
+        -------
+            int: The number of canonical instances
+        """
+        return len(self.__strings)
+
+    # ---------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ---------------------------------------------------------------------------
+
+    def intern(self, value: str | None) -> str | None:
+        """
+        SUMMARY
+        -------
+            This public method returns the canonical instance of a string, the string itself the first time.
+
+        PARAMETERS
+        ----------
+            - value (str | None): The string to intern, None is returned as is
+
+        RETURNS
+        -------
+            str | None: The canonical instance equal to the string
+        """
+        if value is None:
+            return None
+
+        return self.__strings.setdefault(value, value)
+
+    # ---------------------------------------------------------------------------
+
+    def intern_all(self, values: Iterable[str] | None) -> list[str] | None:
+        """
+        SUMMARY
+        -------
+            This public method returns the canonical instances of several strings.
+
+        PARAMETERS
+        ----------
+            - values (Iterable[str] | None): The strings to intern, None is returned as is
+
+        RETURNS
+        -------
+            list[str] | None: The canonical instances, in the same order
+        """
+        if values is None:
+            return None
+
+        strings: dict[str, str] = self.__strings
+        return [strings.setdefault(value, value) for value in values]
@@ -32,9 +32,6 @@ This banner notice must not be removed.
 
 from enum import Enum
 from typing import Self
-from copy import copy
-
-from src.modelization.tags import TagKeys
 
 # ---------------------------------------------------------------------------
 
@@ -45,21 +42,21 @@ class TagKeys(Enum):
     -------
         This class is an enumeration that list all docstring keys supported.
     """
-    FILE = "file",
-    NAMESPACE = "namespace",
-    CLASS = "class",
-    ENUMERATION = "enum",
-    METHOD = "method",
-    FUNCTION = "func",
-    AUTHOR = "author",
-    VERSION = "version",
-    BRIEF = "brief",
-    PARAMETER = "param",
-    EXCEPTION = "throw",
+    FILE = "file"
+    NAMESPACE = "namespace"
+    CLASS = "class"
+    ENUMERATION = "enum"
+    METHOD = "method"
+    FUNCTION = "func"
+    AUTHOR = "author"
+    VERSION = "version"
+    BRIEF = "brief"
+    PARAMETER = "param"
+    EXCEPTION = "throw"
     RETURN = "return"
 
     @classmethod
-    def from_string(self, key: str) -> Self:
+    def from_string(cls, key: str) -> Self | None:
         """
         SUMMARY
         -------
@@ -71,13 +68,13 @@ class TagKeys(Enum):
 
         RETURNS
         -------
-            Self: The item of the enumeration corresponding.
+            Self | None: The item of the enumeration corresponding, None if the key isn't supported.
         """
-        for current_key in TagKeys:
-            if key == current_key.value:
-                return key
-        
-        return None
+        return _TAG_KEYS.get(key)
+
+
+# The items of the TagKeys enumeration by docstring key, to find a key in constant time
+_TAG_KEYS: dict[str, TagKeys] = {item.value: item for item in TagKeys}
 
 
 # ---------------------------------------------------------------------------
@@ -90,6 +87,8 @@ class Tag:
         This class represents a simple tag in the docstring (@key {value}) 
     """
 
+    __slots__ = ("_key", "_value", "_frozen")
+
     def __init__(self, key: TagKeys, value: str | list[str] = None) -> None:
         """
         SUMMARY
@@ -105,7 +104,8 @@ class Tag:
             value = list()
 
         self._key: TagKeys = key
-        self._value: str | list[str] = value
+        self._value: str | list[str] | tuple[str, ...] = value
+        self._frozen: bool = False
 
     # ---------------------------------------------------------------------------
     # GETTERS
@@ -126,23 +126,58 @@ class Tag:
     
     # ---------------------------------------------------------------------------
 
-    def get_value(self) -> str | list[str]:
+    def get_value(self) -> str | list[str] | tuple[str, ...]:
         """
         SUMMARY
         -------
             This public method is the getter of the '_value' attribute.
-            Returns the value of the tag.
+            Returns the value of the tag, the lines of a frozen tag are a tuple.
 
         RETURNS
         -------
-            str | list[str]: The tag value (one or multiple lines)
+            str | list[str] | tuple[str, ...]: The tag value (one or multiple lines)
         """
         return self._value
 
+    # ---------------------------------------------------------------------------
+
+    def is_frozen(self) -> bool:
+        """
+        SUMMARY
+        -------
+            This public method is the getter of the '_frozen' attribute.
+            Returns if the tag is read-only (see the 'freeze' method).
+
+        RETURNS
+        -------
+            bool: True if the tag can't be modified anymore
+        """
+        return self._frozen
+
     # ---------------------------------------------------------------------------
     # SETTERS
     # ---------------------------------------------------------------------------
 
+    def freeze(self) -> Self:
+        """
+        SUMMARY
+        -------
+            This public method makes the tag read-only, its setters raise an error from now on
+            and its lines are stored in a tuple, so the value returned by 'get_value' can't be modified either.
+            A frozen tag can be shared without being copied, a mutable copy is given by 'copy.copy'.
+
+        RETURNS
+        -------
+            Self: The instance itself
+        """
+        if isinstance(self._value, list):
+            self._value = tuple(self._value)
+
+        self._frozen = True
+        return self
+
+    # ---------------------------------------------------------------------------
+
     def set_value(self, value: str | list[str]) -> None:
         """
         SUMMARY
@@ -156,15 +191,48 @@ class Tag:
 
         RAISES
         ------
-            - ValueError: If the value isn't an instance of 'str' or 'list'
+            - ValueError: If the value isn't an instance of 'str' or 'list', or if the tag is frozen
         """
+        self._check_mutable()
+
         if isinstance(value, str):
             self._value = value
         elif isinstance(value, list) and isinstance(self._value, list):
             self._value.extend(value)
         else:
             raise ValueError(f"The 'value' parameter must be a 'str' or 'list' instance but not {value}")
-        
+
+    # ---------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ---------------------------------------------------------------------------
+
+    def _check_mutable(self) -> None:
+        """
+        SUMMARY
+        -------
+            This protected method checks that the tag can be modified, it is called by all setters.
+
+        RAISES
+        ------
+            - ValueError: If the tag is frozen
+        """
+        if self._frozen:
+            raise ValueError(f"The tag '@{self._key.value}' is frozen, modify a copy of it instead !")
+
+    # ---------------------------------------------------------------------------
+
+    def _copy_value(self) -> str | list[str]:
+        """
+        SUMMARY
+        -------
+            This protected method returns a mutable copy of the value, a copy never shares the lines of the tag.
+
+        RETURNS
+        -------
+            str | list[str]: The tag value (one or multiple lines)
+        """
+        return self._value if isinstance(self._value, str) else list(self._value)
+
     # ---------------------------------------------------------------------------
     # OVERLOADS copy
     # ---------------------------------------------------------------------------
@@ -173,13 +241,13 @@ class Tag:
         """
         SUMMARY
         -------
-            Overloads of copy method.
+            Overloads of copy method, the copy is never frozen.
 
         RETURNS
         -------
             Self: The object copy of the instance.
         """
-        return Tag(self._key, value=self._value)
+        return Tag(self._key, value=self._copy_value())
 
 
 # ---------------------------------------------------------------------------
@@ -193,6 +261,8 @@ class TypedTag(Tag):
         TypedTag pattern: @key {type} {value}
     """
 
+    __slots__ = ("_type",)
+
     def __init__(self, key: TagKeys, value: str | list[str] = None,
                  type: str = None) -> None:
         """
@@ -241,7 +311,12 @@ class TypedTag(Tag):
         PARAMETERS
         ----------
             - type (str): The tag type to set
+
+        RAISES
+        ------
+            - ValueError: If the tag is frozen
         """
+        self._check_mutable()
         self._type = type
 
     # ---------------------------------------------------------------------------
@@ -252,13 +327,13 @@ class TypedTag(Tag):
         """
         SUMMARY
         -------
-            Overloads of copy method.
+            Overloads of copy method, the copy is never frozen.
 
         RETURNS
         -------
             Self: The object copy of the instance.
         """
-        return TypedTag(self._key, type=self._type, value=self._value)
+        return TypedTag(self._key, type=self._type, value=self._copy_value())
 
 
 # ---------------------------------------------------------------------------
@@ -272,6 +347,8 @@ class ParameterTag(TypedTag):
         ParameterTag pattern: @key {name} {type} {hints} {value}
     """
 
+    __slots__ = ("_name", "_hints")
+
     def __init__(self, key: TagKeys, value: str | list[str] = None,
                  type: str = None,
                  name: str = None, hints: list[str] = None) -> None:
@@ -289,13 +366,11 @@ class ParameterTag(TypedTag):
             - hints (list[str]): Optional parameter, the hints of the tag (in, out, in/out, optional...)
         """
 
-        super().__init__(key, type, value)
-
-        if hints is None:
-            hints = list()
+        super().__init__(key, value, type)
 
         self._name: str = name
-        self._hints: list[str] = hints
+        # stored as a tuple, the tags without hints share the empty tuple instead of each owning an empty list
+        self._hints: tuple[str, ...] = tuple(hints) if hints else ()
 
     # ---------------------------------------------------------------------------
     # GETTERS
@@ -327,7 +402,7 @@ class ParameterTag(TypedTag):
         -------
             list[str]: The parameter tag hints
         """
-        return self._hints.copy()
+        return list(self._hints)
     
     # ---------------------------------------------------------------------------
     # SETTERS
@@ -343,7 +418,12 @@ class ParameterTag(TypedTag):
         PARMETERS
         ---------
             - name (str): The parameter tag name to set
+
+        RAISES
+        ------
+            - ValueError: If the tag is frozen
         """
+        self._check_mutable()
         self._name = name
 
     # ---------------------------------------------------------------------------
@@ -358,8 +438,13 @@ class ParameterTag(TypedTag):
         PARMETERS
         ---------
             - hints (list[str]): The parameter tag hints to add
+
+        RAISES
+        ------
+            - ValueError: If the tag is frozen
         """
-        self._hints.extend(hints)
+        self._check_mutable()
+        self._hints += tuple(hints)
 
     # ---------------------------------------------------------------------------
     # OVERLOADS copy
@@ -369,10 +454,10 @@ class ParameterTag(TypedTag):
         """
         SUMMARY
         -------
-            Overloads of copy method.
+            Overloads of copy method, the copy is never frozen.
 
         RETURNS
         -------
             Self: The object copy of the instance.
         """
-        return ParameterTag(self._key, value=self._value, type=self._type, name=self._name, hints=self._hints)
+        return ParameterTag(self._key, value=self._copy_value(), type=self._type, name=self._name, hints=list(self._hints))
@@ -0,0 +1,264 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.parse_cache.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Content-addressed cache of the parsed headers, shared by all checkouts and runs of a machine.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import os
+import hashlib
+
+from src.lexer import LEXER_VERSION
+from src.modelization import FileDesc, StringPool, deserialize
+
+# The version of the parser and of the cached model, changes when the same header gives another model
+CACHE_VERSION: int = 2
+
+# The default maximum size of the cache directory, in bytes
+DEFAULT_CACHE_SIZE: int = 1024 * 1024 * 1024
+
+# The environment variable of the default cache directory, so the CI jobs don't repeat the option
+CACHE_DIR_VARIABLE: str = "CPPDOCGEN_CACHE_DIR"
+
+# ---------------------------------------------------------------------------
+
+
+class ParseCache:
+    """
+    SUMMARY
+    -------
+        This class is a local cache directory of parsed headers, in the spirit of ccache.
+        An entry is found by the content hash of the header, its path and the versions of the lexer and the parser,
+        so the checkouts of different branches share the entries of the headers they have in common.
+        The path is part of the key because the model holds it (the page names are derived from it).
+
+        An entry is the serialized description of the header (see serialize), the bytes sent by the parsing processes.
+        The entries are written atomically, several runs can share the cache directory.
+        The least recently used entries are evicted when the directory is larger than its maximum size:
+        the modification time of an entry is updated each time it is used.
+    """
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the constructor of the ParseCache class, it creates the cache directory.
+
+        PARAMETERS
+        ----------
+            - directory (str): The path of the cache directory
+            - max_size (int): Optional parameter, the maximum size of the cache directory in bytes
+
+        RAISES
+        ------
+            - ValueError: If the maximum size is negative
+        """
+        if max_size < 0:
+            raise ValueError(f"The maximum size of the parse cache can't be negative ({max_size}) !")
+
+        self.__directory: str = directory
+        self.__max_size: int = max_size
+
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__stored: int = 0
+        self.__evicted: int = 0
+        # the size of the directory after the last trim, and whether entries were stored since then
+        self.__size: int | None = None
+        self.__grown: bool = False
+
+        os.makedirs(directory, exist_ok=True)
+
+    # ---------------------------------------------------------------------------
+    # GETTERS
+    # ---------------------------------------------------------------------------
+
+    def get_statistics(self) -> dict[str, int]:
+        """
+        SUMMARY
+        -------
+            This public method returns the statistics of the cache since it was created.
+
+        RETURNS
+        -------
+            dict[str, int]: The number of hits, misses, stored and evicted entries,
+                and the size of the directory in bytes after the last 'trim' (-1 before)
+        """
+        return {"hits": self.__hits, "misses": self.__misses, "stored": self.__stored, "evicted": self.__evicted,
+                "size": -1 if self.__size is None else self.__size}
+
+    # ---------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ---------------------------------------------------------------------------
+
+    @staticmethod
+    def get_key(relative_path: str, content_hash: str) -> str:
+        """
+        SUMMARY
+        -------
+            This public static method returns the key of the entry of a header.
+
+        PARAMETERS
+        ----------
+            - relative_path (str): The path of the header, relative to the input directory ('/' separated)
+            - content_hash (str): The content hash of the header (see hash_file)
+
+        RETURNS
+        -------
+            str: The hexadecimal key of the entry
+        """
+        identity: str = f"{CACHE_VERSION}:{LEXER_VERSION}:{relative_path}:{content_hash}"
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    # ---------------------------------------------------------------------------
+
+    def load(self, key: str, pool: StringPool = None) -> FileDesc | None:
+        """
+        SUMMARY
+        -------
+            This public method returns the parsed header of an entry, and marks the entry as recently used.
+            An entry that can't be read (removed by another run, truncated) is a miss.
+
+        PARAMETERS
+        ----------
+            - key (str): The key of the entry (see 'get_key')
+            - pool (StringPool): Optional parameter, the pool of the types, hints and parameter names of the run
+
+        RETURNS
+        -------
+            FileDesc | None: The description of the header file, None if it isn't cached
+        """
+        path: str = self.__get_entry_path(key)
+
+        try:
+            with open(path, 'rb') as file:
+                file_desc: FileDesc = deserialize(file.read(), pool)
+            os.utime(path)
+        except FileNotFoundError:
+            self.__misses += 1
+            return None
+        except (OSError, ValueError):
+            self.__misses += 1
+            self.__remove_entry(path)
+            return None
+
+        self.__hits += 1
+        return file_desc
+
+    # ---------------------------------------------------------------------------
+
+    def store(self, key: str, data: bytes) -> None:
+        """
+        SUMMARY
+        -------
+            This public method writes the entry of a parsed header, a cache that can't be written is ignored.
+
+        PARAMETERS
+        ----------
+            - key (str): The key of the entry (see 'get_key')
+            - data (bytes): The serialized description of the header file (see serialize)
+        """
+        path: str = self.__get_entry_path(key)
+        temporary_path: str = f"{path}.{os.getpid()}.tmp"
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(temporary_path, 'wb') as file:
+                file.write(data)
+            os.replace(temporary_path, path)
+        except OSError:
+            self.__remove_entry(temporary_path)
+            return
+
+        self.__stored += 1
+        self.__grown = True
+
+    # ---------------------------------------------------------------------------
+
+    def trim(self) -> None:
+        """
+        SUMMARY
+        -------
+            This public method evicts the least recently used entries until the directory fits in its maximum size.
+            The whole directory is scanned, so it is only done once, and then after new entries were stored.
+        """
+        if self.__size is not None and not self.__grown:
+            return
+
+        entries: list[tuple[int, int, str]] = list()
+
+        for sub_directory in os.scandir(self.__directory):
+            if not sub_directory.is_dir(follow_symlinks=False):
+                continue
+
+            for entry in os.scandir(sub_directory.path):
+                try:
+                    stat: os.stat_result = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        size: int = sum(entry_size for _, entry_size, _ in entries)
+        entries.sort()
+
+        for _, entry_size, path in entries:
+            if size <= self.__max_size:
+                break
+
+            self.__remove_entry(path)
+            self.__evicted += 1
+            size -= entry_size
+
+        self.__size = size
+        self.__grown = False
+
+    # ---------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ---------------------------------------------------------------------------
+
+    def __get_entry_path(self, key: str) -> str:
+        """
+        SUMMARY
+        -------
+            This private method returns the path of an entry, the entries are spread over 256 sub directories.
+        """
+        return os.path.join(self.__directory, key[:2], key[2:])
+
+    # ---------------------------------------------------------------------------
+
+    @staticmethod
+    def __remove_entry(path: str) -> None:
+        """
+        SUMMARY
+        -------
+            This private static method removes an entry file, already removed by another run or not.
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,437 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.parser.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Parses the docstrings of a c++ header file into the modelization classes.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import os
+import re
+from time import perf_counter
+
+from src.lexer import lex_docblock
+from src.profiler import Profiler, TimedIterator, get_profiler
+from src.scanner import scan_docblocks
+from src.modelization import TagKeys, Tag, ParameterTag, EnumDesc, FunctionDesc, FileDesc, StringPool
+
+# ---------------------------------------------------------------------------
+
+FUNCTION_NAME_PATTERN: re.Pattern = re.compile(r"(operator\s*\(\s*\)|operator\s*[^\s(]+|~?\w+)\s*\(")
+ENUM_NAME_PATTERN: re.Pattern = re.compile(r"\benum\s+(?:class\s+|struct\s+)?(\w+)")
+CLASS_NAME_PATTERN: re.Pattern = re.compile(r"\b(?:class|struct)\s+(\w+)")
+NAMESPACE_NAME_PATTERN: re.Pattern = re.compile(r"\bnamespace\s+([\w:]+)")
+IDENTIFIER_PATTERN: re.Pattern = re.compile(r"[A-Za-z_]\w*")
+# the innermost template arguments or array bounds of a parameter, removed until none is left
+BRACKETS_PATTERN: re.Pattern = re.compile(r"<[^<>]*>|\[[^\[\]]*\]")
+# the name of a function pointer or reference parameter: int (*callback)(int)
+POINTER_NAME_PATTERN: re.Pattern = re.compile(r"\(\s*[*&]+\s*(\w+)\s*\)")
+
+# the words of a parameter type that aren't a type by themselves, and the fundamental types
+TYPE_QUALIFIERS: frozenset[str] = frozenset(("const", "volatile", "struct", "class", "enum", "typename", "register"))
+FUNDAMENTAL_TYPES: frozenset[str] = frozenset(("void", "bool", "char", "wchar_t", "char8_t", "char16_t", "char32_t",
+                                               "short", "int", "long", "signed", "unsigned", "float", "double",
+                                               "auto"))
+
+# the tag keys that declare the kind of the documented symbol
+KIND_KEYS: tuple[TagKeys, ...] = (TagKeys.FILE, TagKeys.NAMESPACE, TagKeys.CLASS,
+                                  TagKeys.ENUMERATION, TagKeys.METHOD, TagKeys.FUNCTION)
+
+# ---------------------------------------------------------------------------
+
+
+class _ParserState:
+    """
+    SUMMARY
+    -------
+        This private class stores the documentation context while the docblocks of a header are parsed.
+    """
+
+    def __init__(self, file_desc: FileDesc, pool: StringPool) -> None:
+        self.file_desc: FileDesc = file_desc
+        self.pool: StringPool = pool
+        self.namespace: str | None = None
+        self.class_name: str | None = None
+
+        # the depth of the docblock of the namespace, and of the docblocks of the enclosing classes (nested last)
+        self.namespace_depth: int = 0
+        self.classes: list[tuple[str, int]] = list()
+
+    def open_class(self, name: str, depth: int) -> None:
+        """
+        SUMMARY
+        -------
+            This public method enters the body of a class, the undocumented functions are its methods until it's closed.
+        """
+        self.classes.append((name, depth))
+        self.class_name = name
+
+    def close_scopes(self, depth: int) -> None:
+        """
+        SUMMARY
+        -------
+            This public method leaves the class and the namespace closed before a docblock of the given depth:
+            their body is deeper than their docblock.
+        """
+        while self.classes and depth <= self.classes[-1][1]:
+            self.classes.pop()
+
+        self.class_name = self.classes[-1][0] if self.classes else None
+        if self.namespace is not None and depth <= self.namespace_depth:
+            self.namespace = None
+
+    def qualify(self, name: str, in_class: bool = False) -> str:
+        """
+        SUMMARY
+        -------
+            This public method returns the qualified name (namespace::class::name) of a symbol in the current context.
+        """
+        scope: str | None = self.class_name if in_class and self.class_name is not None else self.namespace
+        return name if scope is None or "::" in name else f"{scope}::{name}"
+
+
+# ---------------------------------------------------------------------------
+
+
+def parse_header(path: str, input_root: str, pool: StringPool = None) -> FileDesc:
+    """
+    SUMMARY
+    -------
+        This public function parses all docblocks (/** ... */) of a c++ header file.
+        It is the unit of work of the parsing stage, so it only takes and returns picklable objects.
+
+    PARAMETERS
+    ----------
+        - path (str): The path of the header file
+        - input_root (str): The path of the input directory, used to compute the relative path of the file
+        - pool (StringPool): Optional parameter, the pool of the types, hints and parameter names of the run,
+                             by default they are only interned within the header
+
+    RETURNS
+    -------
+        FileDesc: The description of the header file and all its documented symbols
+    """
+    if pool is None:
+        pool = StringPool()
+
+    state: _ParserState = _ParserState(FileDesc(os.path.relpath(path, input_root)), pool)
+
+    profiler: Profiler | None = get_profiler()
+    if profiler is not None:
+        return _profile_header(state, path, profiler)
+
+    for block, declaration, depth in scan_docblocks(path):
+        _parse_docblock(state, block, declaration, depth)
+
+    return state.file_desc
+
+
+# ---------------------------------------------------------------------------
+
+
+def get_parameter_names(declaration: str) -> list[str]:
+    """
+    SUMMARY
+    -------
+        This public function returns the names of the parameters declared in the signature of a function.
+        The unnamed parameters (a type only), the variadic ones and 'void' are skipped.
+
+    PARAMETERS
+    ----------
+        - declaration (str): The declaration of the function, from its return type to its body or ';'
+
+    RETURNS
+    -------
+        list[str]: The names of the named parameters, in declaration order
+    """
+    match: re.Match | None = FUNCTION_NAME_PATTERN.search(declaration)
+    if match is None:
+        return list()
+
+    # most signatures have no nested brackets, their parameters are split at once
+    end: int = declaration.find(")", match.end())
+    signature: str = declaration[match.end():end]
+    if end != -1 and not any(bracket in signature for bracket in "(<[{"):
+        parameters: list[str] = signature.split(",")
+    else:
+        parameters = _split_parameters(declaration, match.end())
+
+    names: list[str] = list()
+    for parameter in parameters:
+        name: str | None = _get_parameter_name(parameter.partition("=")[0])
+        if name is not None:
+            names.append(name)
+
+    return names
+
+
+# ---------------------------------------------------------------------------
+
+
+def _split_parameters(declaration: str, start: int) -> list[str]:
+    """
+    SUMMARY
+    -------
+        This private function splits the parameters of a signature on the commas outside of the nested brackets,
+        from the start of the parameter list to its closing parenthesis.
+    """
+    parameters: list[str] = list()
+    depth: int = 0
+
+    for index in range(start, len(declaration)):
+        character: str = declaration[index]
+        if character in "(<[{":
+            depth += 1
+        elif character in ")>]}" and depth > 0:
+            depth -= 1
+        elif character == ")" or (character == "," and depth == 0):
+            parameters.append(declaration[start:index])
+            start = index + 1
+            if character == ")":
+                break
+
+    return parameters
+
+
+# ---------------------------------------------------------------------------
+
+
+def _get_parameter_name(parameter: str) -> str | None:
+    """
+    SUMMARY
+    -------
+        This private function returns the name of a parameter declaration, None if the parameter is unnamed.
+    """
+    if "(" in parameter:
+        pointer: re.Match | None = POINTER_NAME_PATTERN.search(parameter)
+        if pointer is not None:
+            return pointer.group(1)
+
+    previous: str | None = None
+    while previous != parameter and ("<" in parameter or "[" in parameter):
+        previous, parameter = parameter, BRACKETS_PATTERN.sub("", parameter)
+
+    identifiers: list[re.Match] = list(IDENTIFIER_PATTERN.finditer(parameter))
+    if len(identifiers) < 2:
+        return None
+
+    # the name follows a type, it isn't a qualified name itself (std::string is a type)
+    name: re.Match = identifiers[-1]
+    if (name.group() in TYPE_QUALIFIERS or name.group() in FUNDAMENTAL_TYPES
+            or parameter[:name.start()].rstrip().endswith("::")
+            or all(identifier.group() in TYPE_QUALIFIERS for identifier in identifiers[:-1])):
+        return None
+
+    return name.group()
+
+
+# ---------------------------------------------------------------------------
+
+
+def _profile_header(state: _ParserState, path: str, profiler: Profiler) -> FileDesc:
+    """
+    SUMMARY
+    -------
+        This private function parses the docblocks of a header like 'parse_header', and measures the time spent
+        reading the file (finding the docblocks) apart from the time spent lexing them and building the model.
+    """
+    relative_path: str = state.file_desc.get_path()
+    start: float = perf_counter()
+    docblocks: int = 0
+
+    blocks: TimedIterator = TimedIterator(scan_docblocks(path))
+    for block, declaration, depth in blocks:
+        _parse_docblock(state, block, declaration, depth)
+        docblocks += 1
+
+    profiler.add_time("read", blocks.get_seconds(), relative_path)
+    profiler.add_time("lex", perf_counter() - start - blocks.get_seconds(), relative_path)
+    profiler.add_count("bytes_read", os.path.getsize(path))
+    profiler.add_count("headers_parsed")
+    profiler.add_count("docblocks", docblocks)
+
+    return state.file_desc
+
+
+# ---------------------------------------------------------------------------
+
+
+def _parse_docblock(state: _ParserState, block: str, declaration: str, depth: int) -> None:
+    """
+    SUMMARY
+    -------
+        This private function parses the content of one docblock and adds the symbol it describes in the file description.
+    """
+    state.close_scopes(depth)
+
+    summary: list[str] = list()
+    tags: list[Tag] = list()
+    kind: TagKeys | None = None
+    kind_name: str = ""
+
+    for tag in lex_docblock(block, state.pool):
+        key: TagKeys = tag.get_key()
+
+        if key in KIND_KEYS:
+            if kind is None:
+                kind, kind_name = key, tag.get_value()
+        elif key == TagKeys.BRIEF:
+            summary.extend(tag.get_value())
+        else:
+            tags.append(tag)
+
+    if kind is None:
+        kind = _guess_kind(declaration, state)
+        if kind is None:
+            return
+
+    _add_symbol(state, kind, kind_name, summary, tags, declaration, depth)
+
+
+# ---------------------------------------------------------------------------
+
+
+def _guess_kind(declaration: str, state: _ParserState) -> TagKeys | None:
+    """
+    SUMMARY
+    -------
+        This private function guesses the kind of the documented symbol from its declaration (no kind tag in the docblock).
+    """
+    if NAMESPACE_NAME_PATTERN.match(declaration):
+        return TagKeys.NAMESPACE
+    if ENUM_NAME_PATTERN.search(declaration):
+        return TagKeys.ENUMERATION
+    if "(" not in declaration and CLASS_NAME_PATTERN.search(declaration):
+        return TagKeys.CLASS
+    if "(" in declaration:
+        return TagKeys.FUNCTION if state.class_name is None else TagKeys.METHOD
+
+    return None
+
+
+# ---------------------------------------------------------------------------
+
+
+def _add_symbol(state: _ParserState, kind: TagKeys, name: str, summary: list[str],
+                tags: list[Tag], declaration: str, depth: int) -> None:
+    """
+    SUMMARY
+    -------
+        This private function builds the modelization instance of a docblock and adds it in the file description.
+    """
+    file_desc: FileDesc = state.file_desc
+
+    if kind == TagKeys.FILE:
+        file_desc.set_summary(summary)
+        for tag in tags:
+            if tag.get_key() == TagKeys.AUTHOR:
+                file_desc.set_author(tag.get_value())
+            elif tag.get_key() == TagKeys.VERSION:
+                file_desc.set_version(tag.get_value())
+
+    elif kind == TagKeys.NAMESPACE:
+        name = name or _search_name(NAMESPACE_NAME_PATTERN, declaration)
+        if name:
+            state.namespace, state.namespace_depth, state.class_name = name, depth, None
+            state.classes.clear()
+            file_desc.add_namespace(name, summary)
+
+    elif kind == TagKeys.CLASS:
+        name = name or _search_name(CLASS_NAME_PATTERN, declaration)
+        if name:
+            state.open_class(state.qualify(name), depth)
+            file_desc.add_class(state.class_name, summary)
+
+    elif kind == TagKeys.ENUMERATION:
+        name = name or _search_name(ENUM_NAME_PATTERN, declaration)
+        if name:
+            file_desc.add_enum(EnumDesc(state.qualify(name), summary, _parse_enum_items(declaration)))
+
+    else:
+        name = name or _search_name(FUNCTION_NAME_PATTERN, declaration)
+        if not name:
+            return
+
+        is_method: bool = kind == TagKeys.METHOD and state.class_name is not None
+        function: FunctionDesc = FunctionDesc(state.qualify(name, is_method), declaration, summary)
+
+        function.add_parameters([tag for tag in tags if isinstance(tag, ParameterTag)])
+        function.add_exceptions([tag for tag in tags if tag.get_key() == TagKeys.EXCEPTION])
+        for tag in tags:
+            if tag.get_key() == TagKeys.RETURN:
+                function.set_return_tag(tag)
+
+        file_desc.add_function(function, state.class_name if is_method else None)
+
+
+# ---------------------------------------------------------------------------
+
+
+def _search_name(pattern: re.Pattern, declaration: str) -> str:
+    """
+    SUMMARY
+    -------
+        This private function searches the name of a symbol in its declaration, returns an empty string if not found.
+    """
+    match: re.Match | None = pattern.search(declaration)
+    return "" if match is None else match.group(1)
+
+
+# ---------------------------------------------------------------------------
+
+
+def _parse_enum_items(declaration: str) -> dict[str, object]:
+    """
+    SUMMARY
+    -------
+        This private function parses the items of an enumeration declaration (ITEM = VALUE, ...).
+        The implicit values are computed from the previous integer value.
+    """
+    start: int = declaration.find("{")
+    end: int = declaration.rfind("}")
+    if start == -1:
+        return dict()
+
+    items: dict[str, object] = dict()
+    next_value: int | None = 0
+
+    for item in declaration[start + 1:end if end != -1 else None].split(","):
+        key, _, value = (part.strip() for part in item.partition("="))
+        if not key:
+            continue
+
+        if value:
+            try:
+                next_value = int(value, 0) + 1
+            except ValueError:
+                next_value = None
+            items[key] = value
+        else:
+            items[key] = "" if next_value is None else next_value
+            next_value = None if next_value is None else next_value + 1
+
+    return items
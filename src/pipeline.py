@@ -0,0 +1,885 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.pipeline.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Drives the documentation generation: discover, parse, render and write stages.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import os
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from time import perf_counter
+from typing import Callable, Iterable, Iterator
+
+from src.io_manager import IOManager, DocFileCategory
+from src.manifest import BuildManifest, hash_file
+from src.modelization import FileDesc, StringPool, to_page_name, serialize
+from src.parse_cache import ParseCache
+from src.parser import parse_header, get_parameter_names
+from src.profiler import Profiler, TimedIterator, get_profiler, set_profiler
+from src.rendering import NamespaceIndex, get_references, get_type_mentions, render_file
+from src.search_index import Document, SearchIndex, SEARCH_INDEX_NAME, SEARCH_INDEX_EXTENSION
+from src.symbol_table import SymbolTable
+
+# The number of headers sent to a worker process at once, amortizes the inter-process communication
+CHUNK_SIZE: int = 16
+
+# The default maximum number of headers in flight in each stage of the pipeline
+DEFAULT_MAX_IN_FLIGHT: int = 256
+
+# ---------------------------------------------------------------------------
+
+
+def _parse_batch(paths: list[str], input_root: str, encode: bool = False,
+                 profile: bool = False) -> tuple[list[tuple[FileDesc, bytes | None]], dict | None]:
+    """
+    SUMMARY
+    -------
+        This private function is the task of a worker process, it parses a batch of header files.
+        The descriptions are sent back pickled: pickle decodes faster than 'deserialize', the format of the parse cache
+        is only smaller. With a parse cache ('encode'), each description is also sent serialized (see serialize),
+        so the main process stores it as is instead of encoding it. The headers of the batch share a string pool,
+        so the pickled batch holds each type and parameter name once.
+        When the run is profiled, the measures of the batch are sent back to be merged in the profiler
+        of the main process, None otherwise.
+    """
+    # a forked worker inherits a copy of the profiler of the main process, its measures would be counted twice
+    profiler: Profiler | None = Profiler() if profile else None
+    set_profiler(profiler)
+
+    try:
+        pool: StringPool = StringPool()
+        parsed: list[FileDesc] = [parse_header(path, input_root, pool) for path in paths]
+        return ([(file_desc, serialize(file_desc) if encode else None) for file_desc in parsed],
+                None if profiler is None else profiler.get_state())
+    finally:
+        set_profiler(None)
+
+
+# ---------------------------------------------------------------------------
+
+
+def _get_parsed(future: Future | None, profiler: Profiler | None) -> list[tuple[FileDesc, bytes | None]]:
+    """
+    SUMMARY
+    -------
+        This private function waits for the headers parsed by a worker process (None if all were cached),
+        and merges the measures of the worker in the profiler of the run.
+    """
+    if future is None:
+        return list()
+
+    parsed, state = future.result()
+    if profiler is not None and state is not None:
+        profiler.merge(state)
+
+    return parsed
+
+
+# ---------------------------------------------------------------------------
+
+
+def _lookup(path: str, input_root: str, cache: ParseCache | None,
+            string_pool: StringPool) -> tuple[str | None, FileDesc | None]:
+    """
+    SUMMARY
+    -------
+        This private function looks a header file up in the parse cache.
+        It returns the key of its entry (None without cache) and its cached description (None if it must be parsed).
+    """
+    if cache is None:
+        return None, None
+
+    profiler: Profiler | None = get_profiler()
+    start: float = perf_counter() if profiler is not None else 0.0
+
+    key: str = ParseCache.get_key(os.path.relpath(path, input_root).replace(os.sep, "/"), hash_file(path))
+    file_desc: FileDesc | None = cache.load(key, string_pool)
+
+    if profiler is not None:
+        profiler.add_time("cache", perf_counter() - start)
+    return key, file_desc
+
+
+# ---------------------------------------------------------------------------
+
+
+def _collect(batch: list[tuple[str | None, FileDesc | None]], parsed: Iterable[tuple[FileDesc, bytes | None]],
+             cache: ParseCache | None) -> Iterator[FileDesc]:
+    """
+    SUMMARY
+    -------
+        This private function merges the cached and the parsed headers of a batch in their order,
+        and stores the parsed ones in the parse cache. A parsed header comes with its serialized description
+        when a worker process already encoded it, None otherwise.
+    """
+    parsed_iterator: Iterator[tuple[FileDesc, bytes | None]] = iter(parsed)
+
+    for key, file_desc in batch:
+        if file_desc is None:
+            file_desc, data = next(parsed_iterator)
+
+            if cache is not None:
+                cache.store(key, serialize(file_desc) if data is None else data)
+
+        yield file_desc
+
+
+# ---------------------------------------------------------------------------
+
+
+def _count(iterator: Iterable[str], counter: Counter, key: str) -> Iterator[str]:
+    """
+    SUMMARY
+    -------
+        This private function yields the items of a lazy stage and counts them.
+    """
+    for item in iterator:
+        counter[key] += 1
+        yield item
+
+
+# ---------------------------------------------------------------------------
+
+
+def _get_scopes(namespaces: dict[str, list[str]], symbols: list[tuple[str, str, str]]) -> set[str]:
+    """
+    SUMMARY
+    -------
+        This private function returns the namespaces whose page shows the given namespace entries of a header.
+    """
+    scopes: set[str] = set(namespaces)
+    scopes.update(name.rpartition("::")[0] for _, name, _ in symbols)
+    scopes.discard("")
+
+    return scopes
+
+
+# ---------------------------------------------------------------------------
+
+
+def _check_parameters(file_desc: FileDesc) -> list[str]:
+    """
+    SUMMARY
+    -------
+        This private function checks the @param tags of the functions of a header against their signature.
+        The functions without any named @param tag aren't documented at all, they aren't reported.
+
+    RETURNS
+    -------
+        list[str]: The functions whose tags don't match, with their undocumented and unknown parameters
+    """
+    mismatches: list[str] = list()
+
+    for function, _, _ in file_desc.get_functions():
+        if all(parameter.get_name() is None for parameter in function.get_parameters()):
+            continue
+
+        missing, unknown = function.validate_against_signature(get_parameter_names(function.get_code_line()))
+        problems: list[str] = [f"no @param for {name}" for name in missing]
+        problems.extend(f"@param {name} not declared" for name in unknown)
+        if problems:
+            mismatches.append(f"{function.get_name()} ({', '.join(problems)})")
+
+    return mismatches
+
+
+# ---------------------------------------------------------------------------
+
+
+def parse_headers(files: Iterable[str], input_root: str, jobs: int = 1,
+                  max_in_flight: int = DEFAULT_MAX_IN_FLIGHT, cache: ParseCache = None) -> Iterator[FileDesc]:
+    """
+    SUMMARY
+    -------
+        This public function parses the given header files and yields their descriptions in the order of the files.
+        With more than one job, the headers are spread over a pool of worker processes
+        and the main process only collects the parsed models, so the results are identical to a serial run.
+        The files are consumed lazily: at most 'max_in_flight' headers are submitted and not yet yielded,
+        so a fast parser never gets far ahead of the consumer.
+        With a parse cache, the cached headers are not parsed again, and the parsed ones are stored.
+        The types, hints and parameter names of the headers parsed in the main process or loaded from the cache
+        share a string pool (see StringPool), the headers parsed by a worker process share one within their batch.
+
+    PARAMETERS
+    ----------
+        - files (Iterable[str]): The path of the header files to parse
+        - input_root (str): The path of the input directory
+        - jobs (int): Optional parameter, the number of worker processes (0 to use all cores)
+                      By default, the headers are parsed in the main process
+        - max_in_flight (int): Optional parameter, the maximum number of headers parsed ahead of the consumer
+        - cache (ParseCache): Optional parameter, the cache of the parsed headers, by default all are parsed
+
+    RETURNS
+    -------
+        Iterator[FileDesc]: The description of each header file
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    string_pool: StringPool = StringPool()
+    profiler: Profiler | None = get_profiler()
+
+    if jobs == 1:
+        for path in files:
+            batch: list[tuple[str | None, FileDesc | None]] = [_lookup(path, input_root, cache, string_pool)]
+            parsed: list[tuple[FileDesc, None]] = [(parse_header(path, input_root, string_pool), None)] \
+                if batch[0][1] is None else list()
+            yield from _collect(batch, parsed, cache)
+        return
+
+    # each worker gets at least one batch, the batches shrink to respect the limit with many workers
+    chunk_size: int = max(1, min(CHUNK_SIZE, max_in_flight // jobs))
+    window: int = max(jobs, max_in_flight // chunk_size)
+
+    files_iterator: Iterator[str] = iter(files)
+    # the cached headers of each batch, with the future of the parsed ones (None if all are cached)
+    pending: deque[tuple[list[tuple[str | None, FileDesc | None]], Future | None]] = deque()
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while paths := list(islice(files_iterator, chunk_size)):
+            if len(pending) >= window:
+                batch, future = pending.popleft()
+                yield from _collect(batch, _get_parsed(future, profiler), cache)
+
+            batch = [_lookup(path, input_root, cache, string_pool) for path in paths]
+            misses: list[str] = [path for path, (_, file_desc) in zip(paths, batch) if file_desc is None]
+            pending.append((batch, pool.submit(_parse_batch, misses, input_root, cache is not None, profiler is not None)
+                                   if misses else None))
+
+        while pending:
+            batch, future = pending.popleft()
+            yield from _collect(batch, _get_parsed(future, profiler), cache)
+
+
+# ---------------------------------------------------------------------------
+
+
+class DocumentationPipeline:
+    """
+    SUMMARY
+    -------
+        This class generates the documentation in four stages connected by bounded queues:
+            - discover: the walker threads of the IOManager, filtered by the build manifest
+            - parse: the headers are parsed in the main process or in a pool of worker processes
+            - render: the pages of each parsed header are rendered lazily
+            - write: the background writer threads of the IOManager consume the rendered pages
+        Each stage blocks when the next one is late, so the memory used by the in-flight work is bounded
+        whatever the number of headers.
+    """
+
+    def __init__(self, io_manager: IOManager, manifest: BuildManifest, input_dir_root: str,
+                 jobs: int = 1, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT, cache: ParseCache = None) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the constructor of the DocumentationPipeline class.
+
+        PARAMETERS
+        ----------
+            - io_manager (IOManager): The I/O manager of the input and output directories
+            - manifest (BuildManifest): The manifest of the previous run, to skip the unchanged headers
+            - input_dir_root (str): The path of the input directory
+            - jobs (int): Optional parameter, the number of parsing processes (0 to use all cores)
+            - max_in_flight (int): Optional parameter, the maximum number of headers parsed ahead of the writers
+            - cache (ParseCache): Optional parameter, the cache of the parsed headers shared with the other runs
+        """
+        self.__io_manager: IOManager = io_manager
+        self.__manifest: BuildManifest = manifest
+        self.__input_dir: str = input_dir_root
+        self.__jobs: int = jobs
+        self.__max_in_flight: int = max_in_flight
+        self.__cache: ParseCache | None = cache
+
+        # the entries of all headers, kept in memory to update the namespace pages and the links after a run
+        self.__namespaces: NamespaceIndex = NamespaceIndex()
+        self.__symbols: SymbolTable = SymbolTable()
+        self.__search: SearchIndex = SearchIndex()
+        # the indexes are only built from the manifest once needed (see '__load_indexes'), a run without changes
+        # doesn't pay for them. The clock of the symbol table when they were built, the unchanged headers are
+        # rendered with it
+        self.__indexed: bool = False
+        self.__indexed_clock: int = 0
+        # the number of headers discovered, selected (new or changed) and parsed by the last 'run'
+        self.__run_counts: Counter = Counter()
+        # the seconds spent in the discovery, parsing and rendering stages of the last 'run'
+        self.__stage_seconds: dict[str, float] = dict()
+        # the functions whose @param tags don't match their signature, by header parsed since the last 'run'
+        self.__parameter_mismatches: dict[str, list[str]] = dict()
+
+    # ---------------------------------------------------------------------------
+    # GETTERS
+    # ---------------------------------------------------------------------------
+
+    def get_jobs(self) -> int:
+        """
+        SUMMARY
+        -------
+            This public method returns the number of parsing processes of a run, the headers are parsed
+            by a pool of worker processes when it is more than 1.
+
+        RETURNS
+        -------
+            int: The number of parsing processes (all cores if 0 was given)
+        """
+        return self.__jobs or os.cpu_count() or 1
+
+    # ---------------------------------------------------------------------------
+
+    def get_stage_durations(self) -> dict[str, float]:
+        """
+        SUMMARY
+        -------
+            This public method returns the time spent in each stage by the last 'run'. The stages are lazy and
+            interleaved, so the time is measured in their iterators: 'discovery' is the time spent walking
+            the input directory and selecting the changed headers, 'parsing' the time spent waiting for
+            the parsed headers, and 'rendering' the rest of the run (building the indexes of the previous run,
+            submitting the pages, rendering the dependents and the namespaces, saving the manifest).
+            The durations add up to the duration of the run. The writer threads render the pages meanwhile,
+            the time a stage waits for them (for the GIL) is counted in the stage.
+
+        RETURNS
+        -------
+            dict[str, float]: The seconds spent in each stage, empty before the first 'run'
+        """
+        return dict(self.__stage_seconds)
+
+    # ---------------------------------------------------------------------------
+
+    def get_run_statistics(self) -> dict[str, int]:
+        """
+        SUMMARY
+        -------
+            This public method returns the number of headers processed by the last 'run', the updates aren't counted.
+            The failed headers were selected to be parsed but aren't documented, the run stopped on an error.
+
+        RETURNS
+        -------
+            dict[str, int]: The number of headers discovered, parsed, skipped (unchanged) and failed
+        """
+        counts: Counter = self.__run_counts
+        return {"discovered": counts["discovered"], "parsed": counts["parsed"],
+                "skipped": counts["discovered"] - counts["selected"], "failed": counts["selected"] - counts["parsed"]}
+
+    # ---------------------------------------------------------------------------
+
+    def get_namespaces(self) -> NamespaceIndex:
+        """
+        SUMMARY
+        -------
+            This public method returns the in-memory namespace index, up to date after a 'run' and each 'update'.
+
+        RETURNS
+        -------
+            NamespaceIndex: The namespace entries of all headers
+        """
+        self.__load_indexes()
+        return self.__namespaces
+
+    # ---------------------------------------------------------------------------
+
+    def get_symbols(self) -> SymbolTable:
+        """
+        SUMMARY
+        -------
+            This public method returns the in-memory symbol table, up to date after a 'run' and each 'update'.
+
+        RETURNS
+        -------
+            SymbolTable: The symbols of all headers
+        """
+        self.__load_indexes()
+        return self.__symbols
+
+    # ---------------------------------------------------------------------------
+
+    def get_search_index(self) -> SearchIndex:
+        """
+        SUMMARY
+        -------
+            This public method returns the in-memory search index, up to date after a 'run' and each 'update'.
+
+        RETURNS
+        -------
+            SearchIndex: The documents of all headers
+        """
+        self.__load_indexes()
+        return self.__search
+
+    # ---------------------------------------------------------------------------
+
+    def get_parse_cache(self) -> ParseCache | None:
+        """
+        SUMMARY
+        -------
+            This public method is the getter of the '__cache' attribute.
+
+        RETURNS
+        -------
+            ParseCache | None: The cache of the parsed headers, None if the headers are always parsed
+        """
+        return self.__cache
+
+    # ---------------------------------------------------------------------------
+
+    def get_duplicates(self) -> dict[str, list[str]]:
+        """
+        SUMMARY
+        -------
+            This public method returns the class and enumeration pages generated by several headers,
+            so they can be reported: only the header with the smallest path writes them.
+
+        RETURNS
+        -------
+            dict[str, list[str]]: The sorted headers (relative paths) that generate each page ('category/name')
+        """
+        return {f"{category.value}/{name}": owners
+                for (category, name), owners in sorted(self.__manifest.get_duplicates().items(),
+                                                       key=lambda item: (item[0][0].value, item[0][1]))}
+
+    # ---------------------------------------------------------------------------
+
+    def get_parameter_mismatches(self) -> dict[str, list[str]]:
+        """
+        SUMMARY
+        -------
+            This public method returns the functions whose @param tags don't match the parameters of their signature,
+            so they can be reported. Like the warnings of a compiler, only the headers parsed by the last 'run'
+            and the next updates are checked.
+
+        RETURNS
+        -------
+            dict[str, list[str]]: The functions and their mismatched parameters, by header (relative path)
+        """
+        return {relative_path: list(mismatches) for relative_path, mismatches in self.__parameter_mismatches.items()}
+
+    # ---------------------------------------------------------------------------
+
+    def get_unresolved(self) -> dict[str, list[str]]:
+        """
+        SUMMARY
+        -------
+            This public method returns the references of the pages that don't match any documented symbol,
+            so they can be reported all at once.
+
+        RETURNS
+        -------
+            dict[str, list[str]]: The unresolved names referenced by each header (relative path)
+        """
+        unresolved: dict[str, list[str]] = dict()
+        # the names the symbol table resolves, it isn't built by a run without changes
+        symbols: set[str] = self.__manifest.get_symbol_names()
+
+        for relative_path, references, _ in self.__manifest.get_references():
+            names: list[str] = [name for name in references if name not in symbols]
+            if names:
+                unresolved[relative_path] = names
+
+        return unresolved
+
+    # ---------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ---------------------------------------------------------------------------
+
+    def run(self, on_stage: Callable[[str], None] = None) -> None:
+        """
+        SUMMARY
+        -------
+            This public method runs all stages, then deletes the pages of the removed headers,
+            renders again the unchanged pages whose links changed, renders the pages of the namespaces
+            whose entries changed, writes the search index and saves the manifest once all pages are written.
+            A run without any changed header doesn't build the indexes nor write anything.
+            The writers of the IOManager are kept running for the next updates, it must be closed by the caller.
+
+        PARAMETERS
+        ----------
+            - on_stage (Callable[[str], None]): Optional parameter, called with the name of each stage when it ends:
+                       'discovery' once all headers are found, 'parsing' once all of them are parsed
+                       (their pages are submitted) and 'rendering' once all pages are written.
+                       With a callback, the discovery ends before the parsing starts (the paths are kept in a list),
+                       so the callback is called at the real end of the stage instead of the end of the parsing
+
+        RAISES
+        ------
+            - OSError: If a documentation file couldn't be written
+        """
+        start_time: float = perf_counter()
+        self.__stage_seconds = dict()
+
+        # the indexes start with the headers of the previous run once a header changes, a missing index file
+        # is written again
+        self.__namespaces = NamespaceIndex()
+        self.__symbols = SymbolTable()
+        self.__search = SearchIndex(written=True)
+        self.__indexed = False
+        if not os.path.isfile(self.__get_search_index_path()):
+            self.__load_indexes()
+
+        rendered: dict[str, int] = dict()
+        affected: set[str] = set()
+        self.__parameter_mismatches = dict()
+        self.__run_counts = Counter()
+        discovery_start: float = perf_counter()
+        files: Iterator[str] = _count(self.__io_manager.get_files(), self.__run_counts, "discovered")
+        discovery: TimedIterator = TimedIterator(_count(self.__manifest.select_changed(files),
+                                                        self.__run_counts, "selected"))
+        discovered: Iterable[str] = discovery
+        if on_stage is not None:
+            discovered = list(discovery)
+            on_stage("discovery")
+
+        # the parsing stage pulls the discovered headers, its time includes the time of the lazy discovery
+        parsing: TimedIterator = TimedIterator(parse_headers(discovered, self.__input_dir, self.__jobs,
+                                                             self.__max_in_flight, self.__cache))
+        try:
+            for file_desc in parsing:
+                self.__update_header(file_desc, rendered, affected)
+                self.__run_counts["parsed"] += 1
+
+            for relative_path in self.__manifest.get_removed():
+                self.__forget_header(relative_path, affected)
+
+            if on_stage is not None:
+                on_stage("parsing")
+
+            # without any changed header, no link changed and the indexes weren't built
+            if self.__indexed:
+                self.__render_dependents(self.__indexed_clock, rendered)
+            if affected:
+                self.__render_namespaces(affected)
+
+            # the manifest is only saved once all pages are on disk
+            self.save()
+
+            if on_stage is not None:
+                on_stage("rendering")
+        finally:
+            discovery_seconds: float = discovery.get_seconds()
+            parsing_seconds: float = parsing.get_seconds() - (discovery_seconds if discovered is discovery else 0.0)
+            # the indexes are built before the discovery starts when the index file is missing, counted in it
+            discovery_seconds += discovery_start - start_time
+
+            self.__stage_seconds = {"discovery": discovery_seconds, "parsing": parsing_seconds,
+                                    "rendering": perf_counter() - start_time - discovery_seconds - parsing_seconds}
+
+    # ---------------------------------------------------------------------------
+
+    def update(self, changed: Iterable[str], removed: Iterable[str]) -> int:
+        """
+        SUMMARY
+        -------
+            This public method updates the documentation after a 'run' for the given changed and removed headers.
+            Only their pages, the pages that link to the symbols they added or removed, and the pages
+            of the namespaces they declare or declared are rendered again.
+            The pages are written when it returns, but the search index and the manifest are only written
+            by the 'save' method.
+
+        PARAMETERS
+        ----------
+            - changed (Iterable[str]): The path of the changed and added header files
+            - removed (Iterable[str]): The path of the removed header files
+
+        RETURNS
+        -------
+            int: The number of headers parsed again (the touched but unchanged headers are skipped)
+
+        RAISES
+        ------
+            - OSError: If a documentation file couldn't be written
+        """
+        self.__load_indexes()
+        affected: set[str] = set()
+        start: int = self.__symbols.get_clock()
+        rendered: dict[str, int] = dict()
+
+        for path in removed:
+            self.__forget_header(self.__manifest.get_relative_path(path), affected)
+
+        changed = list(changed)
+        discovered: Iterator[str] = self.__manifest.select_changed(changed)
+
+        for file_desc in parse_headers(discovered, self.__input_dir, self.__get_jobs(len(changed)), self.__max_in_flight,
+                                       self.__cache):
+            self.__update_header(file_desc, rendered, affected)
+
+        self.__render_dependents(start, rendered)
+        if affected:
+            self.__render_namespaces(affected)
+
+        self.__io_manager.flush()
+
+        return len(rendered)
+
+    # ---------------------------------------------------------------------------
+
+    def save(self) -> None:
+        """
+        SUMMARY
+        -------
+            This public method writes the search index if it changed, and saves the manifest
+            once all submitted pages are written. The parse cache is then trimmed to its maximum size.
+            Serializing them for a large project is slower than an update, so it is kept out of 'update'.
+
+        RAISES
+        ------
+            - OSError: If a documentation file couldn't be written
+        """
+        if self.__search.is_changed():
+            profiler: Profiler | None = get_profiler()
+            start: float = perf_counter() if profiler is not None else 0.0
+
+            content: list[str] = self.__search.render()
+            if profiler is not None:
+                profiler.add_time("render", perf_counter() - start)
+
+            self.__io_manager.submit_file(SEARCH_INDEX_NAME, content, extension=SEARCH_INDEX_EXTENSION)
+
+        self.__io_manager.flush()
+        if self.__manifest.is_changed():
+            self.__manifest.save()
+
+        if self.__cache is not None:
+            self.__cache.trim()
+
+    # ---------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ---------------------------------------------------------------------------
+
+    def __update_header(self, file_desc: FileDesc, rendered: dict[str, int], affected: set[str] = None) -> None:
+        """
+        SUMMARY
+        -------
+            This private method replaces the entries of a parsed header in the indexes, submits its pages
+            to the writers and records them in the manifest.
+
+        PARAMETERS
+        ----------
+            - file_desc (FileDesc): The description of the header file
+            - rendered (dict[str, int]): The clock of the symbol table when each header was rendered, updated
+            - affected (set[str]): Optional parameter, the set where the namespaces to render again are added
+        """
+        relative_path: str = file_desc.get_path()
+        self.__load_indexes()
+        self.__remove_entries(relative_path, affected)
+
+        entries: tuple[dict[str, list[str]], list[tuple[str, str, str]]] = NamespaceIndex.get_entries(file_desc)
+        summaries: list[str] = SearchIndex.get_summaries(file_desc)
+        self.__namespaces.add_entries(*entries)
+        self.__symbols.add_entries(entries[1])
+        self.__search.add_documents((*symbol, summary) for symbol, summary in zip(entries[1], summaries))
+        if affected is not None:
+            affected.update(_get_scopes(*entries))
+
+        rendered[relative_path] = self.__symbols.get_clock()
+        pages: list[tuple[DocFileCategory, str]] = self.__submit_pages(file_desc)
+
+        mismatches: list[str] = _check_parameters(file_desc)
+        if mismatches:
+            self.__parameter_mismatches[relative_path] = mismatches
+        else:
+            self.__parameter_mismatches.pop(relative_path, None)
+
+        for category, name in self.__manifest.record(relative_path, pages, *entries, get_references(file_desc),
+                                                     get_type_mentions(file_desc), summaries):
+            self.__io_manager.delete_file(name, category)
+
+    # ---------------------------------------------------------------------------
+
+    def __forget_header(self, relative_path: str, affected: set[str] = None) -> None:
+        """
+        SUMMARY
+        -------
+            This private method removes the entries of a removed header from the indexes and deletes its pages.
+
+        PARAMETERS
+        ----------
+            - relative_path (str): The path of the header, relative to the input directory ('/' separated)
+            - affected (set[str]): Optional parameter, the set where the namespaces to render again are added
+        """
+        self.__load_indexes()
+        self.__remove_entries(relative_path, affected)
+        self.__parameter_mismatches.pop(relative_path, None)
+
+        for category, name in self.__manifest.forget(relative_path):
+            self.__io_manager.delete_file(name, category)
+
+    # ---------------------------------------------------------------------------
+
+    def __load_indexes(self) -> None:
+        """
+        SUMMARY
+        -------
+            This private method builds the indexes from the entries of the headers recorded in the manifest,
+            if they aren't built yet. The index file is written with the manifest, it matches the documents
+            of the previous run if any.
+        """
+        if self.__indexed:
+            return
+
+        documents: list[Document] = list(self.__manifest.get_documents())
+        self.__search = SearchIndex(documents, bool(documents) and os.path.isfile(self.__get_search_index_path()))
+
+        for namespaces, symbols in self.__manifest.get_namespace_entries():
+            self.__namespaces.add_entries(namespaces, symbols)
+            self.__symbols.add_entries(symbols)
+
+        self.__indexed = True
+        self.__indexed_clock = self.__symbols.get_clock()
+
+    # ---------------------------------------------------------------------------
+
+    def __remove_entries(self, relative_path: str, affected: set[str] | None) -> None:
+        """
+        SUMMARY
+        -------
+            This private method removes the entries recorded for a header from the in-memory indexes.
+
+        PARAMETERS
+        ----------
+            - relative_path (str): The path of the header, relative to the input directory ('/' separated)
+            - affected (set[str] | None): The set where the namespaces whose page mentioned the header are added
+        """
+        entries: tuple[dict[str, list[str]], list[tuple[str, str, str]]] | None = self.__manifest.get_entries(relative_path)
+        if entries is None:
+            return
+
+        self.__namespaces.remove_entries(*entries)
+        self.__symbols.remove_entries(entries[1])
+        self.__search.remove_documents(self.__manifest.get_documents(relative_path))
+        if affected is not None:
+            affected.update(_get_scopes(*entries))
+
+    # ---------------------------------------------------------------------------
+
+    def __submit_pages(self, file_desc: FileDesc) -> list[tuple[DocFileCategory, str]]:
+        """
+        SUMMARY
+        -------
+            This private method submits the pages of a parsed header to the writers,
+            except the pages of the classes and enumerations written by another header (see BuildManifest.is_owner).
+
+        RETURNS
+        -------
+            list[tuple[DocFileCategory, str]]: The (category, page name) of all the pages of the header
+        """
+        pages: list[tuple[DocFileCategory, str]] = list()
+        profiler: Profiler | None = get_profiler()
+        relative_path: str = file_desc.get_path()
+
+        for category, name, content in render_file(file_desc, self.__symbols):
+            pages.append((category, name))
+            # a class or an enumeration documented in another header too is written by one of them
+            if not self.__manifest.is_owner(relative_path, (category, name)):
+                continue
+
+            if profiler is not None:
+                content = profiler.time_content(content, "render", file_desc.get_path())
+
+            self.__io_manager.submit_file(name, content, category)
+
+        return pages
+
+    # ---------------------------------------------------------------------------
+
+    def __render_dependents(self, start: int, rendered: dict[str, int]) -> None:
+        """
+        SUMMARY
+        -------
+            This private method renders again the headers rendered before a symbol they reference or mention changed:
+            the unchanged headers that link to an added or removed symbol, and the headers of this run
+            that link to a symbol of a header processed after them. The symbols aren't changed by this pass.
+            The headers that became the owner of a duplicated page (see BuildManifest.is_owner) are rendered again too.
+
+        PARAMETERS
+        ----------
+            - start (int): The clock of the symbol table when the unchanged headers were rendered
+            - rendered (dict[str, int]): The clock of the symbol table when each header of this run was rendered
+        """
+        paths: list[str] = list()
+        reassigned: set[str] = set(self.__manifest.take_reassigned())
+
+        for relative_path, references, mentions in self.__manifest.get_references():
+            rendered_at: int = rendered.get(relative_path, start)
+            if relative_path in reassigned or any(self.__symbols.get_version(name) > rendered_at
+                                                  for name in (*references, *mentions)):
+                path: str = os.path.join(self.__input_dir, relative_path)
+                # removed since it was discovered, the next run forgets it
+                if os.path.isfile(path):
+                    paths.append(path)
+
+        for file_desc in parse_headers(paths, self.__input_dir, self.__get_jobs(len(paths)), self.__max_in_flight,
+                                       self.__cache):
+            self.__submit_pages(file_desc)
+
+    # ---------------------------------------------------------------------------
+
+    def __get_search_index_path(self) -> str:
+        """
+        SUMMARY
+        -------
+            This private method returns the path of the search index file in the output directory.
+        """
+        return os.path.join(self.__io_manager.get_output_path(), SEARCH_INDEX_NAME + SEARCH_INDEX_EXTENSION)
+
+    # ---------------------------------------------------------------------------
+
+    def __get_jobs(self, headers: int) -> int:
+        """
+        SUMMARY
+        -------
+            This private method returns the number of parsing processes for a batch of headers:
+            starting the worker processes costs more than parsing a few headers.
+        """
+        return self.__jobs if headers > CHUNK_SIZE else 1
+
+    # ---------------------------------------------------------------------------
+
+    def __render_namespaces(self, names: Iterable[str] = None) -> None:
+        """
+        SUMMARY
+        -------
+            This private method renders the namespace pages, they gather the symbols of all headers (unchanged included).
+
+        PARAMETERS
+        ----------
+            - names (Iterable[str]): Optional parameter, the namespaces to render, by default all of them
+        """
+        profiler: Profiler | None = get_profiler()
+
+        for category, name, content in self.__namespaces.render(names):
+            if profiler is not None:
+                content = profiler.time_content(content, "render")
+
+            self.__io_manager.submit_file(name, content, category)
+
+        pages: list[tuple[DocFileCategory, str]] = [(DocFileCategory.NAMESPACE, to_page_name(name))
+                                                    for name in self.__namespaces.get_namespaces()]
+
+        for category, name in self.__manifest.record_namespace_pages(pages):
+            self.__io_manager.delete_file(name, category)
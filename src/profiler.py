@@ -0,0 +1,321 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.profiler.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Measures the time spent in each stage of a run and in each header, for the --profile report.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import json
+import threading
+from collections import Counter
+from time import perf_counter
+from typing import Iterable, Iterator
+
+# The version of the profile report, changes when a field is renamed or changes meaning
+PROFILE_VERSION: int = 1
+
+# The stages measured by the instrumented code, in the order of the pipeline
+STAGES: tuple[str, ...] = ("discover", "cache", "read", "lex", "render", "write")
+
+# The stages measured for each header, the slowest headers are ranked by their sum
+FILE_STAGES: tuple[str, ...] = ("read", "lex", "render")
+
+# The default number of slowest headers and of largest allocation sites in the reports
+DEFAULT_SLOWEST: int = 20
+
+# ---------------------------------------------------------------------------
+
+
+class Profiler:
+    """
+    SUMMARY
+    -------
+        This class accumulates the time spent in each stage of a run, the time spent on each header and some counters.
+        The stages run in several threads and processes: a stage total is the sum of the time of all its threads,
+        it can be larger than the duration of the run.
+        The instrumented code only measures while a profiler is installed (see set_profiler),
+        otherwise it costs a check per header or per page.
+    """
+
+    def __init__(self) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the constructor of the Profiler class, the duration of the run starts with it.
+        """
+        self.__start: float = perf_counter()
+        self.__seconds: Counter = Counter()
+        self.__calls: Counter = Counter()
+        self.__counters: Counter = Counter()
+        # key=header relative path, value=(key=stage, value=seconds)
+        self.__files: dict[str, Counter] = dict()
+        self.__lock: threading.Lock = threading.Lock()
+
+    # ---------------------------------------------------------------------------
+    # GETTERS
+    # ---------------------------------------------------------------------------
+
+    def get_state(self) -> dict:
+        """
+        SUMMARY
+        -------
+            This public method returns the measures as plain (picklable) objects,
+            a worker process sends them back to be merged (see 'merge').
+
+        RETURNS
+        -------
+            dict: The seconds and calls of each stage, the counters and the seconds of each stage of each header
+        """
+        with self.__lock:
+            return {"seconds": dict(self.__seconds), "calls": dict(self.__calls), "counters": dict(self.__counters),
+                    "files": {path: dict(stages) for path, stages in self.__files.items()}}
+
+    # ---------------------------------------------------------------------------
+
+    def get_report(self, slowest: int = DEFAULT_SLOWEST) -> dict:
+        """
+        SUMMARY
+        -------
+            This public method builds the JSON document of the profile.
+
+        PARAMETERS
+        ----------
+            - slowest (int): Optional parameter, the number of slowest headers to report
+
+        RETURNS
+        -------
+            dict: The document, with the duration of the run, the seconds and calls of each stage,
+                the bytes read and written, the counters and the slowest headers with the seconds of their stages
+        """
+        state: dict = self.get_state()
+        ranked: list[tuple[float, str]] = sorted(((sum(stages.values()), path)
+                                                  for path, stages in state["files"].items()), reverse=True)
+
+        return {"version": PROFILE_VERSION,
+                "wall_seconds": perf_counter() - self.__start,
+                "stages": {stage: {"seconds": state["seconds"].get(stage, 0.0), "calls": state["calls"].get(stage, 0)}
+                           for stage in (*STAGES, *sorted(state["seconds"].keys() - set(STAGES)))},
+                "bytes_read": state["counters"].get("bytes_read", 0),
+                "bytes_written": state["counters"].get("bytes_written", 0),
+                "counters": dict(sorted(state["counters"].items())),
+                "slowest_files": [{"path": path, "seconds": seconds,
+                                   **{stage: state["files"][path].get(stage, 0.0) for stage in FILE_STAGES}}
+                                  for seconds, path in ranked[:slowest]]}
+
+    # ---------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ---------------------------------------------------------------------------
+
+    def add_time(self, stage: str, seconds: float, path: str = None) -> None:
+        """
+        SUMMARY
+        -------
+            This public method adds the duration of one call of a stage.
+
+        PARAMETERS
+        ----------
+            - stage (str): The name of the stage (see STAGES)
+            - seconds (float): The duration of the call
+            - path (str): Optional parameter, the relative path of the header the call worked on
+        """
+        with self.__lock:
+            self.__seconds[stage] += seconds
+            self.__calls[stage] += 1
+
+            if path is not None:
+                stages: Counter | None = self.__files.get(path)
+                if stages is None:
+                    stages = self.__files[path] = Counter()
+                stages[stage] += seconds
+
+    # ---------------------------------------------------------------------------
+
+    def add_count(self, name: str, value: int = 1) -> None:
+        """
+        SUMMARY
+        -------
+            This public method increments a counter.
+
+        PARAMETERS
+        ----------
+            - name (str): The name of the counter, like 'bytes_read'
+            - value (int): Optional parameter, the increment
+        """
+        with self.__lock:
+            self.__counters[name] += value
+
+    # ---------------------------------------------------------------------------
+
+    def time_content(self, content: Iterable[str], stage: str, path: str = None) -> Iterator[str]:
+        """
+        SUMMARY
+        -------
+            This public method measures a lazy stage: the time spent producing each item of the content is added
+            to the stage once the content is consumed, the time of the consumer isn't.
+
+        PARAMETERS
+        ----------
+            - content (Iterable[str]): The lazy content, like the markdown chunks of a page
+            - stage (str): The name of the stage that produces the content
+            - path (str): Optional parameter, the relative path of the header the content comes from
+
+        RETURNS
+        -------
+            Iterator[str]: The items of the content
+        """
+        iterator: Iterator[str] = iter(content)
+        seconds: float = 0.0
+
+        try:
+            while True:
+                start: float = perf_counter()
+                try:
+                    item: str = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    seconds += perf_counter() - start
+
+                yield item
+        finally:
+            self.add_time(stage, seconds, path)
+
+    # ---------------------------------------------------------------------------
+
+    def merge(self, state: dict) -> None:
+        """
+        SUMMARY
+        -------
+            This public method adds the measures of another profiler, like the one of a worker process.
+
+        PARAMETERS
+        ----------
+            - state (dict): The measures of the other profiler (see 'get_state')
+        """
+        with self.__lock:
+            self.__seconds.update(state["seconds"])
+            self.__calls.update(state["calls"])
+            self.__counters.update(state["counters"])
+
+            for path, stages in state["files"].items():
+                self.__files.setdefault(path, Counter()).update(stages)
+
+    # ---------------------------------------------------------------------------
+
+    def write_report(self, path: str, slowest: int = DEFAULT_SLOWEST) -> None:
+        """
+        SUMMARY
+        -------
+            This public method writes the JSON document of the profile (see 'get_report').
+
+        PARAMETERS
+        ----------
+            - path (str): The path of the report file
+            - slowest (int): Optional parameter, the number of slowest headers to report
+
+        RAISES
+        ------
+            - OSError: If the report couldn't be written
+        """
+        with open(path, 'w', encoding="utf-8") as file:
+            json.dump(self.get_report(slowest), file, indent=2)
+            file.write("\n")
+
+
+# ---------------------------------------------------------------------------
+
+
+class TimedIterator:
+    """
+    SUMMARY
+    -------
+        This class is an iterator that measures the time spent producing the items of another iterator,
+        so a consumer can tell its own time apart from the time of a lazy producer.
+    """
+
+    __slots__ = ("__iterator", "__seconds")
+
+    def __init__(self, content: Iterable) -> None:
+        self.__iterator: Iterator = iter(content)
+        self.__seconds: float = 0.0
+
+    def __iter__(self) -> Iterator:
+        return self
+
+    def __next__(self) -> object:
+        start: float = perf_counter()
+        try:
+            return next(self.__iterator)
+        finally:
+            self.__seconds += perf_counter() - start
+
+    def get_seconds(self) -> float:
+        """
+        SUMMARY
+        -------
+            This public method returns the time spent producing the items so far, in seconds.
+        """
+        return self.__seconds
+
+
+# ---------------------------------------------------------------------------
+
+# the profiler of the process, None when the run isn't profiled
+_profiler: Profiler | None = None
+
+# ---------------------------------------------------------------------------
+
+
+def get_profiler() -> Profiler | None:
+    """
+    SUMMARY
+    -------
+        This public function returns the profiler installed in the process.
+
+    RETURNS
+    -------
+        Profiler | None: The profiler, None if the run isn't profiled
+    """
+    return _profiler
+
+
+# ---------------------------------------------------------------------------
+
+
+def set_profiler(profiler: Profiler | None) -> None:
+    """
+    SUMMARY
+    -------
+        This public function installs the profiler of the process, the instrumented code measures into it.
+
+    PARAMETERS
+    ----------
+        - profiler (Profiler | None): The profiler, None to stop profiling
+    """
+    global _profiler
+    _profiler = profiler
@@ -0,0 +1,354 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.rendering.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Renders the documentation pages of the parsed header files.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+from collections import Counter
+from typing import Iterable, Iterator
+
+from src import DocFileCategory
+from src.modelization import FileDesc, PageLinks, PAGE_LINKS, to_page_name
+from src.symbol_table import SymbolTable, get_mentions
+
+# A rendered documentation page: (category, page name, newline-terminated markdown chunks)
+Page = tuple[DocFileCategory, str, Iterator[str]]
+
+# ---------------------------------------------------------------------------
+
+
+def render_file(file_desc: FileDesc, symbols: SymbolTable) -> Iterator[Page]:
+    """
+    SUMMARY
+    -------
+        This public function renders all documentation pages of a parsed header file:
+        the file page, then the pages of its classes, functions and enumerations.
+        The references to the other headers (see 'get_references') are resolved when each page is yielded,
+        the markdown chunks can then be consumed later, by another thread.
+        The type mentions of the function tables (see 'get_type_mentions') are linked when the chunks are consumed,
+        a mention whose type changes after the page was yielded is found by its version in the symbol table.
+
+    PARAMETERS
+    ----------
+        - file_desc (FileDesc): The description of the header file
+        - symbols (SymbolTable): The symbols of the whole project
+
+    RETURNS
+    -------
+        Iterator[Page]: The (category, page name, markdown chunks) of each page
+    """
+    file_page: str = file_desc.get_page_name()
+    yield DocFileCategory.FILE, file_page, file_desc.to_markdown(PAGE_LINKS[DocFileCategory.FILE])
+
+    for class_name in file_desc.get_classes():
+        yield (DocFileCategory.CLASS, to_page_name(class_name),
+               file_desc.class_to_markdown(class_name, PAGE_LINKS[DocFileCategory.CLASS]))
+
+    function_links: PageLinks = PAGE_LINKS[DocFileCategory.FUNCTION]
+
+    # the types repeat across the functions of a header, each cell is only linked once,
+    # the pooled types hit on identity without comparing their characters (see StringPool)
+    linked_cells: dict[str, str] = dict()
+
+    def link_types(text: str) -> str:
+        linked: str | None = linked_cells.get(text)
+        if linked is None:
+            linked = linked_cells[text] = symbols.link_types(text, function_links)
+        return linked
+
+    for function, class_container, page in file_desc.get_functions():
+        class_page: str | None = None
+        if class_container is not None:
+            target: tuple[DocFileCategory, str] | None = symbols.resolve(class_container)
+            if target is not None and target[0] is DocFileCategory.CLASS:
+                class_page = target[1]
+
+        yield (DocFileCategory.FUNCTION, page,
+               function.generate_markdown(function_links, file_page, class_container, class_page, link_types))
+
+    for enum in file_desc.get_enums():
+        yield DocFileCategory.ENUM, to_page_name(enum.get_name()), enum.to_markdown(PAGE_LINKS[DocFileCategory.ENUM], file_page)
+
+
+# ---------------------------------------------------------------------------
+
+
+def get_references(file_desc: FileDesc) -> list[str]:
+    """
+    SUMMARY
+    -------
+        This public function returns the names that the pages of a header resolve with the symbol table.
+        The links between the pages of the header itself are known without it, they aren't references.
+
+    PARAMETERS
+    ----------
+        - file_desc (FileDesc): The description of the header file
+
+    RETURNS
+    -------
+        list[str]: The qualified names referenced by the pages of the header, sorted
+    """
+    return sorted({class_container for _, class_container, _ in file_desc.get_functions() if class_container is not None})
+
+
+# ---------------------------------------------------------------------------
+
+
+def get_type_mentions(file_desc: FileDesc) -> list[str]:
+    """
+    SUMMARY
+    -------
+        This public function returns the names in the function tables of a header that could mention a type.
+        Unlike the references, they aren't expected to resolve (std::string, template parameters, plain words).
+
+    PARAMETERS
+    ----------
+        - file_desc (FileDesc): The description of the header file
+
+    RETURNS
+    -------
+        list[str]: The possibly qualified names of the function tables of the header, sorted
+    """
+    mentions: set[str] = set()
+
+    for function, _, _ in file_desc.get_functions():
+        for cell in function.get_type_cells():
+            mentions.update(get_mentions(cell))
+
+    return sorted(mentions)
+
+
+# ---------------------------------------------------------------------------
+
+
+class NamespaceIndex:
+    """
+    SUMMARY
+    -------
+        This class gathers the symbols of each namespace across all header files,
+        a namespace page can only be rendered once all files are parsed.
+        The entries of a header can be removed, so the index is kept up to date when a header changes.
+    """
+
+    def __init__(self) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the constructor of the NamespaceIndex class.
+        """
+        # the number of headers that declare each namespace, by summary
+        self.__summaries: dict[str, Counter] = dict()
+        # the number of headers that declare each symbol, by namespace
+        self.__symbols: dict[str, Counter] = dict()
+
+    # ---------------------------------------------------------------------------
+    # GETTERS
+    # ---------------------------------------------------------------------------
+
+    def get_namespaces(self) -> list[str]:
+        """
+        SUMMARY
+        -------
+            This public method returns the qualified name of the documented namespaces.
+
+        RETURNS
+        -------
+            list[str]: The name of each namespace, sorted
+        """
+        return sorted(self.__summaries)
+
+    # ---------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ---------------------------------------------------------------------------
+
+    @staticmethod
+    def get_entries(file_desc: FileDesc) -> tuple[dict[str, list[str]], list[tuple[str, str, str]]]:
+        """
+        SUMMARY
+        -------
+            This public static method returns what a parsed header file contributes to the namespace pages
+            and to the symbol table: its documented namespaces, and its symbols (methods and the file itself included).
+            The entries only contain strings, so they can be stored in the build manifest.
+
+        PARAMETERS
+        ----------
+            - file_desc (FileDesc): The description of the header file
+
+        RETURNS
+        -------
+            tuple[dict[str, list[str]], list[tuple[str, str, str]]]: The documented namespaces (name -> summary)
+                and the symbols (category value, qualified name, page name)
+        """
+        symbols: list[tuple[str, str, str]] = [(DocFileCategory.FILE.value, file_desc.get_path(), file_desc.get_page_name())]
+
+        for name in file_desc.get_namespaces():
+            symbols.append((DocFileCategory.NAMESPACE.value, name, to_page_name(name)))
+
+        for name in file_desc.get_classes():
+            symbols.append((DocFileCategory.CLASS.value, name, to_page_name(name)))
+
+        for function, _, page in file_desc.get_functions():
+            symbols.append((DocFileCategory.FUNCTION.value, function.get_name(), page))
+
+        for enum in file_desc.get_enums():
+            symbols.append((DocFileCategory.ENUM.value, enum.get_name(), to_page_name(enum.get_name())))
+
+        return file_desc.get_namespaces(), symbols
+
+    # ---------------------------------------------------------------------------
+
+    def add_file(self, file_desc: FileDesc) -> None:
+        """
+        SUMMARY
+        -------
+            This public method registers the namespaces and the symbols of a parsed header file.
+
+        PARAMETERS
+        ----------
+            - file_desc (FileDesc): The description of the header file
+        """
+        self.add_entries(*NamespaceIndex.get_entries(file_desc))
+
+    # ---------------------------------------------------------------------------
+
+    def add_entries(self, namespaces: dict[str, list[str]], symbols: list[tuple[str, str, str]]) -> None:
+        """
+        SUMMARY
+        -------
+            This public method registers the namespace entries of a header file (see 'get_entries').
+
+        PARAMETERS
+        ----------
+            - namespaces (dict[str, list[str]]): The documented namespaces (name -> summary)
+            - symbols (list[tuple[str, str, str]]): The symbols (category value, qualified name, page name)
+        """
+        for name, summary in namespaces.items():
+            self.__summaries.setdefault(name, Counter())[tuple(summary)] += 1
+
+        # the files and the methods are ignored, their scope isn't a namespace
+        for category, name, page in symbols:
+            scope, separator, _ = name.rpartition("::")
+            if separator:
+                self.__symbols.setdefault(scope, Counter())[(DocFileCategory(category), name, page)] += 1
+
+    # ---------------------------------------------------------------------------
+
+    def remove_entries(self, namespaces: dict[str, list[str]], symbols: list[tuple[str, str, str]]) -> None:
+        """
+        SUMMARY
+        -------
+            This public method unregisters the namespace entries previously added for a header file.
+            A namespace or a symbol declared by several headers is kept until all of them are removed.
+
+        PARAMETERS
+        ----------
+            - namespaces (dict[str, list[str]]): The documented namespaces (name -> summary)
+            - symbols (list[tuple[str, str, str]]): The symbols (category value, qualified name, page name)
+        """
+        for name, summary in namespaces.items():
+            self.__discard(self.__summaries, name, tuple(summary))
+
+        for category, name, page in symbols:
+            scope, separator, _ = name.rpartition("::")
+            if separator:
+                self.__discard(self.__symbols, scope, (DocFileCategory(category), name, page))
+
+    # ---------------------------------------------------------------------------
+
+    def render(self, names: Iterable[str] = None) -> Iterator[Page]:
+        """
+        SUMMARY
+        -------
+            This public method renders the page of each documented namespace, with its symbols sorted by name.
+
+        PARAMETERS
+        ----------
+            - names (Iterable[str]): Optional parameter, the namespaces to render, the undocumented ones are ignored
+                    By default, all documented namespaces are rendered
+
+        RETURNS
+        -------
+            Iterator[Page]: The (category, page name, markdown chunks) of each namespace page
+        """
+        selected: list[str] = self.get_namespaces() if names is None else sorted(set(names) & self.__summaries.keys())
+
+        for name in selected:
+            yield DocFileCategory.NAMESPACE, to_page_name(name), self.__render_namespace(name)
+
+    # ---------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ---------------------------------------------------------------------------
+
+    def __render_namespace(self, name: str) -> Iterator[str]:
+        """
+        SUMMARY
+        -------
+            This private method generates the markdown of a namespace page.
+
+        PARAMETERS
+        ----------
+            - name (str): The qualified name of the namespace
+
+        RETURNS
+        -------
+            Iterator[str]: The newline-terminated chunks of the markdown generated
+        """
+        yield f"# {name} - (namespace)\n"
+        yield "\n"
+
+        # the headers may document a namespace differently, the choice must not depend on their order
+        summaries: list[tuple[str, ...]] = sorted(summary for summary in self.__summaries[name] if summary)
+        for line in (summaries[0] if summaries else ()):
+            yield f"> {line}\n"
+        yield "\n"
+
+        yield "## Members\n"
+        yield "\n"
+        for category, symbol, page in sorted(self.__symbols.get(name, Counter()), key=lambda item: (item[1], item[2])):
+            yield f"- [{symbol}]({PAGE_LINKS[DocFileCategory.NAMESPACE].get(category, page)}) - ({category.name.lower()})\n"
+        yield "\n"
+
+    # ---------------------------------------------------------------------------
+
+    @staticmethod
+    def __discard(counters: dict[str, Counter], name: str, entry: tuple) -> None:
+        """
+        SUMMARY
+        -------
+            This private static method decrements the count of an entry, the empty counters are removed.
+        """
+        counter: Counter | None = counters.get(name)
+        if counter is None or entry not in counter:
+            return
+
+        counter[entry] -= 1
+        if counter[entry] <= 0:
+            del counter[entry]
+        if not counter:
+            del counters[name]
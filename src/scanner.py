@@ -0,0 +1,131 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.scanner.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Finds the docblocks of a header file without reading its code.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import os
+import mmap
+from typing import Iterator
+
+DOCBLOCK_START: bytes = b"/**"
+DOCBLOCK_END: bytes = b"*/"
+BLOCK_OPEN: bytes = b"{"
+BLOCK_CLOSE: bytes = b"}"
+
+# the declarations that keep their body, up to the closing brace
+ENUM_PREFIXES: tuple[bytes, ...] = (b"enum ", b"enum\t", b"typedef enum")
+
+# ---------------------------------------------------------------------------
+
+
+def scan_docblocks(path: str) -> Iterator[tuple[str, str, int]]:
+    """
+    SUMMARY
+    -------
+        This public function memory-maps a header file and yields each docblock with the declaration that follows it.
+        The boundaries are found with byte searches, only the docblocks and the declarations are decoded:
+        the rest of the code is never copied nor split into lines.
+
+    PARAMETERS
+    ----------
+        - path (str): The path of the header file
+
+    RETURNS
+    -------
+        Iterator[tuple[str, str, int]]: The content of each docblock (without /** and */), its declaration on one line
+                                        and its depth, the number of braces opened before it and not closed
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            start: int = content.find(DOCBLOCK_START)
+            depth: int = _count_depth(content, 0, len(content) if start == -1 else start)
+
+            while start != -1:
+                end: int = content.find(DOCBLOCK_END, start + len(DOCBLOCK_START))
+                if end == -1:
+                    return
+
+                code_start: int = end + len(DOCBLOCK_END)
+                next_start: int = content.find(DOCBLOCK_START, code_start)
+                code_end: int = len(content) if next_start == -1 else next_start
+
+                block: str = content[start + len(DOCBLOCK_START):end].decode("utf-8", errors="replace")
+                yield block, _extract_declaration(content, code_start, code_end), depth
+
+                depth = max(0, depth + _count_depth(content, code_start, code_end))
+                start = next_start
+
+
+# ---------------------------------------------------------------------------
+
+
+def _extract_declaration(content: mmap.mmap, start: int, end: int) -> str:
+    """
+    SUMMARY
+    -------
+        This private function extracts the declaration between the end of a docblock and the next docblock, on one line.
+        The declaration stops at the first ';' or '{', except for enumerations that keep their items body.
+    """
+    while start < end and content[start] in b" \t\r\n":
+        start += 1
+
+    if content[start:start + 12].startswith(ENUM_PREFIXES):
+        stop: int = content.find(b"}", start, end)
+        stop = end if stop == -1 else stop + 1
+    else:
+        stops: list[int] = [index for index in (content.find(b";", start, end), content.find(b"{", start, end))
+                            if index != -1]
+        stop = min(stops) if stops else end
+
+    return " ".join(content[start:stop].decode("utf-8", errors="replace").split())
+
+
+# ---------------------------------------------------------------------------
+
+
+def _count_depth(content: mmap.mmap, start: int, end: int) -> int:
+    """
+    SUMMARY
+    -------
+        This private function returns the number of braces opened minus the number of braces closed in the code.
+        The braces in the strings and in the comments are counted too, like the declarations they are approximate.
+    """
+    depth: int = 0
+
+    for brace, step in ((BLOCK_OPEN, 1), (BLOCK_CLOSE, -1)):
+        index: int = content.find(brace, start, end)
+        while index != -1:
+            depth += step
+            index = content.find(brace, index + 1, end)
+
+    return depth
@@ -0,0 +1,357 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.search_index.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Builds the search index of the documentation, written in the output root for the clients.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import re
+import json
+import heapq
+from bisect import bisect_left
+from collections import Counter
+from typing import Iterable
+
+from src import DocFileCategory
+from src.modelization import FileDesc
+
+# The name of the search index file written in the output root, with its extension
+SEARCH_INDEX_NAME: str = "search-index"
+SEARCH_INDEX_EXTENSION: str = ".json"
+
+# The version of the search index format, read by the clients
+SEARCH_INDEX_VERSION: int = 1
+
+# A searchable page: (category value, qualified name, page name, summary)
+Document = tuple[str, str, str, str]
+
+# The words of a text, an identifier with underscores is a single word
+WORD_PATTERN: re.Pattern = re.compile(r"\w+")
+# The parts of a word: camelCase or PascalCase humps, acronyms and numbers
+PART_PATTERN: re.Pattern = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+
+# The separators of the scopes of a qualified name, and of the directories of a file path
+SCOPE_PATTERN: re.Pattern = re.compile(r"::|/")
+
+# The common english words of the summaries, they would match almost all pages
+STOP_WORDS: frozenset[str] = frozenset((
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "if", "in", "is", "it", "its",
+    "of", "on", "or", "that", "the", "this", "to", "with"
+))
+
+# ---------------------------------------------------------------------------
+
+
+def get_tokens(text: str) -> list[str]:
+    """
+    SUMMARY
+    -------
+        This public function splits a name or a text in lowercase tokens, the common english words excluded.
+        A word gives its own token and the token of each of its parts (getValue -> getvalue, get, value),
+        so a symbol is found by any of the words of its name.
+
+    PARAMETERS
+    ----------
+        - text (str): The name or the text to split
+
+    RETURNS
+    -------
+        list[str]: The distinct tokens, in order of appearance
+    """
+    tokens: dict[str, None] = dict()
+
+    for word in WORD_PATTERN.findall(text):
+        tokens[word.lower()] = None
+        for part in PART_PATTERN.findall(word):
+            tokens[part.lower()] = None
+
+    return [token for token in tokens if token not in STOP_WORDS]
+
+
+# ---------------------------------------------------------------------------
+
+
+def search(index: dict, query: str, limit: int = 20) -> list[list]:
+    """
+    SUMMARY
+    -------
+        This public function searches a loaded search index file, the way a client does it:
+        each token of the query is a prefix, a document must match all of them.
+        The documents whose unqualified name starts with the query come first, then the shortest names.
+
+    PARAMETERS
+    ----------
+        - index (dict): The decoded content of the search index file
+        - query (str): The text typed by the user
+        - limit (int): Optional parameter, the maximum number of documents returned
+
+    RETURNS
+    -------
+        list[list]: The documents found: [category index, qualified name, page name, summary]
+    """
+    tokens: list[str] = index["tokens"]
+    postings: list[list[int]] = index["postings"]
+    matches: set[int] | None = None
+
+    for token in get_tokens(query):
+        start: int = bisect_left(tokens, token)
+        end: int = bisect_left(tokens, token[:-1] + chr(ord(token[-1]) + 1), start)
+
+        found: set[int] = set()
+        for position in range(start, end):
+            found.update(postings[position])
+
+        matches = found if matches is None else matches & found
+        if not matches:
+            return list()
+
+    if matches is None:
+        return list()
+
+    prefix: str = query.strip().lower()
+    documents: list[list] = index["documents"]
+
+    # the documents are sorted by name, so their index breaks the ties
+    def rank(identifier: int) -> tuple[bool, int, int]:
+        name: str = documents[identifier][1]
+        return not SCOPE_PATTERN.split(name)[-1].lower().startswith(prefix), len(name), identifier
+
+    return [documents[identifier] for identifier in heapq.nsmallest(limit, matches, key=rank)]
+
+
+# ---------------------------------------------------------------------------
+
+
+class SearchIndex:
+    """
+    SUMMARY
+    -------
+        This class is the inverted index of the documented symbols: the tokens of their name and summary
+        are mapped to their pages. It is updated with the entries of each header when it is rendered,
+        so the index file is written without reading the generated pages again.
+
+        The index file is a JSON object, compact enough to be downloaded by a static documentation site:
+            - "categories": the category values, the documents refer to them by index
+            - "documents": the [category index, qualified name, page name, summary] of each page
+            - "tokens": the sorted tokens, a prefix is found by a binary search
+            - "postings": the sorted document indexes of each token
+    """
+
+    def __init__(self, documents: Iterable[Document] = (), written: bool = False) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the constructor of the SearchIndex class.
+            The tokens of the initial documents are only computed if the index is rendered,
+            so a run without any change doesn't pay for them.
+
+        PARAMETERS
+        ----------
+            - documents (Iterable[Document]): Optional parameter, the documents of the unchanged headers
+            - written (bool): Optional parameter, the index file of the initial documents is already written
+        """
+        # the number of headers that declare each document, and the documents of each token (None until rendered)
+        self.__documents: Counter = Counter(documents)
+        self.__postings: dict[str, Counter] | None = None
+
+        self.__changed: bool = not written
+
+    # ---------------------------------------------------------------------------
+    # GETTERS
+    # ---------------------------------------------------------------------------
+
+    def is_changed(self) -> bool:
+        """
+        SUMMARY
+        -------
+            This public method returns whether the index changed since it was last rendered.
+
+        RETURNS
+        -------
+            bool: True if the index file must be written again
+        """
+        return self.__changed
+
+    # ---------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ---------------------------------------------------------------------------
+
+    @staticmethod
+    def get_summaries(file_desc: FileDesc) -> list[str]:
+        """
+        SUMMARY
+        -------
+            This public static method returns the summary of each symbol of a header, in the order of the symbols
+            of its namespace entries (see NamespaceIndex.get_entries), so both can be stored in the build manifest.
+
+        PARAMETERS
+        ----------
+            - file_desc (FileDesc): The description of the header file
+
+        RETURNS
+        -------
+            list[str]: The summary of the file, its namespaces, classes, functions and enumerations, on one line
+        """
+        summaries: list[list[str] | None] = [file_desc.get_summary()]
+
+        summaries.extend(file_desc.get_namespaces().values())
+        summaries.extend(file_desc.get_classes().values())
+        summaries.extend(function.get_summary() for function, _, _ in file_desc.get_functions())
+        summaries.extend(enum.get_summary() for enum in file_desc.get_enums())
+
+        return [" ".join(summary or ()) for summary in summaries]
+
+    # ---------------------------------------------------------------------------
+
+    def add_documents(self, documents: Iterable[Document]) -> None:
+        """
+        SUMMARY
+        -------
+            This public method registers the documents of a header file.
+
+        PARAMETERS
+        ----------
+            - documents (Iterable[Document]): The (category value, qualified name, page name, summary) of each page
+        """
+        for document in documents:
+            self.__documents[document] += 1
+            if self.__postings is not None:
+                self.__add_postings(document)
+
+            self.__changed = True
+
+    # ---------------------------------------------------------------------------
+
+    def remove_documents(self, documents: Iterable[Document]) -> None:
+        """
+        SUMMARY
+        -------
+            This public method unregisters the documents previously added for a header file.
+            A document declared by several headers is kept until all of them are removed.
+
+        PARAMETERS
+        ----------
+            - documents (Iterable[Document]): The (category value, qualified name, page name, summary) of each page
+        """
+        for document in documents:
+            if document not in self.__documents:
+                continue
+
+            self.__discard(self.__documents, document)
+            if self.__postings is not None:
+                for token in self.__get_document_tokens(document):
+                    self.__discard(self.__postings[token], document)
+                    if not self.__postings[token]:
+                        del self.__postings[token]
+
+            self.__changed = True
+
+    # ---------------------------------------------------------------------------
+
+    def render(self) -> list[str]:
+        """
+        SUMMARY
+        -------
+            This public method generates the content of the index file, one document per line.
+            The content is generated at once, so the index can be changed while the file is written.
+            A page declared differently by several headers keeps its first non-empty summary in sorted order.
+
+        RETURNS
+        -------
+            list[str]: The newline-terminated chunks of the JSON content
+        """
+        if self.__postings is None:
+            self.__postings = dict()
+            for document, count in self.__documents.items():
+                self.__add_postings(document, count)
+
+        categories: list[str] = [category.value for category in DocFileCategory]
+        category_indexes: dict[str, int] = {category: index for index, category in enumerate(categories)}
+
+        # the first declaration of each page, whatever the order of the headers
+        selected: dict[tuple[str, str], Document] = dict()
+        for document in sorted(self.__documents, key=lambda item: (item[0], item[2], not item[3], item[3])):
+            selected.setdefault((document[0], document[2]), document)
+
+        documents: list[Document] = sorted(selected.values(), key=lambda item: (item[1], item[0], item[2]))
+        identifiers: dict[tuple[str, str], int] = {(document[0], document[2]): identifier
+                                                   for identifier, document in enumerate(documents)}
+
+        tokens: list[str] = sorted(self.__postings)
+        postings: list[list[int]] = [sorted({identifiers[(category, page)]
+                                             for category, _, page, _ in self.__postings[token]}) for token in tokens]
+
+        chunks: list[str] = [f'{{"version":{SEARCH_INDEX_VERSION},',
+                             f'"categories":{json.dumps(categories, separators=(",", ":"))},\n',
+                             '"documents":[\n']
+        chunks.extend(json.dumps([category_indexes[category], name, page, summary], ensure_ascii=False,
+                                 separators=(",", ":")) +
+                      (",\n" if identifier < len(documents) - 1 else "\n")
+                      for identifier, (category, name, page, summary) in enumerate(documents))
+        chunks.append(f'],\n"tokens":{json.dumps(tokens, ensure_ascii=False, separators=(",", ":"))},\n')
+        chunks.append(f'"postings":{json.dumps(postings, separators=(",", ":"))}}}\n')
+
+        self.__changed = False
+        return chunks
+
+    # ---------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ---------------------------------------------------------------------------
+
+    def __add_postings(self, document: Document, count: int = 1) -> None:
+        """
+        SUMMARY
+        -------
+            This private method adds a document to the postings of its tokens.
+        """
+        for token in self.__get_document_tokens(document):
+            self.__postings.setdefault(token, Counter())[document] += count
+
+    # ---------------------------------------------------------------------------
+
+    @staticmethod
+    def __get_document_tokens(document: Document) -> set[str]:
+        """
+        SUMMARY
+        -------
+            This private static method returns the tokens of the name and the summary of a document.
+        """
+        return {*get_tokens(document[1]), *get_tokens(document[3])}
+
+    # ---------------------------------------------------------------------------
+
+    @staticmethod
+    def __discard(counter: Counter, key: object) -> None:
+        """
+        SUMMARY
+        -------
+            This private static method decrements the count of a key, removed when it reaches zero.
+        """
+        counter[key] -= 1
+        if counter[key] <= 0:
+            del counter[key]
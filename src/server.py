@@ -0,0 +1,375 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.server.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Serves the documentation of the parsed headers over a local Unix socket.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import os
+import sys
+import json
+import threading
+import traceback
+import socketserver
+from typing import Iterable
+
+from src.io_manager import IOManager, DocFileCategory
+from src.modelization import FileDesc, to_page_name
+from src.parser import parse_header
+from src.pipeline import DocumentationPipeline, parse_headers
+from src.rendering import NamespaceIndex, render_file
+
+# A symbol of the model: (category, path of its header relative to the input directory, page name)
+Symbol = tuple[DocFileCategory, str, str]
+
+# ---------------------------------------------------------------------------
+
+
+def _get_symbols(file_desc: FileDesc) -> Iterable[tuple[str, Symbol]]:
+    """
+    SUMMARY
+    -------
+        This private function returns the symbols of a header that can be rendered, methods included.
+    """
+    relative_path: str = file_desc.get_path()
+
+    for name in file_desc.get_namespaces():
+        yield name, (DocFileCategory.NAMESPACE, relative_path, to_page_name(name))
+
+    for name in file_desc.get_classes():
+        yield name, (DocFileCategory.CLASS, relative_path, to_page_name(name))
+
+    for function, _, page in file_desc.get_functions():
+        yield function.get_name(), (DocFileCategory.FUNCTION, relative_path, page)
+
+    for enum in file_desc.get_enums():
+        yield enum.get_name(), (DocFileCategory.ENUM, relative_path, to_page_name(enum.get_name()))
+
+
+# ---------------------------------------------------------------------------
+
+
+class DocServer:
+    """
+    SUMMARY
+    -------
+        This class keeps the parsed model of all headers in memory and answers the requests of editor integrations.
+        The requests and the responses are JSON objects, one per line, exchanged over a local Unix socket:
+            - {"command": "symbol", "name": "<qualified name>"}: renders the pages of a symbol
+            - {"command": "file", "path": "<header path>"}: renders the page of a header
+            - {"command": "refresh", "path": "<header path>"}: parses a header again and updates its documentation
+        A response is {"ok": true, ...} with the result, or {"ok": false, "error": "<message>"}.
+        The header paths are relative to the input directory, or absolute.
+    """
+
+    def __init__(self, io_manager: IOManager, pipeline: DocumentationPipeline, input_dir_root: str,
+                 jobs: int = 1) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the constructor of the DocServer class, it parses all headers once.
+            The documentation on disk must be up to date ('run' of the pipeline), it is then updated by the refreshes.
+
+        PARAMETERS
+        ----------
+            - io_manager (IOManager): The I/O manager of the input and output directories
+            - pipeline (DocumentationPipeline): The pipeline that generated the documentation
+            - input_dir_root (str): The path of the input directory
+            - jobs (int): Optional parameter, the number of parsing processes (0 to use all cores)
+        """
+        self.__pipeline: DocumentationPipeline = pipeline
+        self.__input_dir: str = input_dir_root
+
+        self.__files: dict[str, FileDesc] = dict()
+        self.__symbols: dict[str, list[Symbol]] = dict()
+
+        # the requests of concurrent connections are handled one at a time
+        self.__lock: threading.Lock = threading.Lock()
+
+        for file_desc in parse_headers(io_manager.get_files(), input_dir_root, jobs, cache=pipeline.get_parse_cache()):
+            self.__add_file(file_desc)
+
+    # ---------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ---------------------------------------------------------------------------
+
+    def handle_request(self, request: dict) -> dict:
+        """
+        SUMMARY
+        -------
+            This public method answers a request of the protocol (see the class documentation).
+
+        PARAMETERS
+        ----------
+            - request (dict): The decoded request
+
+        RETURNS
+        -------
+            dict: The response to encode, the errors are reported in it instead of being raised.
+                  The unexpected errors are also printed with their traceback, the server keeps running
+        """
+        try:
+            with self.__lock:
+                match request.get("command"):
+                    case "symbol":
+                        return {"ok": True, "pages": self.__render_symbol(self.__get_field(request, "name"))}
+                    case "file":
+                        return {"ok": True, "pages": self.__render_header(self.__get_field(request, "path"))}
+                    case "refresh":
+                        return {"ok": True, **self.__refresh(self.__get_field(request, "path"))}
+                    case command:
+                        raise ValueError(f"Unknown command '{command}' !")
+        except (ValueError, OSError) as error:
+            return {"ok": False, "error": str(error)}
+        except Exception as error:
+            print(f"Internal error on the request {request!r}:", file=sys.stderr)
+            traceback.print_exc(file=sys.stderr)
+            return {"ok": False, "error": f"Internal error: {error!r}"}
+
+    # ---------------------------------------------------------------------------
+
+    def serve(self, socket_path: str) -> None:
+        """
+        SUMMARY
+        -------
+            This public method serves the requests on a Unix socket until interrupted, the socket file is then removed.
+            A connection can send any number of requests, so a client can keep it open.
+
+        PARAMETERS
+        ----------
+            - socket_path (str): The path of the Unix socket file, a previous socket file is replaced
+        """
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+        with _SocketServer(socket_path, self) as server:
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os.remove(socket_path)
+
+    # ---------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ---------------------------------------------------------------------------
+
+    def __render_symbol(self, name: str) -> list[dict]:
+        """
+        SUMMARY
+        -------
+            This private method renders the pages of a symbol, there are several pages for the overloaded functions.
+        """
+        symbols: list[Symbol] | None = self.__symbols.get(name)
+        if not symbols:
+            raise ValueError(f"The symbol '{name}' isn't documented !")
+
+        if symbols[0][0] is DocFileCategory.NAMESPACE:
+            namespaces: NamespaceIndex = self.__pipeline.get_namespaces()
+            return self.__render_pages(namespaces.render([name]))
+
+        pages: list[dict] = list()
+        for relative_path in dict.fromkeys(path for _, path, _ in symbols):
+            wanted: set[tuple[DocFileCategory, str]] = {(category, page) for category, path, page in symbols
+                                                        if path == relative_path}
+            pages.extend(self.__render_pages(render_file(self.__files[relative_path], self.__pipeline.get_symbols()),
+                                             wanted))
+
+        return pages
+
+    # ---------------------------------------------------------------------------
+
+    def __render_header(self, path: str) -> list[dict]:
+        """
+        SUMMARY
+        -------
+            This private method renders the page of a header file.
+        """
+        file_desc: FileDesc | None = self.__files.get(self.__get_relative_path(path))
+        if file_desc is None:
+            raise ValueError(f"The header '{path}' isn't documented !")
+
+        wanted: set[tuple[DocFileCategory, str]] = {(DocFileCategory.FILE, file_desc.get_page_name())}
+        return self.__render_pages(render_file(file_desc, self.__pipeline.get_symbols()), wanted)
+
+    # ---------------------------------------------------------------------------
+
+    def __refresh(self, path: str) -> dict:
+        """
+        SUMMARY
+        -------
+            This private method parses a header again, or forgets it if it was removed, and updates its documentation.
+        """
+        relative_path: str = self.__get_relative_path(path)
+        absolute_path: str = os.path.join(self.__input_dir, relative_path)
+
+        if not os.path.isfile(absolute_path):
+            if relative_path not in self.__files:
+                raise ValueError(f"The header '{path}' doesn't exist !")
+
+            self.__remove_file(self.__files[relative_path])
+            self.__pipeline.update(list(), [absolute_path])
+            return {"removed": True}
+
+        # parsed before the model is changed, a header that can't be read keeps its previous model
+        file_desc: FileDesc = parse_header(absolute_path, self.__input_dir)
+
+        if relative_path in self.__files:
+            self.__remove_file(self.__files[relative_path])
+        self.__add_file(file_desc)
+        self.__pipeline.update([absolute_path], list())
+
+        return {"removed": False}
+
+    # ---------------------------------------------------------------------------
+
+    def __add_file(self, file_desc: FileDesc) -> None:
+        """
+        SUMMARY
+        -------
+            This private method adds a parsed header to the model.
+        """
+        self.__files[file_desc.get_path()] = file_desc
+
+        for name, symbol in _get_symbols(file_desc):
+            self.__symbols.setdefault(name, list()).append(symbol)
+
+    # ---------------------------------------------------------------------------
+
+    def __remove_file(self, file_desc: FileDesc) -> None:
+        """
+        SUMMARY
+        -------
+            This private method removes a parsed header from the model.
+        """
+        del self.__files[file_desc.get_path()]
+
+        for name, symbol in _get_symbols(file_desc):
+            symbols: list[Symbol] = self.__symbols[name]
+            symbols.remove(symbol)
+            if not symbols:
+                del self.__symbols[name]
+
+    # ---------------------------------------------------------------------------
+
+    def __get_relative_path(self, path: str) -> str:
+        """
+        SUMMARY
+        -------
+            This private method returns the path of a header relative to the input directory ('/' separated).
+        """
+        if os.path.isabs(path):
+            path = os.path.relpath(path, self.__input_dir)
+
+        path = os.path.normpath(path)
+        if path == os.pardir or path.startswith(os.pardir + os.sep):
+            raise ValueError(f"The header '{path}' isn't in the input directory !")
+
+        return path.replace(os.sep, "/")
+
+    # ---------------------------------------------------------------------------
+
+    @staticmethod
+    def __render_pages(pages: Iterable[tuple[DocFileCategory, str, Iterable[str]]],
+                       wanted: set[tuple[DocFileCategory, str]] = None) -> list[dict]:
+        """
+        SUMMARY
+        -------
+            This private static method renders the given pages to strings, the pages not wanted aren't rendered.
+        """
+        return [{"category": category.value, "name": name, "markdown": "".join(content)}
+                for category, name, content in pages if wanted is None or (category, name) in wanted]
+
+    # ---------------------------------------------------------------------------
+
+    @staticmethod
+    def __get_field(request: dict, field: str) -> str:
+        """
+        SUMMARY
+        -------
+            This private static method returns a string field of a request.
+        """
+        value = request.get(field)
+        if not isinstance(value, str):
+            raise ValueError(f"The '{field}' field of the request is missing !")
+
+        return value
+
+
+# ---------------------------------------------------------------------------
+
+
+class _SocketServer(socketserver.ThreadingUnixStreamServer):
+    """
+    SUMMARY
+    -------
+        This private class is the Unix socket server of a DocServer, each connection is handled by a thread.
+    """
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, doc_server: DocServer) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the constructor of the _SocketServer class, it binds the socket.
+
+        PARAMETERS
+        ----------
+            - socket_path (str): The path of the Unix socket file
+            - doc_server (DocServer): The server that answers the requests
+        """
+        self.doc_server: DocServer = doc_server
+        super().__init__(socket_path, _RequestHandler)
+
+
+# ---------------------------------------------------------------------------
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """
+    SUMMARY
+    -------
+        This private class reads the requests of a connection, one JSON object per line, and writes the responses.
+    """
+
+    def handle(self) -> None:
+        """
+        SUMMARY
+        -------
+            This public method answers the requests of the connection until the client closes it.
+        """
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                response: dict = self.server.doc_server.handle_request(request) if isinstance(request, dict) \
+                    else {"ok": False, "error": "The request must be a JSON object !"}
+            except json.JSONDecodeError as error:
+                response = {"ok": False, "error": f"Invalid JSON request: {error}"}
+
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
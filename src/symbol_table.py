@@ -0,0 +1,357 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.symbol_table.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Maps the qualified names of the whole project to their documentation page.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import re
+from collections import Counter
+from typing import Iterable, Iterator
+
+from src import DocFileCategory
+from src.modelization import PageLinks
+
+# A symbol entry of a header (see NamespaceIndex.get_entries): (category value, qualified name, page name)
+SymbolEntry = tuple[str, str, str]
+
+# The categories of the symbols that are types, their mentions in the text are linked
+TYPE_CATEGORIES: tuple[str, ...] = (DocFileCategory.CLASS.value, DocFileCategory.ENUM.value)
+
+# A possibly qualified c++ name, not preceded by an identifier character or a scope operator
+NAME_PATTERN: re.Pattern = re.compile(r"(?<![\w:])[A-Za-z_]\w*(?:::[A-Za-z_]\w*)*")
+
+# The c++ keywords and fundamental types, they can't be the name of a type
+CPP_KEYWORDS: frozenset[str] = frozenset((
+    "alignas", "alignof", "and", "and_eq", "asm", "auto", "bitand", "bitor", "bool", "break", "case", "catch",
+    "char", "char8_t", "char16_t", "char32_t", "class", "compl", "concept", "const", "consteval", "constexpr",
+    "constinit", "const_cast", "continue", "co_await", "co_return", "co_yield", "decltype", "default", "delete",
+    "do", "double", "dynamic_cast", "else", "enum", "explicit", "export", "extern", "false", "float", "for",
+    "friend", "goto", "if", "inline", "int", "long", "mutable", "namespace", "new", "noexcept", "not", "not_eq",
+    "nullptr", "operator", "or", "or_eq", "private", "protected", "public", "register", "reinterpret_cast",
+    "requires", "return", "short", "signed", "sizeof", "static", "static_assert", "static_cast", "struct",
+    "switch", "template", "this", "thread_local", "throw", "true", "try", "typedef", "typeid", "typename",
+    "union", "unsigned", "using", "virtual", "void", "volatile", "wchar_t", "while", "xor", "xor_eq"
+))
+
+# ---------------------------------------------------------------------------
+
+
+def get_mentions(text: str) -> Iterator[str]:
+    """
+    SUMMARY
+    -------
+        This public function returns the names in a text that could be the name of a documented type.
+
+    PARAMETERS
+    ----------
+        - text (str): The text of a table cell, None is an empty cell
+
+    RETURNS
+    -------
+        Iterator[str]: The possibly qualified names, the c++ keywords excluded
+    """
+    for match in NAME_PATTERN.finditer(text or ''):
+        if match.group() not in CPP_KEYWORDS:
+            yield match.group()
+
+
+def _get_type_keys(name: str) -> Iterator[str]:
+    """
+    SUMMARY
+    -------
+        This private function returns the names a type can be mentioned with: its qualified name and its suffixes,
+        from the closest enclosing scope to the unqualified name (a::b::C -> a::b::C, b::C, C).
+    """
+    yield name
+
+    position: int = name.find("::")
+    while position != -1:
+        yield name[position + 2:]
+        position = name.find("::", position + 2)
+
+# ---------------------------------------------------------------------------
+
+
+class SymbolTable:
+    """
+    SUMMARY
+    -------
+        This class maps the qualified names of all headers (namespaces, classes, functions, methods, enumerations)
+        and the path of the header files to their documentation page, so a link is resolved with a dict lookup.
+        A name defined by several headers (same class declared twice, overloads across files) resolves
+        to its first page in sorted order, whatever the order of the headers.
+        Each name keeps the clock value of its last change, so the pages rendered before can be found.
+
+        The types (classes and enumerations) can also be found by the names they are mentioned with in the text:
+        their qualified name, or a shorter suffix (b::C or C for a::b::C) if no other type has it.
+        All mentions of a text are then linked in a single pass, with one dict lookup per name.
+    """
+
+    __slots__ = ("__definitions", "__targets", "__type_keys", "__type_targets", "__versions", "__clock")
+
+    def __init__(self) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the constructor of the SymbolTable class.
+        """
+        # the number of headers that define each (category value, page) of a name
+        self.__definitions: dict[str, Counter] = dict()
+        self.__targets: dict[str, tuple[DocFileCategory, str]] = dict()
+        # the number of type definitions that can be mentioned with each name, by qualified name
+        self.__type_keys: dict[str, Counter] = dict()
+        self.__type_targets: dict[str, tuple[DocFileCategory, str]] = dict()
+        self.__versions: dict[str, int] = dict()
+        self.__clock: int = 0
+
+    # ---------------------------------------------------------------------------
+    # GETTERS
+    # ---------------------------------------------------------------------------
+
+    def get_clock(self) -> int:
+        """
+        SUMMARY
+        -------
+            This public method returns the clock of the table, incremented by each change.
+
+        RETURNS
+        -------
+            int: The current clock value
+        """
+        return self.__clock
+
+    # ---------------------------------------------------------------------------
+
+    def get_version(self, name: str) -> int:
+        """
+        SUMMARY
+        -------
+            This public method returns the clock value of the last change of a name.
+
+        PARAMETERS
+        ----------
+            - name (str): The qualified name
+
+        RETURNS
+        -------
+            int: The clock value, 0 if the name never changed
+        """
+        return self.__versions.get(name, 0)
+
+    # ---------------------------------------------------------------------------
+
+    def resolve(self, name: str) -> tuple[DocFileCategory, str] | None:
+        """
+        SUMMARY
+        -------
+            This public method returns the documentation page of a name.
+
+        PARAMETERS
+        ----------
+            - name (str): The qualified name of a symbol, or the path of a header relative to the input directory
+
+        RETURNS
+        -------
+            tuple[DocFileCategory, str] | None: The (category, page name) of the symbol, None if it isn't documented
+        """
+        return self.__targets.get(name)
+
+    # ---------------------------------------------------------------------------
+
+    def resolve_type(self, name: str) -> tuple[DocFileCategory, str] | None:
+        """
+        SUMMARY
+        -------
+            This public method returns the documentation page of a type mentioned in a text.
+
+        PARAMETERS
+        ----------
+            - name (str): The name of the type, qualified or not
+
+        RETURNS
+        -------
+            tuple[DocFileCategory, str] | None: The (category, page name) of the type,
+                None if no type or several types are mentioned with this name
+        """
+        return self.__type_targets.get(name)
+
+    # ---------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ---------------------------------------------------------------------------
+
+    def link_types(self, text: str, links: PageLinks) -> str:
+        """
+        SUMMARY
+        -------
+            This public method links all mentions of a documented type in a text to its page, in a single pass.
+
+        PARAMETERS
+        ----------
+            - text (str): The text to link, a markdown table cell (None is an empty cell)
+            - links (PageLinks): The links from the directory of the page that contains the text
+
+        RETURNS
+        -------
+            str: The text with the markdown links
+        """
+        def link(match: re.Match) -> str:
+            target: tuple[DocFileCategory, str] | None = self.__type_targets.get(match.group())
+            if target is None:
+                return match.group()
+
+            return f"[{match.group()}]({links.get(*target)})"
+
+        return NAME_PATTERN.sub(link, text or '')
+
+    # ---------------------------------------------------------------------------
+
+    def add_entries(self, symbols: Iterable[SymbolEntry]) -> None:
+        """
+        SUMMARY
+        -------
+            This public method registers the symbols of a header file.
+
+        PARAMETERS
+        ----------
+            - symbols (Iterable[SymbolEntry]): The symbols (category value, qualified name, page name)
+        """
+        self.__clock += 1
+        type_keys: set[str] = set()
+
+        for category, name, page in symbols:
+            self.__definitions.setdefault(name, Counter())[(category, page)] += 1
+            self.__update_target(name)
+
+            if category in TYPE_CATEGORIES:
+                for key in _get_type_keys(name):
+                    self.__type_keys.setdefault(key, Counter())[name] += 1
+                    type_keys.add(key)
+
+        for key in type_keys:
+            self.__update_type_target(key)
+
+    # ---------------------------------------------------------------------------
+
+    def remove_entries(self, symbols: Iterable[SymbolEntry]) -> None:
+        """
+        SUMMARY
+        -------
+            This public method unregisters the symbols previously added for a header file.
+
+        PARAMETERS
+        ----------
+            - symbols (Iterable[SymbolEntry]): The symbols (category value, qualified name, page name)
+        """
+        self.__clock += 1
+        type_keys: set[str] = set()
+
+        for category, name, page in symbols:
+            definitions: Counter | None = self.__definitions.get(name)
+            if definitions is None or (category, page) not in definitions:
+                continue
+
+            self.__discard(self.__definitions, name, (category, page))
+            self.__update_target(name)
+
+            if category in TYPE_CATEGORIES:
+                for key in _get_type_keys(name):
+                    self.__discard(self.__type_keys, key, name)
+                    type_keys.add(key)
+
+        for key in type_keys:
+            self.__update_type_target(key)
+
+    # ---------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ---------------------------------------------------------------------------
+
+    def __update_target(self, name: str) -> None:
+        """
+        SUMMARY
+        -------
+            This private method resolves again a name whose definitions changed, and stamps it if its page changed.
+        """
+        definitions: Counter | None = self.__definitions.get(name)
+        target: tuple[DocFileCategory, str] | None = None
+
+        if definitions:
+            category, page = min(definitions)
+            target = (DocFileCategory(category), page)
+
+        if target == self.__targets.get(name):
+            return
+
+        if target is None:
+            del self.__targets[name]
+        else:
+            self.__targets[name] = target
+        self.__versions[name] = self.__clock
+
+    # ---------------------------------------------------------------------------
+
+    def __update_type_target(self, key: str) -> None:
+        """
+        SUMMARY
+        -------
+            This private method resolves again a name a type is mentioned with, and stamps it if its page changed.
+        """
+        names: Counter | None = self.__type_keys.get(key)
+        target: tuple[DocFileCategory, str] | None = None
+
+        # a name shared by several types is ambiguous, it isn't linked
+        if names is not None and len(names) == 1:
+            definitions: Counter = self.__definitions[next(iter(names))]
+            category, page = min(definition for definition in definitions if definition[0] in TYPE_CATEGORIES)
+            target = (DocFileCategory(category), page)
+
+        if target == self.__type_targets.get(key):
+            return
+
+        if target is None:
+            del self.__type_targets[key]
+        else:
+            self.__type_targets[key] = target
+        self.__versions[key] = self.__clock
+
+    # ---------------------------------------------------------------------------
+
+    @staticmethod
+    def __discard(counters: dict[str, Counter], name: str, entry: str | tuple) -> None:
+        """
+        SUMMARY
+        -------
+            This private static method decrements the count of an entry, the empty counters are removed.
+        """
+        counter: Counter = counters[name]
+
+        counter[entry] -= 1
+        if counter[entry] <= 0:
+            del counter[entry]
+        if not counter:
+            del counters[name]
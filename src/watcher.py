@@ -0,0 +1,262 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.src.watcher.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Detects the changed, added and removed header files by polling the input directory.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import os
+
+from src.io_manager import IOManager
+
+# The signature of a header file, it changes when the file is saved: (size, modification time in ns)
+Signature = tuple[int, int]
+
+# ---------------------------------------------------------------------------
+
+
+class HeaderWatcher:
+    """
+    SUMMARY
+    -------
+        This class keeps a snapshot of the header files of the input directory and polls it for changes.
+        A directory is only scanned again when its modification time changes (a file was added, removed or renamed),
+        the other headers are only checked with a 'stat' call, so a poll is cheap even on large projects.
+    """
+
+    def __init__(self, io_manager: IOManager, input_dir_root: str) -> None:
+        """
+        SUMMARY
+        -------
+            This public method is the constructor of the HeaderWatcher class, it takes the first snapshot.
+            The excluded directories and the output directory of the IOManager are never watched.
+
+        PARAMETERS
+        ----------
+            - io_manager (IOManager): The I/O manager of the input and output directories
+            - input_dir_root (str): The path of the input directory
+        """
+        self.__io_manager: IOManager = io_manager
+
+        # the modification time of each watched directory, with its headers and sub directories
+        self.__directories: dict[str, int] = dict()
+        self.__children: dict[str, tuple[set[str], set[str]]] = dict()
+        self.__headers: dict[str, Signature] = dict()
+
+        self.__add_directory(input_dir_root, list())
+
+    # ---------------------------------------------------------------------------
+    # GETTERS
+    # ---------------------------------------------------------------------------
+
+    def get_headers(self) -> list[str]:
+        """
+        SUMMARY
+        -------
+            This public method returns the header files of the last snapshot.
+
+        RETURNS
+        -------
+            list[str]: The path of each watched header file
+        """
+        return list(self.__headers)
+
+    # ---------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ---------------------------------------------------------------------------
+
+    def poll(self) -> tuple[list[str], list[str]]:
+        """
+        SUMMARY
+        -------
+            This public method compares the input directory with the last snapshot and updates it.
+
+        RETURNS
+        -------
+            tuple[list[str], list[str]]: The path of the changed or added headers and of the removed headers, sorted
+        """
+        changed: list[str] = list()
+        removed: list[str] = list()
+
+        for directory, modification_time in list(self.__directories.items()):
+            # the directory may have been removed with its parent in this loop
+            if directory not in self.__directories:
+                continue
+
+            try:
+                stat: os.stat_result = os.stat(directory)
+            except OSError:
+                self.__remove_directory(directory, removed)
+                continue
+
+            if stat.st_mtime_ns != modification_time:
+                self.__rescan_directory(directory, stat.st_mtime_ns, changed, removed)
+
+        added: set[str] = set(changed)
+
+        for path, signature in list(self.__headers.items()):
+            if path in added:
+                continue
+
+            new_signature: Signature | None = self.__get_signature(path)
+            if new_signature is None:
+                # removed after its directory was checked, the next rescan of the directory will agree
+                del self.__headers[path]
+                removed.append(path)
+
+            elif new_signature != signature:
+                self.__headers[path] = new_signature
+                changed.append(path)
+
+        return sorted(changed), sorted(removed)
+
+    # ---------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ---------------------------------------------------------------------------
+
+    def __add_directory(self, directory: str, added: list[str]) -> None:
+        """
+        SUMMARY
+        -------
+            This private method adds a new directory and its whole sub tree to the snapshot.
+
+        PARAMETERS
+        ----------
+            - directory (str): The path of the directory
+            - added (list[str]): The list where the path of the found headers is appended
+        """
+        try:
+            # the time is taken before the scan, so a file created during the scan is seen by the next poll
+            modification_time: int = os.stat(directory).st_mtime_ns
+        except OSError:
+            return
+
+        headers, sub_directories = self.__io_manager.scan_directory(directory)
+
+        self.__directories[directory] = modification_time
+        self.__children[directory] = (self.__add_headers(headers, added), set(sub_directories))
+
+        for sub_directory in sub_directories:
+            self.__add_directory(sub_directory, added)
+
+    # ---------------------------------------------------------------------------
+
+    def __rescan_directory(self, directory: str, modification_time: int, changed: list[str], removed: list[str]) -> None:
+        """
+        SUMMARY
+        -------
+            This private method scans again a directory whose content changed, and updates the snapshot.
+
+        PARAMETERS
+        ----------
+            - directory (str): The path of the directory
+            - modification_time (int): The new modification time of the directory, in ns
+            - changed (list[str]): The list where the path of the added headers is appended
+            - removed (list[str]): The list where the path of the removed headers is appended
+        """
+        headers, sub_directories = self.__io_manager.scan_directory(directory)
+        old_headers, old_sub_directories = self.__children[directory]
+        new_sub_directories: set[str] = set(sub_directories)
+
+        for path in old_headers.difference(headers):
+            if self.__headers.pop(path, None) is not None:
+                removed.append(path)
+
+        for sub_directory in old_sub_directories - new_sub_directories:
+            self.__remove_directory(sub_directory, removed)
+
+        new_headers: set[str] = {path for path in headers if path in self.__headers}
+        new_headers.update(self.__add_headers([path for path in headers if path not in self.__headers], changed))
+
+        self.__directories[directory] = modification_time
+        self.__children[directory] = (new_headers, new_sub_directories)
+
+        for sub_directory in new_sub_directories - old_sub_directories:
+            self.__add_directory(sub_directory, changed)
+
+    # ---------------------------------------------------------------------------
+
+    def __remove_directory(self, directory: str, removed: list[str]) -> None:
+        """
+        SUMMARY
+        -------
+            This private method removes a directory and its whole sub tree from the snapshot.
+
+        PARAMETERS
+        ----------
+            - directory (str): The path of the directory
+            - removed (list[str]): The list where the path of the removed headers is appended
+        """
+        self.__directories.pop(directory, None)
+        headers, sub_directories = self.__children.pop(directory, (set(), set()))
+
+        for path in headers:
+            if self.__headers.pop(path, None) is not None:
+                removed.append(path)
+
+        for sub_directory in sub_directories:
+            self.__remove_directory(sub_directory, removed)
+
+    # ---------------------------------------------------------------------------
+
+    def __add_headers(self, headers: list[str], added: list[str]) -> set[str]:
+        """
+        SUMMARY
+        -------
+            This private method adds new header files to the snapshot, the ones already removed are skipped.
+
+        RETURNS
+        -------
+            set[str]: The path of the added headers
+        """
+        found: set[str] = set()
+
+        for path in headers:
+            signature: Signature | None = self.__get_signature(path)
+            if signature is not None:
+                self.__headers[path] = signature
+                found.add(path)
+                added.append(path)
+
+        return found
+
+    # ---------------------------------------------------------------------------
+
+    @staticmethod
+    def __get_signature(path: str) -> Signature | None:
+        """
+        SUMMARY
+        -------
+            This private static method returns the signature of a header file, None if it doesn't exist anymore.
+        """
+        try:
+            stat: os.stat_result = os.stat(path)
+        except OSError:
+            return None
+
+        return stat.st_size, stat.st_mtime_ns
@@ -0,0 +1,113 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.tests.conftest.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  The fixtures shared by the tests: the input and output directories and the headers written in them.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from src.modelization import FileDesc
+from src.parser import parse_header
+
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def input_root(tmp_path: Path) -> Path:
+    """
+    SUMMARY
+    -------
+        This fixture creates the input directory of a test, where its headers are written.
+    """
+    path: Path = tmp_path / "input"
+    path.mkdir()
+
+    return path
+
+
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def output_root(tmp_path: Path) -> Path:
+    """
+    SUMMARY
+    -------
+        This fixture returns the output directory of a test, created by the first page written.
+    """
+    return tmp_path / "output"
+
+
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def write_header(input_root: Path) -> Callable[[str, str], Path]:
+    """
+    SUMMARY
+    -------
+        This fixture writes headers in the input directory: write_header(name, content),
+        the name is relative to the input directory and its parent directories are created.
+
+    RETURNS
+    -------
+        Callable[[str, str], Path]: The function that writes a header and returns its path
+    """
+    def write(name: str, content: str) -> Path:
+        path: Path = input_root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+        return path
+
+    return write
+
+
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def parse_source(input_root: Path, write_header: Callable[[str, str], Path]) -> Callable[..., FileDesc]:
+    """
+    SUMMARY
+    -------
+        This fixture parses the source of a header: parse_source(content, name='header.hpp'),
+        the header is written in the input directory first.
+
+    RETURNS
+    -------
+        Callable[..., FileDesc]: The function that parses a header and returns its description
+    """
+    def parse(content: str, name: str = "header.hpp") -> FileDesc:
+        return parse_header(str(write_header(name, content)), str(input_root))
+
+    return parse
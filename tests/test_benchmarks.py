@@ -0,0 +1,160 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.tests.test_benchmarks.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Tests the generated corpus of the benchmarks, the results of a session and their comparison.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.compare import check_comparable, compare_results, STAGE_THRESHOLDS
+from benchmarks.corpus import CorpusGenerator
+from benchmarks.runner import create_report, run_benchmarks, RESULTS_VERSION
+from benchmarks.stages import BenchmarkContext
+
+# ---------------------------------------------------------------------------
+
+
+def read_tree(root: Path) -> dict[str, bytes]:
+    """
+    SUMMARY
+    -------
+        This function returns the content of each file of a directory tree, by relative path.
+    """
+    return {path.relative_to(root).as_posix(): path.read_bytes() for path in root.rglob("*") if path.is_file()}
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_corpus_only_depends_on_its_parameters(tmp_path: Path) -> None:
+    counts: dict[str, int] = CorpusGenerator(files=12, functions=4, seed=3).generate(str(tmp_path / "first"))
+    assert CorpusGenerator(files=12, functions=4, seed=3).generate(str(tmp_path / "second")) == counts
+    assert read_tree(tmp_path / "first") == read_tree(tmp_path / "second")
+
+    CorpusGenerator(files=12, functions=4, seed=4).generate(str(tmp_path / "other"))
+    assert read_tree(tmp_path / "other") != read_tree(tmp_path / "first")
+
+    # the counts are those of the documented model
+    context: BenchmarkContext = BenchmarkContext(str(tmp_path / "first"), str(tmp_path / "scratch"))
+    assert counts["files"] == len(context.get_model()) == 12
+    assert counts["functions"] == sum(len(file_desc.get_functions()) for file_desc in context.get_model()) == 48
+    assert counts["enums"] == sum(len(file_desc.get_enums()) for file_desc in context.get_model())
+    assert counts["bytes"] == sum(len(content) for content in read_tree(tmp_path / "first").values())
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_session_keeps_each_run_of_the_benchmarks(tmp_path: Path) -> None:
+    generator: CorpusGenerator = CorpusGenerator(files=6, functions=4)
+    counts: dict[str, int] = generator.generate(str(tmp_path / "input"))
+    context: BenchmarkContext = BenchmarkContext(str(tmp_path / "input"), str(tmp_path / "scratch"))
+
+    results: dict[str, dict] = run_benchmarks(context, ["parsing", "rendering"], repeat=3, warmup=0)
+    assert list(results) == ["parsing", "rendering"]
+    assert (results["parsing"]["unit"], results["parsing"]["items"]) == ("files", 6)
+    assert results["parsing"]["metrics"] == {"functions": 24}
+
+    for result in results.values():
+        assert len(result["seconds"]) == 3
+        assert result["median_seconds"] == sorted(result["seconds"])[1]
+        assert result["throughput"] == pytest.approx(result["items"] / result["median_seconds"])
+        assert result["peak_memory"] > 0
+
+    report: dict = create_report(results, {"parameters": generator.get_parameters(), "counts": counts}, 3, 0)
+    assert report["version"] == RESULTS_VERSION
+    assert report["corpus"]["parameters"]["files"] == 6
+
+    with pytest.raises(ValueError):
+        run_benchmarks(context, ["unknown"])
+    with pytest.raises(ValueError):
+        run_benchmarks(context, ["parsing"], repeat=0)
+
+
+# ---------------------------------------------------------------------------
+
+
+def create_document(seconds: dict[str, list[float]], peak_memory: int = 1000, files: int = 500) -> dict:
+    """
+    SUMMARY
+    -------
+        This function returns a results document with the given durations of each benchmark, for 100 items.
+    """
+    return {"version": RESULTS_VERSION, "environment": {"python": "3.11"},
+            "corpus": {"parameters": {"files": files}, "counts": {}},
+            "benchmarks": {name: {"items": 100, "seconds": runs, "peak_memory": peak_memory}
+                           for name, runs in seconds.items()}}
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_comparison_only_fails_on_regressions_above_the_noise() -> None:
+    baseline: dict = create_document({"parsing": [1.0, 1.02, 0.98, 1.01, 0.99], "rendering": [1.0, 1.1, 0.9],
+                                      "writing": [1.0, 1.0, 1.0], "lexing": [1.0, 1.0, 1.0]})
+    current: dict = create_document({"parsing": [1.2, 1.22, 1.18, 1.21, 1.19], "rendering": [1.12, 0.8, 1.6],
+                                     "writing": [1.2, 1.2, 1.2], "search_index": [1.0, 1.0, 1.0]})
+
+    statuses: dict[str, dict] = {comparison["benchmark"]: comparison
+                                 for comparison in compare_results(baseline, current)}
+    assert {name: comparison["status"] for name, comparison in statuses.items()} == {
+        "parsing": "regression", "rendering": "ok", "writing": "ok", "lexing": "missing", "search_index": "new"}
+
+    # the noisy rendering runs overlap the baseline, the writing has a larger threshold
+    assert statuses["parsing"]["slowdown"] == pytest.approx(0.2)
+    assert statuses["rendering"]["slowdown"] == pytest.approx(0.12)
+    assert statuses["writing"]["threshold"] == STAGE_THRESHOLDS["writing"]
+
+    faster: list[dict] = compare_results(current, baseline)
+    assert [comparison["status"] for comparison in faster][:3] == ["faster", "ok", "ok"]
+
+    # a session uses more memory
+    [comparison] = compare_results(create_document({"parsing": [1.0]}),
+                                   create_document({"parsing": [1.0]}, peak_memory=1200))
+    assert comparison["status"] == "regression"
+    assert comparison["memory_increase"] == pytest.approx(0.2)
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_sessions_of_other_corpora_are_not_compared() -> None:
+    baseline: dict = create_document({"parsing": [1.0]})
+    assert check_comparable(baseline, create_document({"parsing": [2.0]})) == []
+
+    other_machine: dict = create_document({"parsing": [1.0]})
+    other_machine["environment"]["python"] = "3.12"
+    assert check_comparable(baseline, other_machine) == ["The python differs: '3.11' and '3.12'"]
+
+    with pytest.raises(ValueError):
+        check_comparable(baseline, create_document({"parsing": [1.0]}, files=1000))
+    with pytest.raises(ValueError):
+        check_comparable(baseline, {**baseline, "version": RESULTS_VERSION + 1})
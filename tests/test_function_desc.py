@@ -0,0 +1,94 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.tests.test_function_desc.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Tests the indexes of the parameter and exception tags of the function descriptions.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+from src.modelization.function_desc import FunctionDesc
+from src.modelization.tags import TagKeys, TypedTag, ParameterTag
+from src.parser import get_parameter_names
+
+# ---------------------------------------------------------------------------
+
+
+def test_duplicated_parameter_keeps_the_first_tag() -> None:
+    first: ParameterTag = ParameterTag(TagKeys.PARAMETER, ["the first"], "int", "a")
+    second: ParameterTag = ParameterTag(TagKeys.PARAMETER, ["the second"], "int", "a")
+    function: FunctionDesc = FunctionDesc("add", "int add(int a);", parameters=[first])
+    function.add_parameters([second])
+
+    # both tags are rendered in declaration order, the lookup finds the first one
+    assert [tag.get_value() for tag in function.get_parameters()] == [("the first",), ("the second",)]
+    assert function.get_parameter("a") is first
+    assert function.get_parameter("b") is None
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_unnamed_parameter_and_untyped_exception_are_not_indexed() -> None:
+    unnamed: ParameterTag = ParameterTag(TagKeys.PARAMETER, ["a value"], "int")
+    untyped: TypedTag = TypedTag(TagKeys.EXCEPTION, ["on error"])
+    typed: TypedTag = TypedTag(TagKeys.EXCEPTION, ["out of range"], "std::out_of_range")
+    duplicate: TypedTag = TypedTag(TagKeys.EXCEPTION, ["negative index"], "std::out_of_range")
+    function: FunctionDesc = FunctionDesc("at", "int at(int index);", parameters=[unnamed],
+                                          exceptions=[untyped, typed, duplicate])
+
+    assert function.get_parameters() == (unnamed,)
+    assert function.get_parameter(None) is None
+    assert function.get_throws() == (untyped, typed, duplicate)
+    assert function.get_throw(None) is None
+    assert function.get_throw("std::out_of_range") is typed
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_validate_against_signature() -> None:
+    parameters: list[ParameterTag] = [ParameterTag(TagKeys.PARAMETER, ["unknown"], "int", "z"),
+                                      ParameterTag(TagKeys.PARAMETER, ["the second"], "int", "b"),
+                                      ParameterTag(TagKeys.PARAMETER, ["also unknown"], "int", "y")]
+    function: FunctionDesc = FunctionDesc("mix", "int mix(int a, int b, int c);", parameters=parameters)
+
+    # the declared parameters without tag, then the tags without declared parameter, both in declaration order
+    missing, unknown = function.validate_against_signature(get_parameter_names(function.get_code_line()))
+    assert (missing, unknown) == (["a", "c"], ["z", "y"])
+    assert function.validate_against_signature(["b", "z", "y"]) == ([], [])
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_parameter_names_of_a_signature() -> None:
+    assert get_parameter_names("void reset();") == []
+    assert get_parameter_names("void reset(void);") == []
+    assert get_parameter_names("double operator()(int index) const;") == ["index"]
+    assert get_parameter_names("void sort(std::vector<std::pair<int, Vec>> values, bool (*less)(int, int),\n"
+                               "          const std::string&, unsigned int count = f(1, 2), char name[4], ...);"
+                               ) == ["values", "less", "count", "name"]
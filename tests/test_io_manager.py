@@ -0,0 +1,161 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.tests.test_io_manager.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Tests the writing of the documentation files: streamed, atomic and asynchronous.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+from src import DocFileCategory
+from src.async_writer import AsyncWriter
+from src.io_manager import IOManager
+from src.modelization import FileDesc
+from src.rendering import render_file
+from src.symbol_table import SymbolTable
+
+# ---------------------------------------------------------------------------
+
+
+def test_rendered_chunks_are_streamed_to_the_file(input_root: Path, output_root: Path,
+                                                  parse_source: Callable[..., FileDesc]) -> None:
+    file_desc: FileDesc = parse_source("/**\n"
+                                       " * @brief Adds two numbers,\n"
+                                       " * with a résumé.\n"
+                                       " * @param a {int} {in} the first\n"
+                                       " * @return {int} the sum\n"
+                                       " */\n"
+                                       "int add(int a, int b);\n", "math.hpp")
+    io_manager: IOManager = IOManager(str(input_root), str(output_root), writers=0)
+    function_dir: Path = output_root / DocFileCategory.FUNCTION.value
+    temporary_files: list[list[str]] = list()
+
+    def stream(chunks: Iterator[str]) -> Iterator[str]:
+        # the file is written while the page is rendered, the content isn't joined first
+        for chunk in chunks:
+            assert chunk.endswith("\n")
+            yield chunk
+            temporary_files.append([name for name in os.listdir(function_dir) if name.endswith(".tmp")])
+
+    expected: dict[str, str] = dict()
+    for category, name, chunks in render_file(file_desc, SymbolTable()):
+        if category == DocFileCategory.FUNCTION:
+            chunks = list(chunks)
+            expected[name] = "".join(chunks)
+            written: int = io_manager.create_file(name, stream(iter(chunks)), category)
+            assert written == len(expected[name].encode("utf-8"))
+
+    assert temporary_files and all(len(names) == 1 for names in temporary_files)
+    for name, content in expected.items():
+        assert (function_dir / f"{name}.md").read_text(encoding="utf-8") == content
+    assert not any(name.endswith(".tmp") for name in os.listdir(function_dir))
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_file_is_replaced_atomically_only_when_changed(input_root: Path, output_root: Path) -> None:
+    io_manager: IOManager = IOManager(str(input_root), str(output_root), writers=0)
+    path: Path = output_root / DocFileCategory.CLASS.value / "Vec.md"
+
+    assert io_manager.create_file("Vec", ["# Vec\n", "first\n"], DocFileCategory.CLASS) == 12
+    os.utime(path, ns=(0, 0))
+
+    # the same content leaves the file untouched, a content of the same size replaces it
+    assert io_manager.create_file("Vec", iter(["# Vec\n", "first\n"]), DocFileCategory.CLASS) == 0
+    assert path.stat().st_mtime_ns == 0
+    assert io_manager.create_file("Vec", ["# Vec\n", "other\n"], DocFileCategory.CLASS) == 12
+    assert path.read_text(encoding="utf-8") == "# Vec\nother\n"
+
+    def failing() -> Iterator[str]:
+        yield "# Vec\n"
+        raise ValueError("rendering failed")
+
+    # an interrupted write keeps the previous file, without any temporary file
+    with pytest.raises(ValueError):
+        io_manager.create_file("Vec", failing(), DocFileCategory.CLASS)
+    assert path.read_text(encoding="utf-8") == "# Vec\nother\n"
+    assert os.listdir(path.parent) == ["Vec.md"]
+
+    statistics: dict[str, dict[str, int]] = io_manager.get_write_statistics()
+    assert statistics["written"]["classes"] == 2 and statistics["skipped"]["classes"] == 1
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_writer_thread_error_is_raised_by_flush(input_root: Path, output_root: Path) -> None:
+    io_manager: IOManager = IOManager(str(input_root), str(output_root), writers=2)
+    # the category directory is replaced by a file, its pages can't be written
+    class_dir: Path = output_root / DocFileCategory.CLASS.value
+    os.rmdir(class_dir)
+    class_dir.write_text("", encoding="utf-8")
+
+    try:
+        io_manager.submit_file("Vec", ["# Vec\n"], DocFileCategory.CLASS)
+        io_manager.submit_file("add", ["# add\n"], DocFileCategory.FUNCTION)
+
+        with pytest.raises(OSError, match="Vec.md") as error:
+            io_manager.flush()
+        assert isinstance(error.value.__cause__, OSError)
+
+        # the error is reported once, the writers keep writing the next files
+        io_manager.submit_file("sub", ["# sub\n"], DocFileCategory.FUNCTION)
+        io_manager.flush()
+        assert sorted(os.listdir(output_root / DocFileCategory.FUNCTION.value)) == ["add.md", "sub.md"]
+    finally:
+        io_manager.close()
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_writes_of_a_file_run_in_submission_order() -> None:
+    writer: AsyncWriter = AsyncWriter(writers=4, queue_size=2)
+    order: list[int] = list()
+
+    def task(index: int) -> Callable[[], None]:
+        def write() -> None:
+            # the later tasks would overtake the slow ones without the ordering of the same file
+            time.sleep(0.002 if index % 3 == 0 else 0)
+            order.append(index)
+        return write
+
+    try:
+        for index in range(30):
+            writer.submit("page.md", task(index))
+        writer.flush()
+    finally:
+        writer.close()
+
+    assert order == list(range(30))
@@ -0,0 +1,126 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.tests.test_parse_cache.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Tests the parse cache shared by the checkouts: its keys, its damaged entries and its eviction.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import os
+from pathlib import Path
+
+from src.manifest import hash_file
+from src.modelization import FileDesc, serialize
+from src.parse_cache import ParseCache
+from src.pipeline import parse_headers
+
+# ---------------------------------------------------------------------------
+
+# A header with a documented function, written in each checkout
+ADD_HEADER: str = "/** @brief Adds two numbers.\n * @param a {int} {in} the first\n */\nint add(int a, int b);\n"
+
+# ---------------------------------------------------------------------------
+
+
+def checkout(root: Path, headers: dict[str, str]) -> list[str]:
+    """
+    SUMMARY
+    -------
+        This function writes the headers of a checkout of the project.
+
+    RETURNS
+    -------
+        list[str]: The path of the headers, sorted
+    """
+    for name, content in headers.items():
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_text(content, encoding="utf-8")
+
+    return sorted(str(root / name) for name in headers)
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_checkouts_share_the_entries_of_the_same_headers(tmp_path: Path) -> None:
+    cache: ParseCache = ParseCache(str(tmp_path / "cache"))
+    first: list[str] = checkout(tmp_path / "main", {"math/add.hpp": ADD_HEADER, "sub.hpp": ADD_HEADER})
+    models: list[bytes] = [serialize(file_desc) for file_desc in parse_headers(first, str(tmp_path / "main"),
+                                                                              cache=cache)]
+    assert cache.get_statistics()["stored"] == 2
+
+    # the branch changes one header, and has the content of another one at a new path
+    second: list[str] = checkout(tmp_path / "branch", {"math/add.hpp": ADD_HEADER, "sub.hpp": ADD_HEADER + "\n",
+                                                       "copy.hpp": ADD_HEADER})
+    parsed: list[FileDesc] = list(parse_headers(second, str(tmp_path / "branch"), cache=cache))
+
+    statistics: dict[str, int] = cache.get_statistics()
+    assert (statistics["hits"], statistics["misses"]) == (1, 4)
+    assert serialize(parsed[1]) == models[0]
+    assert [file_desc.get_path() for file_desc in parsed] == ["copy.hpp", "math/add.hpp", "sub.hpp"]
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_damaged_entry_is_a_miss(tmp_path: Path) -> None:
+    cache: ParseCache = ParseCache(str(tmp_path / "cache"))
+    paths: list[str] = checkout(tmp_path / "input", {"add.hpp": ADD_HEADER})
+    key: str = ParseCache.get_key("add.hpp", hash_file(paths[0]))
+
+    cache.store(key, serialize(next(parse_headers(paths, str(tmp_path / "input")))))
+    entry: Path = tmp_path / "cache" / key[:2] / key[2:]
+    entry.write_bytes(entry.read_bytes()[:10])
+
+    # the damaged entry is removed, the header is parsed again
+    assert cache.load(key) is None
+    assert not entry.exists()
+    assert next(parse_headers(paths, str(tmp_path / "input"), cache=cache)).get_path() == "add.hpp"
+    assert cache.load(key) is not None
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    data: bytes = serialize(next(parse_headers(checkout(tmp_path / "input", {"add.hpp": ADD_HEADER}),
+                                               str(tmp_path / "input"))))
+    cache: ParseCache = ParseCache(str(tmp_path / "cache"), max_size=2 * len(data))
+    keys: list[str] = [ParseCache.get_key(f"h{index}.hpp", "0" * 64) for index in range(3)]
+
+    for age, key in zip((300, 200, 100), keys):
+        cache.store(key, data)
+        entry: str = os.path.join(tmp_path / "cache", key[:2], key[2:])
+        os.utime(entry, ns=(0, os.stat(entry).st_mtime_ns - age * 10 ** 9))
+
+    # the oldest entry is used again, the next oldest one is evicted instead
+    cache.load(keys[0])
+    cache.trim()
+
+    statistics: dict[str, int] = cache.get_statistics()
+    assert (statistics["evicted"], statistics["size"]) == (1, 2 * len(data))
+    assert [os.path.exists(os.path.join(tmp_path / "cache", key[:2], key[2:])) for key in keys] == [True, False, True]
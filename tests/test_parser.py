@@ -0,0 +1,222 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.tests.test_parser.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Tests the parsing of the docblocks of a header in its model.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import re
+
+import pytest
+
+from src.lexer import lex_docblock
+from src.modelization import FileDesc, ParameterTag, TagKeys, TypedTag
+
+# The docblocks read by the lexer and by the regular expressions it replaced
+DOCBLOCKS: tuple[str, ...] = (
+    "\n * Adds two numbers,\n * and rounds the sum.\n * @param {a} {int} {in} the first\n * @param b the second\n"
+    " *        number\n * @return {int} the sum\n * @throw std::overflow_error if the sum overflows\n"
+    " * @throw {std::domain_error} if a is negative\n * @author Florian\n",
+    " @brief Copies a buffer. ",
+    "\n * @brief Reads a file.\n * @param {path} {const std::string&} {in, optional} the path\n"
+    " * @param {out} {Buffer&} {out} the content\n * @version 2.1\n * @return the number of bytes\n",
+    "\n * @class {geo::Vec}\n * A vector.\n * @param {x} the abscissa\n"
+)
+
+# The tags that name the documented symbol
+KIND_KEYS: frozenset[TagKeys] = frozenset((TagKeys.FILE, TagKeys.NAMESPACE, TagKeys.CLASS, TagKeys.ENUMERATION,
+                                           TagKeys.METHOD, TagKeys.FUNCTION))
+
+# ---------------------------------------------------------------------------
+
+
+def split_tokens(text: str, count: int, bare_first: bool) -> tuple[list[str], str]:
+    """
+    SUMMARY
+    -------
+        This function reads the first {braced} tokens of a tag like the parser did before the lexer,
+        without braces the first word is the only token if 'bare_first' is set.
+    """
+    tokens: list[str] = list()
+    position: int = 0
+
+    while len(tokens) < count and (match := re.compile(r"\s*\{([^}]*)\}").match(text, position)) is not None:
+        tokens.append(match.group(1).strip())
+        position = match.end()
+
+    if not tokens and bare_first and (match := re.compile(r"\s*(\S+)").match(text)) is not None:
+        tokens.append(match.group(1))
+        position = match.end()
+
+    return tokens, text[position:].strip()
+
+
+# ---------------------------------------------------------------------------
+
+
+def read_tags(block: str) -> tuple[list[str], list[tuple]]:
+    """
+    SUMMARY
+    -------
+        This function reads the tags of a docblock with the regular expressions used before the lexer.
+
+    RETURNS
+    -------
+        tuple[list[str], list[tuple]]: The summary lines, and the key, value, type, name and hints of the other tags
+    """
+    summary: list[str] = list()
+    tags: list[list] = list()
+    current: list | None = None
+
+    for raw_line in block.splitlines():
+        line: str = raw_line.strip().lstrip("*").strip()
+        if not line:
+            continue
+
+        match: re.Match | None = re.match(r"@(\w+)\s*(.*)", line)
+        if match is None:
+            if current is None:
+                summary.append(line)
+            else:
+                current[1] = f"{current[1]} {line}".strip()
+            continue
+
+        key: TagKeys = TagKeys(match.group(1))
+        text: str = match.group(2).strip()
+        current = None
+
+        if key in KIND_KEYS:
+            tokens, _ = split_tokens(text, 1, True)
+            tags.append([key, tokens[0] if tokens else "", None, None, None])
+        elif key == TagKeys.BRIEF:
+            summary.append(text)
+        elif key == TagKeys.PARAMETER:
+            tokens, value = split_tokens(text, 3, True)
+            name, type, hints = (tokens + [None] * 3)[:3]
+            current = [key, value, type, name, [hint for hint in re.split(r"[,\s]+", hints or "") if hint]]
+        elif key in (TagKeys.EXCEPTION, TagKeys.RETURN):
+            tokens, value = split_tokens(text, 1, key == TagKeys.EXCEPTION)
+            current = [key, value, tokens[0] if tokens else None, None, None]
+        else:
+            current = [key, text, None, None, None]
+
+        if current is not None:
+            tags.append(current)
+
+    return summary, [tuple(tag) for tag in tags]
+
+
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("block", DOCBLOCKS)
+def test_lexer_reads_the_tags_like_the_regular_expressions(block: str) -> None:
+    summary: list[str] = list()
+    tags: list[tuple] = list()
+
+    for tag in lex_docblock(block):
+        if tag.get_key() == TagKeys.BRIEF:
+            summary.extend(tag.get_value())
+            continue
+
+        tags.append((tag.get_key(), tag.get_value(), tag.get_type() if isinstance(tag, TypedTag) else None,
+                     tag.get_name() if isinstance(tag, ParameterTag) else None,
+                     list(tag.get_hints() or ()) if isinstance(tag, ParameterTag) else None))
+
+    assert (summary, tags) == read_tags(block)
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_function_after_class_is_free(parse_source) -> None:
+    file_desc: FileDesc = parse_source("/** @brief Shapes */\n"
+                                       "namespace geo {\n"
+                                       "/** @brief A vector. */\n"
+                                       "class Vec {\n"
+                                       "public:\n"
+                                       "    /** @brief Norm */\n"
+                                       "    double norm() const;\n"
+                                       "    /** @brief A component. */\n"
+                                       "    struct Part { int value; };\n"
+                                       "    /** @brief Scale */\n"
+                                       "    void scale(double factor);\n"
+                                       "};\n"
+                                       "/** @brief Adds two vectors. */\n"
+                                       "Vec add(const Vec& a, const Vec& b);\n"
+                                       "}\n"
+                                       "/** @brief Prints a vector. */\n"
+                                       "void print(const geo::Vec& vector);\n")
+
+    assert [(function.get_name(), class_container) for function, class_container, _ in file_desc.get_functions()] == [
+        ("geo::Vec::norm", "geo::Vec"), ("geo::Vec::scale", "geo::Vec"), ("geo::add", None), ("print", None)]
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_file_summary_after_file_name(parse_source) -> None:
+    file_desc: FileDesc = parse_source("/**\n"
+                                       " * @file header.hpp\n"
+                                       " * Shapes of the\n"
+                                       " * geometry module.\n"
+                                       " * @author Florian\n"
+                                       " */\n")
+
+    assert file_desc.get_summary() == ["Shapes of the", "geometry module."]
+    assert file_desc.get_author() == "Florian"
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_name_tag_ends_at_its_line() -> None:
+    tags = lex_docblock("\n * @class\n * A vector.\n")
+
+    assert [(tag.get_key(), tag.get_value()) for tag in tags] == [(TagKeys.CLASS, ""), (TagKeys.BRIEF, ["A vector."])]
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_operator_names(parse_source) -> None:
+    file_desc: FileDesc = parse_source("/** @brief A vector. */\n"
+                                       "class Vec {\n"
+                                       "public:\n"
+                                       "    /** @brief Division */\n"
+                                       "    Vec operator/(double factor) const;\n"
+                                       "    /** @brief Component */\n"
+                                       "    double operator()(int index) const;\n"
+                                       "    /** @brief Order */\n"
+                                       "    bool operator<(const Vec& other) const;\n"
+                                       "};\n")
+
+    assert [(function.get_name(), page) for function, _, page in file_desc.get_functions()] == [
+        ("Vec::operator/", "header.hpp.Vec.operator_div"),
+        ("Vec::operator()", "header.hpp.Vec.operator_call"),
+        ("Vec::operator<", "header.hpp.Vec.operator_lt")]
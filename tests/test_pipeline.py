@@ -0,0 +1,397 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.tests.test_pipeline.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Tests the incremental runs of the documentation pipeline.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import os
+import re
+from pathlib import Path
+from time import perf_counter
+
+from src import IOManager
+from src.manifest import BuildManifest, MANIFEST_NAME
+from src.memory_profiler import MemoryProfiler
+from src.metrics import RunMetrics
+from src.modelization import serialize
+from src.parse_cache import ParseCache
+from src.pipeline import DocumentationPipeline, parse_headers
+
+# A header with a class and an enumeration, their pages have no file prefix
+GEOMETRY_HEADER: str = """/**
+ * @file
+ * @brief Vectors
+ */
+/** @namespace geo
+ * @brief Geometry */
+namespace geo {
+/**
+ * @brief A vector.
+ */
+class Vec {
+public:
+    /** @brief Norm */
+    double norm() const;
+};
+/** @brief Colors */
+enum class Color { RED, BLUE };
+}
+"""
+
+# ---------------------------------------------------------------------------
+
+
+def create_pipeline(input_root: Path, output_root: Path,
+                    writers: int = 0) -> tuple[IOManager, DocumentationPipeline]:
+    """
+    SUMMARY
+    -------
+        This function creates a pipeline like the program does, with the manifest of the previous run.
+        By default, the pages are written synchronously. The IOManager must be closed by the caller.
+
+    RETURNS
+    -------
+        tuple[IOManager, DocumentationPipeline]: The I/O manager and the pipeline that uses it
+    """
+    io_manager: IOManager = IOManager(str(input_root), str(output_root), writers=writers)
+    manifest: BuildManifest = BuildManifest(str(input_root), str(output_root))
+
+    return io_manager, DocumentationPipeline(io_manager, manifest, str(input_root))
+
+
+# ---------------------------------------------------------------------------
+
+
+def run_pipeline(input_root: Path, output_root: Path, writers: int = 0) -> dict[str, dict[str, int]]:
+    """
+    SUMMARY
+    -------
+        This function runs a pipeline (see 'create_pipeline') and closes its IOManager.
+
+    RETURNS
+    -------
+        dict[str, dict[str, int]]: The write statistics of the run (see IOManager.get_write_statistics)
+    """
+    io_manager, pipeline = create_pipeline(input_root, output_root, writers)
+    try:
+        pipeline.run()
+    finally:
+        io_manager.close()
+
+    return io_manager.get_write_statistics()
+
+
+# ---------------------------------------------------------------------------
+
+
+def list_pages(output_root: Path) -> set[str]:
+    """
+    SUMMARY
+    -------
+        This function returns the path of the markdown pages of an output directory, relative to it.
+    """
+    return {os.path.relpath(os.path.join(directory, name), output_root).replace(os.sep, "/")
+            for directory, _, names in os.walk(output_root) for name in names if name.endswith(".md")}
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_renamed_header_keeps_its_pages(input_root, output_root, write_header) -> None:
+    write_header("a.hpp", GEOMETRY_HEADER)
+
+    run_pipeline(input_root, output_root)
+    assert {"classes/geo.Vec.md", "enumerations/geo.Color.md"} <= list_pages(output_root)
+
+    os.rename(input_root / "a.hpp", input_root / "b.hpp")
+    statistics: dict[str, dict[str, int]] = run_pipeline(input_root, output_root)
+
+    pages: set[str] = list_pages(output_root)
+    assert {"classes/geo.Vec.md", "enumerations/geo.Color.md"} <= pages
+    assert not any(page.startswith("files/a.hpp") for page in pages)
+    assert statistics["deleted"].get("classes", 0) == 0 and statistics["deleted"].get("enumerations", 0) == 0
+
+    # the next run has nothing to do
+    statistics = run_pipeline(input_root, output_root)
+    assert sum(statistics["written"].values()) == 0
+    assert list_pages(output_root) == pages
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_duplicated_class_page_has_one_owner(input_root, output_root, write_header) -> None:
+    class_page: str = os.path.join(output_root, "classes", "geo.Vec.md")
+
+    for name in ("b.hpp", "a.hpp", "c.hpp"):
+        write_header(name, GEOMETRY_HEADER.replace("A vector.", f"A vector of {name}."))
+
+    run_pipeline(input_root, output_root, writers=4)
+    with open(class_page) as file:
+        assert "A vector of a.hpp." in file.read()
+    assert not any(name.endswith(".tmp") for _, _, names in os.walk(output_root) for name in names)
+
+    # the next owner writes the page when the first one is removed
+    os.remove(input_root / "a.hpp")
+    statistics: dict[str, dict[str, int]] = run_pipeline(input_root, output_root, writers=4)
+    assert statistics["deleted"].get("classes", 0) == 0
+    with open(class_page) as file:
+        assert "A vector of b.hpp." in file.read()
+
+    statistics = run_pipeline(input_root, output_root)
+    assert sum(statistics["written"].values()) == 0
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_method_links_its_class(input_root, output_root, write_header) -> None:
+    write_header("a.hpp", GEOMETRY_HEADER)
+
+    run_pipeline(input_root, output_root)
+
+    # the qualified name of the class is the text of the link, its page name is only in the target
+    page: str = (output_root / "functions" / "a.hpp.geo.Vec.norm.md").read_text(encoding="utf-8")
+    assert "Class: [geo::Vec](../classes/geo.Vec.md)\n" in page
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_links_between_categories_reach_their_pages(input_root, output_root, write_header) -> None:
+    write_header("geo/shapes.hpp", "/** @namespace geo\n * @brief Geometry */\n"
+                                   "namespace geo {\n"
+                                   "/** @brief Colors */\n"
+                                   "enum class Color { RED, BLUE };\n"
+                                   "/** @brief A vector. */\n"
+                                   "class Vec {\n"
+                                   "public:\n"
+                                   "    /** @brief Paints.\n"
+                                   "     * @param {color} {geo::Color} {in} the color */\n"
+                                   "    void paint(Color color);\n"
+                                   "};\n"
+                                   "}\n")
+    write_header("draw.hpp", "/** @brief Draws.\n"
+                             " * @param {vector} {const geo::Vec&} {in} the vector\n"
+                             " * @return {geo::Color} the color */\n"
+                             "geo::Color draw(const geo::Vec& vector);\n")
+
+    run_pipeline(input_root, output_root)
+
+    links: dict[str, set[str]] = {page: set(re.findall(r"\]\(([^)]+\.md)\)",
+                                                      (output_root / page).read_text(encoding="utf-8")))
+                                  for page in list_pages(output_root)}
+
+    # the types of another header link the pages of their category
+    assert {"../classes/geo.Vec.md", "../enumerations/geo.Color.md", "../files/draw.hpp.md"} \
+        <= links["functions/draw.hpp.draw.md"]
+    assert {"../classes/geo.Vec.md", "../enumerations/geo.Color.md"} <= links["namespaces/geo.md"]
+    assert "../enumerations/geo.Color.md" in links["functions/geo.shapes.hpp.geo.Vec.paint.md"]
+
+    for page, targets in links.items():
+        for target in targets:
+            assert (output_root / page).parent.joinpath(target).resolve().is_file(), f"{page} links {target}"
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_operator_pages(input_root, output_root, write_header) -> None:
+    write_header("math.hpp", "/** @brief A vector. */\n"
+                             "class Vec {\n"
+                             "public:\n"
+                             "    /** @brief Division */\n"
+                             "    Vec operator/(double factor) const;\n"
+                             "    /** @brief Component */\n"
+                             "    double operator()(int index) const;\n"
+                             "    /** @brief Order */\n"
+                             "    bool operator<(const Vec& other) const;\n"
+                             "};\n")
+
+    run_pipeline(input_root, output_root)
+
+    assert {"functions/math.hpp.Vec.operator_div.md", "functions/math.hpp.Vec.operator_call.md",
+            "functions/math.hpp.Vec.operator_lt.md"} <= list_pages(output_root)
+
+    # the file page links the pages with their encoded names
+    file_page: str = (output_root / "files" / "math.hpp.md").read_text(encoding="utf-8")
+    assert "(../functions/math.hpp.Vec.operator_div.md)" in file_page
+    assert "(../functions/math.hpp.Vec.operator_call.md)" in file_page
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_worker_processes_parse_like_the_main_process(tmp_path, input_root, write_header) -> None:
+    for index in range(5):
+        write_header(f"h{index}.hpp", GEOMETRY_HEADER.replace("geo", f"geo{index}"))
+    paths: list[str] = sorted(str(path) for path in input_root.iterdir())
+
+    serial: list[bytes] = [serialize(file_desc) for file_desc in parse_headers(paths, str(input_root))]
+
+    # the parsed headers come back from the workers, then from the cache they were stored in
+    cache: ParseCache = ParseCache(str(tmp_path / "cache"))
+    for _ in range(2):
+        parallel = parse_headers(paths, str(input_root), jobs=2, max_in_flight=2, cache=cache)
+        assert [serialize(file_desc) for file_desc in parallel] == serial
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_stage_durations_add_up_to_the_run(input_root, output_root, write_header) -> None:
+    for index in range(3):
+        write_header(f"h{index}.hpp", GEOMETRY_HEADER.replace("geo", f"geo{index}"))
+
+    io_manager, pipeline = create_pipeline(input_root, output_root)
+    stages: list[str] = list()
+    try:
+        start: float = perf_counter()
+        pipeline.run(stages.append)
+        elapsed: float = perf_counter() - start
+    finally:
+        io_manager.close()
+
+    durations: dict[str, float] = pipeline.get_stage_durations()
+    assert stages == ["discovery", "parsing", "rendering"]
+    assert set(durations) == set(stages) and all(seconds >= 0.0 for seconds in durations.values())
+    assert sum(durations.values()) <= elapsed
+
+    # the peak memory of the workers is only exported when a pool parsed headers
+    run_metrics: RunMetrics = RunMetrics()
+    run_metrics.set_durations(durations)
+    text: str = run_metrics.render(pipeline.get_run_statistics(), io_manager.get_write_statistics(), None, True)
+    assert 'cppdocgen_stage_duration_seconds{stage="parsing"}' in text
+    assert 'process="workers"' not in text
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_memory_snapshot_ends_the_discovery_first(input_root, output_root, write_header) -> None:
+    write_header("a.hpp", GEOMETRY_HEADER)
+
+    io_manager, pipeline = create_pipeline(input_root, output_root)
+    memory_profiler: MemoryProfiler = MemoryProfiler()
+    try:
+        pipeline.run(memory_profiler.snapshot)
+    finally:
+        memory_profiler.stop()
+        io_manager.close()
+
+    # no header is parsed when the discovery snapshot is taken
+    stages: list[dict] = memory_profiler.get_report()["stages"]
+    assert [stage["stage"] for stage in stages] == ["discovery", "parsing", "rendering"]
+    assert stages[0]["objects"]["FileDesc"] == 0 and stages[1]["objects"]["FileDesc"] > 0
+    assert all(stage["covers"] for stage in stages)
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_run_without_changes_writes_nothing(input_root, output_root, write_header) -> None:
+    write_header("a.hpp", GEOMETRY_HEADER)
+
+    run_pipeline(input_root, output_root)
+    manifest_time: int = os.stat(output_root / MANIFEST_NAME).st_mtime_ns
+
+    # neither the namespace pages nor the manifest are written again
+    statistics: dict[str, dict[str, int]] = run_pipeline(input_root, output_root)
+    assert sum(statistics["written"].values()) == 0 and sum(statistics["skipped"].values()) == 0
+    assert os.stat(output_root / MANIFEST_NAME).st_mtime_ns == manifest_time
+
+    # a changed header renders the namespaces it declares again
+    write_header("a.hpp", GEOMETRY_HEADER.replace("@brief Geometry", "@brief Shapes"))
+    run_pipeline(input_root, output_root)
+    assert "> Shapes\n" in (output_root / "namespaces" / "geo.md").read_text(encoding="utf-8")
+    assert os.stat(output_root / MANIFEST_NAME).st_mtime_ns != manifest_time
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_header_removed_while_selected_is_removed(input_root, output_root, write_header) -> None:
+    for name in ("a.hpp", "b.hpp"):
+        write_header(name, GEOMETRY_HEADER.replace("geo", name[0]))
+    run_pipeline(input_root, output_root)
+
+    # the header is listed, then removed before its stat
+    manifest: BuildManifest = BuildManifest(str(input_root), str(output_root))
+    files: list[str] = [str(input_root / "a.hpp"), str(input_root / "b.hpp")]
+    os.remove(input_root / "b.hpp")
+
+    assert list(manifest.select_changed(files)) == []
+    assert manifest.get_removed() == ["b.hpp"]
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_parameter_mismatches_of_the_parsed_headers(input_root, output_root, write_header) -> None:
+    write_header("a.hpp", "/** @brief Adds\n * @param a The first\n * @param c Not declared\n */\n"
+                          "int add(int a, int b);\n"
+                          "/** @brief Not documented at all */\n"
+                          "int sub(int a, int b);\n")
+
+    io_manager, pipeline = create_pipeline(input_root, output_root)
+    try:
+        pipeline.run()
+        assert pipeline.get_parameter_mismatches() == {"a.hpp": ["add (no @param for b, @param c not declared)"]}
+
+        os.remove(input_root / "a.hpp")
+        pipeline.update([], [str(input_root / "a.hpp")])
+        assert pipeline.get_parameter_mismatches() == {}
+    finally:
+        io_manager.close()
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_parsing_stays_within_max_in_flight(input_root, write_header) -> None:
+    paths: list[str] = [str(write_header(f"h{index:02}.hpp", f"/** @brief Function {index} */\nint f{index}();\n"))
+                        for index in range(40)]
+
+    for jobs, max_in_flight, bound in ((1, 8, 1), (2, 8, 8 + 4)):
+        pulled: list[str] = list()
+        ahead: list[int] = list()
+
+        def discover():
+            for path in paths:
+                pulled.append(path)
+                yield path
+
+        # with 2 jobs, the batches have 4 headers (8 // 2): at most the 8 headers submitted to the pool are ahead,
+        # plus the batch read before the oldest one is yielded
+        for index, file_desc in enumerate(parse_headers(discover(), str(input_root), jobs, max_in_flight)):
+            assert file_desc.get_path() == f"h{index:02}.hpp"
+            ahead.append(len(pulled) - index)
+
+        assert len(ahead) == 40 and max(ahead) <= bound
+        assert ahead[0] < 40
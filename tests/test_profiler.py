@@ -0,0 +1,123 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.tests.test_profiler.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Tests the profile of a run: its stages, its counters and its slowest headers.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import time
+from pathlib import Path
+from typing import Callable, Iterator
+
+from src import IOManager
+from src.manifest import BuildManifest
+from src.pipeline import DocumentationPipeline, parse_headers
+from src.profiler import FILE_STAGES, Profiler, STAGES, set_profiler
+
+# ---------------------------------------------------------------------------
+
+
+def profile(action: Callable[[], object]) -> dict:
+    """
+    SUMMARY
+    -------
+        This function runs an action with a profiler installed, like the program does with --profile.
+
+    RETURNS
+    -------
+        dict: The profile report of the action
+    """
+    profiler: Profiler = Profiler()
+    set_profiler(profiler)
+    try:
+        action()
+    finally:
+        set_profiler(None)
+
+    return profiler.get_report()
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_profile_of_a_run_has_each_stage_and_header(input_root: Path, output_root: Path,
+                                                     write_header: Callable[[str, str], Path]) -> None:
+    sizes: int = sum(write_header(f"part{index}.hpp", f"/** @brief Part {index} */\nint part{index}();\n"
+                                  * (index + 1)).stat().st_size for index in range(3))
+
+    def run() -> None:
+        io_manager: IOManager = IOManager(str(input_root), str(output_root), writers=0)
+        try:
+            DocumentationPipeline(io_manager, BuildManifest(str(input_root), str(output_root)),
+                                  str(input_root)).run()
+        finally:
+            io_manager.close()
+
+    report: dict = profile(run)
+    assert list(report["stages"])[:len(STAGES)] == list(STAGES)
+    assert all(report["stages"][stage]["calls"] > 0 for stage in ("discover", "read", "lex", "render", "write"))
+    assert (report["bytes_read"], report["counters"]["headers_parsed"]) == (sizes, 3)
+    assert report["bytes_written"] > 0
+
+    assert sorted(header["path"] for header in report["slowest_files"]) == ["part0.hpp", "part1.hpp", "part2.hpp"]
+    for header in report["slowest_files"]:
+        assert header["seconds"] >= sum(header[stage] for stage in FILE_STAGES) - 1e-9
+    assert [header["seconds"] for header in report["slowest_files"]] == sorted(
+        (header["seconds"] for header in report["slowest_files"]), reverse=True)
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_measures_of_the_workers_are_counted_once(input_root: Path,
+                                                   write_header: Callable[[str, str], Path]) -> None:
+    paths: list[str] = [str(write_header(f"part{index}.hpp", f"/** @brief Part {index} */\nint part{index}();\n"))
+                        for index in range(4)]
+
+    report: dict = profile(lambda: list(parse_headers(paths, str(input_root), jobs=2)))
+    assert report["counters"]["headers_parsed"] == report["stages"]["lex"]["calls"] == 4
+    assert len(report["slowest_files"]) == 4
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_lazy_stage_excludes_the_time_of_its_consumer() -> None:
+    profiler: Profiler = Profiler()
+
+    def produce() -> Iterator[str]:
+        for chunk in ("a", "b"):
+            time.sleep(0.02)
+            yield chunk
+
+    for _ in profiler.time_content(produce(), "render", "header.hpp"):
+        time.sleep(0.1)
+
+    stage: dict = profiler.get_report()["stages"]["render"]
+    assert stage["calls"] == 1
+    assert 0.04 <= stage["seconds"] < 0.15
@@ -0,0 +1,71 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.tests.test_rendering.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Tests the rendering of the documentation pages of the parsed headers.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+from src.modelization import FileDesc
+from src.rendering import render_file, get_type_mentions
+from src.symbol_table import SymbolTable
+
+# ---------------------------------------------------------------------------
+
+
+def render_pages(file_desc: FileDesc) -> dict[str, str]:
+    """
+    SUMMARY
+    -------
+        This function renders all the pages of a parsed header.
+
+    RETURNS
+    -------
+        dict[str, str]: The markdown content of each page by page name
+    """
+    symbols: SymbolTable = SymbolTable()
+    return {page: "".join(chunks) for _, page, chunks in render_file(file_desc, symbols)}
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_untyped_return_and_exception(parse_source) -> None:
+    file_desc: FileDesc = parse_source("/**\n"
+                                       " * @brief Adds two numbers.\n"
+                                       " * @return the sum\n"
+                                       " * @throw\n"
+                                       " */\n"
+                                       "int add(int a, int b);\n", "math.hpp")
+    pages: dict[str, str] = render_pages(file_desc)
+
+    function_page: str = next(content for content in pages.values() if content.startswith("# add"))
+    assert "|  | the sum |\n" in function_page
+    assert "|  |  |\n" in function_page
+
+    # the cells without type are empty, only the descriptions mention names
+    assert sorted(get_type_mentions(file_desc)) == ["sum", "the"]
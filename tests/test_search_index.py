@@ -0,0 +1,114 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.tests.test_search_index.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Tests the content of the search index file and the prefix search of its clients.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import json
+
+from src.modelization import FileDesc
+from src.rendering import NamespaceIndex
+from src.search_index import Document, SearchIndex, search
+
+# ---------------------------------------------------------------------------
+
+# A header with a class, a method and an enumeration in a namespace
+SHAPES_HEADER: str = """/** @file
+ * @brief Shapes */
+/** @namespace geo
+ * @brief Geometry */
+namespace geo {
+/** @brief A vector of coordinates. */
+class Vec {
+public:
+    /** @brief Returns the stored value. */
+    double getValue() const;
+};
+/** @brief Colors of a shape */
+enum class Color { RED, BLUE };
+}
+"""
+
+# ---------------------------------------------------------------------------
+
+
+def get_documents(file_desc: FileDesc) -> list[Document]:
+    """
+    SUMMARY
+    -------
+        This function returns the search documents of a header, like the pipeline does.
+    """
+    _, symbols = NamespaceIndex.get_entries(file_desc)
+    return [(*symbol, summary) for symbol, summary in zip(symbols, SearchIndex.get_summaries(file_desc))]
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_index_finds_the_symbols_by_prefix(parse_source) -> None:
+    documents: list[Document] = get_documents(parse_source(SHAPES_HEADER, "shapes.hpp"))
+    index: dict = json.loads("".join(SearchIndex(documents).render()))
+
+    # the documents are sorted by name, the tokens are sorted for the binary search of the clients
+    names: list[str] = [document[1] for document in index["documents"]]
+    assert names == ["geo", "geo::Color", "geo::Vec", "geo::Vec::getValue", "shapes.hpp"]
+    assert index["tokens"] == sorted(index["tokens"])
+    assert all(postings == sorted(postings) for postings in index["postings"])
+    assert index["categories"][index["documents"][3][0]] == "functions"
+    assert index["documents"][3][3] == "Returns the stored value."
+
+    # a symbol is found by a prefix of each word of its name or summary, the common words are ignored
+    assert [document[1] for document in search(index, "getv")] == ["geo::Vec::getValue"]
+    assert [document[1] for document in search(index, "value")] == ["geo::Vec::getValue"]
+    assert [document[1] for document in search(index, "shape col")] == ["geo::Color"]
+    assert search(index, "vec")[0][1] == "geo::Vec"
+    assert search(index, "the") == []
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_document_of_several_headers_is_kept_until_all_are_removed(parse_source) -> None:
+    documents: list[Document] = get_documents(parse_source(SHAPES_HEADER, "shapes.hpp"))
+    search_index: SearchIndex = SearchIndex(documents, written=True)
+    assert not search_index.is_changed()
+
+    # another header declares the class too
+    class_document: Document = next(document for document in documents if document[1] == "geo::Vec")
+    search_index.add_documents([class_document])
+    search_index.remove_documents(documents)
+    assert search_index.is_changed()
+
+    index: dict = json.loads("".join(search_index.render()))
+    assert [document[1] for document in index["documents"]] == ["geo::Vec"]
+    assert not search_index.is_changed()
+
+    search_index.remove_documents([class_document])
+    index = json.loads("".join(search_index.render()))
+    assert index["documents"] == [] and index["tokens"] == [] and index["postings"] == []
@@ -0,0 +1,170 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.tests.test_serialization.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Tests the serialization of the model of a header and back (parse cache).
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import pytest
+
+from src.modelization.file_desc import FileDesc
+from src.modelization.serialization import serialize, deserialize
+from src.modelization.string_pool import StringPool
+from src.parse_cache import ParseCache
+from src.pipeline import parse_headers
+from src.rendering import render_file
+from src.symbol_table import SymbolTable
+
+# ---------------------------------------------------------------------------
+
+# A header with every part of the model: file tags, namespace, class, method, enumeration, free function and tags
+MODEL_HEADER: str = """/**
+ * @file
+ * @brief Shapes of the
+ * geometry module.
+ * @author Florian
+ * @version 1.2
+ */
+/** @namespace geo
+ * @brief Geometry */
+namespace geo {
+/**
+ * @brief A vector.
+ */
+class Vec {
+public:
+    /**
+     * @brief Scales the vector.
+     * @param factor {double} {in} the scale factor
+     * @return {Vec&} the vector itself
+     */
+    Vec& scale(double factor);
+};
+/** @brief Colors */
+enum class Color { RED = 1, BLUE, GREEN = 0x4 };
+/**
+ * @brief Adds two vectors,
+ * component by component.
+ * @param a {const Vec&} {in} the first vector
+ * @param b {const Vec&} {in, optional} the second
+ * vector
+ * @throw {std::invalid_argument} if the sizes differ
+ * @return {Vec} the sum
+ */
+Vec add(const Vec& a, const Vec& b);
+}
+"""
+
+# ---------------------------------------------------------------------------
+
+
+def render(file_desc: FileDesc) -> dict[str, str]:
+    """
+    SUMMARY
+    -------
+        This function renders all the pages of a header.
+
+    RETURNS
+    -------
+        dict[str, str]: The markdown content of each page by page name
+    """
+    return {page: "".join(chunks) for _, page, chunks in render_file(file_desc, SymbolTable())}
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_round_trip_keeps_the_model(parse_source) -> None:
+    file_desc: FileDesc = parse_source(MODEL_HEADER, "shapes.hpp")
+    data: bytes = serialize(file_desc)
+
+    copy: FileDesc = deserialize(data, StringPool())
+    assert copy.get_path() == file_desc.get_path()
+    assert serialize(copy) == data
+    assert render(copy) == render(file_desc)
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_round_trip_without_pool(parse_source) -> None:
+    file_desc: FileDesc = parse_source(MODEL_HEADER, "shapes.hpp")
+    data: bytes = serialize(file_desc)
+
+    assert serialize(deserialize(data)) == data
+
+
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("damage", [lambda data: data[:8],
+                                    lambda data: data[:len(data) // 2],
+                                    lambda data: b"XXXX" + data[4:],
+                                    lambda data: data[:4] + bytes([data[4] + 1]) + data[5:]])
+def test_damaged_data_is_rejected(parse_source, damage) -> None:
+    data: bytes = serialize(parse_source(MODEL_HEADER, "shapes.hpp"))
+
+    with pytest.raises(ValueError):
+        deserialize(damage(data))
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_headers_of_a_run_share_the_pooled_strings(tmp_path, input_root, write_header) -> None:
+    docblock: str = "/** @brief Opens.\n * @param {path} {const std::string&} {in, optional} the path */\n"
+    paths: list[str] = [str(write_header(f"{name}.hpp", f"{docblock}void {name}(const std::string& path);\n"))
+                        for name in ("open", "close")]
+    cache: ParseCache = ParseCache(str(tmp_path / "cache"))
+
+    # the headers are parsed, then loaded from the cache
+    for file_descs in (list(parse_headers(paths, str(input_root), cache=cache)),
+                       list(parse_headers(paths, str(input_root), cache=cache))):
+        first, second = (file_desc.get_functions()[0][0].get_parameters()[0] for file_desc in file_descs)
+
+        assert first.get_type() == "const std::string&"
+        assert first.get_type() is second.get_type()
+        assert first.get_name() is second.get_name()
+        assert all(hint is other for hint, other in zip(first.get_hints(), second.get_hints(), strict=True))
+
+    assert cache.get_statistics()["hits"] == 2
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_pool_keeps_one_instance_of_each_string() -> None:
+    pool: StringPool = StringPool()
+    first: str = "".join(["in", "t"])
+    second: str = "".join(["i", "nt"])
+
+    assert first is not second
+    assert pool.intern(first) is pool.intern(second) is first
+    assert pool.intern(None) is None
+    assert pool.intern_all([second, "".join(["do", "uble"])])[0] is first
+    assert len(pool) == 2
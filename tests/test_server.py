@@ -0,0 +1,64 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.tests.test_server.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Tests the answers of the documentation server to the requests of editor integrations.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import src.server
+from src.io_manager import IOManager
+from src.manifest import BuildManifest
+from src.pipeline import DocumentationPipeline
+from src.server import DocServer
+
+# ---------------------------------------------------------------------------
+
+
+def test_unexpected_error_is_answered(input_root, output_root, write_header, monkeypatch, capsys) -> None:
+    write_header("math.hpp", "/** @brief Adds two numbers. */\nint add(int a, int b);\n")
+
+    io_manager: IOManager = IOManager(str(input_root), str(output_root), writers=0)
+    pipeline: DocumentationPipeline = DocumentationPipeline(io_manager,
+                                                            BuildManifest(str(input_root), str(output_root)),
+                                                            str(input_root))
+    pipeline.run()
+    server: DocServer = DocServer(io_manager, pipeline, str(input_root))
+
+    def fail(*_) -> None:
+        raise RuntimeError("rendering failed")
+
+    monkeypatch.setattr(src.server, "render_file", fail)
+    response: dict = server.handle_request({"command": "file", "path": "math.hpp"})
+
+    assert response == {"ok": False, "error": "Internal error: RuntimeError('rendering failed')"}
+    assert "RuntimeError: rendering failed" in capsys.readouterr().err
+
+    # the lock is released, the next requests are answered
+    monkeypatch.undo()
+    assert server.handle_request({"command": "file", "path": "math.hpp"})["ok"]
+    io_manager.close()
@@ -0,0 +1,69 @@
+# -*- coding: UTF-8 -*-
+"""
+:filename: CppDocGen.tests.test_tags.py
+:author:   Florian Lopitaux
+:version:  0.1
+:summary:  Tests the frozen tags shared by the function descriptions.
+
+-------------------------------------------------------------------------
+
+Copyright (C) 2023 Florian Lopitaux
+
+Use of this software is governed by the GNU Public License, version 3.
+
+CppDocGen is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+CppDocGen is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with CppDocGen. If not, see <http://www.gnu.org/licenses/>.
+
+This banner notice must not be removed.
+
+-------------------------------------------------------------------------
+
+"""
+
+import copy
+
+import pytest
+
+from src.modelization.function_desc import FunctionDesc
+from src.modelization.tags import TagKeys, TypedTag, ParameterTag
+
+# ---------------------------------------------------------------------------
+
+
+def test_frozen_tag_value_is_immutable() -> None:
+    param: ParameterTag = ParameterTag(TagKeys.PARAMETER, ["the first", "value"], "int", "a")
+    function: FunctionDesc = FunctionDesc("add", "int add(int a);", parameters=[param])
+
+    shared: ParameterTag = function.get_parameter("a")
+    assert shared.get_value() == ("the first", "value")
+
+    with pytest.raises(AttributeError):
+        shared.get_value().append("changed")
+    with pytest.raises(ValueError):
+        shared.set_value(["changed"])
+
+    assert function.get_parameters()[0].get_value() == ("the first", "value")
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_copy_of_frozen_tag_is_independent() -> None:
+    return_tag: TypedTag = TypedTag(TagKeys.RETURN, ["the sum"], "int")
+    function: FunctionDesc = FunctionDesc("add", "int add(int a);", return_tag=return_tag)
+
+    mutable: TypedTag = copy.copy(function.get_return_tag())
+    mutable.set_value(["of a and b"])
+
+    assert mutable.get_value() == ["the sum", "of a and b"]
+    assert function.get_return_tag().get_value() == ("the sum",)